@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+SEVE Framework - Import Time Benchmark
+Symbiotic Ethical Vision Engine
+
+Measures how long importing the framework takes in a fresh interpreter,
+for the bare package and for the entry points commonly used by CLI jobs
+and workers. Each statement runs in its own subprocess so nothing is
+cached between samples; the median of several runs is reported.
+
+Usage:
+    python scripts/benchmark_import_time.py [--repeat N] [--json] [--max-ms MS]
+
+With --max-ms the script exits with status 1 when `import seve_framework`
+is slower than the given budget, so it can guard against regressions.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+STATEMENTS = {
+    "package": "import seve_framework",
+    "config": "from seve_framework import SEVEConfig",
+    "framework": "from seve_framework import SEVEHybridFramework",
+    "vision": "import seve_framework.vision",
+}
+
+# Heavy third-party modules that should only load when actually used
+HEAVY_MODULES = ("numpy", "cv2", "PIL.Image", "httpx", "yaml", "psutil")
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed_ms = (time.perf_counter() - start) * 1000
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print(repr((elapsed_ms, loaded)))
+"""
+
+def measure(statement: str, repeat: int) -> dict:
+    """Time a statement in fresh interpreters"""
+    samples = []
+    loaded = []
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_PATH, os.environ.get("PYTHONPATH")])))
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True, env=env
+        ).stdout
+        elapsed_ms, loaded = eval(output.strip().splitlines()[-1])
+        samples.append(elapsed_ms)
+
+    return {
+        "statement": statement,
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "heavy_modules_loaded": loaded,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark seve_framework import time")
+    parser.add_argument("--repeat", type=int, default=7, help="fresh interpreters per statement")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--max-ms", type=float, help="fail if `import seve_framework` exceeds this median")
+    args = parser.parse_args()
+
+    results = {name: measure(statement, args.repeat) for name, statement in STATEMENTS.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"SEVE Framework import time (median of {args.repeat} fresh interpreters)")
+        print("=" * 60)
+        for name, result in results.items():
+            heavy = ", ".join(result["heavy_modules_loaded"]) or "none"
+            print(f"{result['statement']:<50} {result['median_ms']:8.1f} ms")
+            print(f"    heavy modules loaded: {heavy}")
+
+    if args.max_ms is not None and results["package"]["median_ms"] > args.max_ms:
+        print(f"import seve_framework took {results['package']['median_ms']:.1f} ms, budget is {args.max_ms:.1f} ms")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
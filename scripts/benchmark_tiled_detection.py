@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+SEVE Framework - Tiled Detection Benchmark
+Symbiotic Ethical Vision Engine
+
+Compares process_visual_input on one very large synthetic image with
+tiling disabled and enabled. The image is a survey-like scene: a smooth
+background with labels scattered over it, some of them placed across
+tile seams. Both runs use the same detectors at full resolution; the
+median of several runs is reported together with the number of
+detections, so seam duplicates or losses show up next to the timing.
+
+Usage:
+    python scripts/benchmark_tiled_detection.py [--width W] [--height H]
+        [--tile-size N] [--overlap N] [--workers N] [--repeat N] [--json]
+
+Tiling gains come from running tiles on several cores; on a single
+core expect the tiled run to be slower by roughly the overlap area.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC_PATH)
+
+import cv2
+import numpy as np
+
+from seve_framework.config import SEVEConfig, PrivacyLevel
+from seve_framework.vision import SEVEVisionModule
+
+def make_image(width: int, height: int, tile_size: int, seed: int = 7) -> np.ndarray:
+    """Smooth background with label-like blocks, a few of them across tile seams"""
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(60, 140, width, dtype=np.float32)
+    image = np.repeat(np.repeat(ramp[None, :, None], height, axis=0), 3, axis=2).astype(np.uint8)
+
+    labels = [(int(rng.integers(0, width - 300)), int(rng.integers(0, height - 80))) for _ in range(80)]
+    labels += [(seam - 120, int(rng.integers(0, height - 80))) for seam in range(tile_size, width, tile_size)]
+    for x, y in labels:
+        cv2.rectangle(image, (x, y), (x + 240, y + 60), (255, 255, 255), -1)
+        cv2.putText(image, "LOT 42", (x + 20, y + 45), cv2.FONT_HERSHEY_SIMPLEX, 1.4, (20, 20, 20), 3)
+    return image
+
+def measure(image: np.ndarray, config: SEVEConfig, repeat: int) -> dict:
+    """Time process_visual_input on the image"""
+    vision = SEVEVisionModule(config)
+    asyncio.run(vision.initialize())
+    samples = []
+    detections = 0
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = asyncio.run(vision.process_visual_input(image))
+            samples.append((time.perf_counter() - start) * 1000)
+            detections = len(result.detections)
+    finally:
+        vision.close()
+
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "max_ms": max(samples),
+        "detections": detections,
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark tiled against untiled detection")
+    parser.add_argument("--width", type=int, default=8000, help="image width in pixels")
+    parser.add_argument("--height", type=int, default=6000, help="image height in pixels")
+    parser.add_argument("--tile-size", type=int, default=1024, help="tile side in pixels")
+    parser.add_argument("--overlap", type=int, default=128, help="pixels shared by neighbouring tiles")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="tile detection threads")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    image = make_image(args.width, args.height, args.tile_size)
+    settings = dict(
+        privacy_level=PrivacyLevel.HIGH,
+        vision_detection_heights={"face": 0, "text": 0},
+        tile_size=args.tile_size,
+        tile_overlap=args.overlap,
+        tile_workers=args.workers,
+    )
+    results = {
+        "untiled": measure(image, SEVEConfig(**settings), args.repeat),
+        "tiled": measure(image, SEVEConfig(tiling_enabled=True, **settings), args.repeat),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(
+            f"SEVE Framework tiled detection, {args.width}x{args.height} image, "
+            f"{args.tile_size}px tiles, {args.overlap}px overlap, {args.workers} workers "
+            f"(median of {args.repeat} runs)"
+        )
+        print("=" * 60)
+        for name, result in results.items():
+            print(f"{name:<10} {result['median_ms']:10.1f} ms    {result['detections']:4d} detections")
+        print(f"speedup    {results['untiled']['median_ms'] / results['tiled']['median_ms']:10.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ import json
 import sys
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 console = Console()
 
@@ -328,6 +328,42 @@ def config_set(key, value):
     console.print(f"\n[green]✓[/green] Configuration updated: [cyan]{key}[/cyan] = [yellow]{value}[/yellow]\n")
 
 
+# ============================================================================
+# SERVE - HTTP Serving Mode
+# ============================================================================
+
+@cli.command()
+@click.option('--host', help='Interface to bind (default: api_host from config)')
+@click.option('--port', '-p', type=int, help='Port to bind (default: api_port from config)')
+@click.option('--workers', '-w', type=int, help='Worker processes sharing the port (default: api_workers)')
+@click.option('--config', '-c', 'config_dir',
+              type=click.Path(exists=True, file_okay=False),
+              help='Configuration directory')
+def serve(host, port, workers, config_dir):
+    """
+    🌐 Serve the framework over HTTP
+    
+    Exposes /process, /health and /metrics, grouping concurrent
+    requests into micro-batches.
+    """
+    from seve_framework.config import setup_config
+    from seve_framework.server import serve as run_server
+    
+    seve_config = setup_config(config_dir)
+    if host:
+        seve_config.api_host = host
+    if port:
+        seve_config.api_port = port
+    if workers:
+        seve_config.api_workers = workers
+    
+    console.print(
+        f"\n[bold cyan]🌐 Serving SEVE on[/bold cyan] {seve_config.api_host}:{seve_config.api_port} "
+        f"[dim]({seve_config.api_workers} worker(s))[/dim]\n"
+    )
+    run_server(seve_config)
+
+
 # ============================================================================
 # STATUS - System Status
 # ============================================================================
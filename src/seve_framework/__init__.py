@@ -7,15 +7,32 @@ both Universal adaptive capabilities and v3.0 specific computer vision
 functionality.
 """
 
-from .config import SEVEConfig, SEVEMode, PrivacyLevel, EthicsLevel, setup_config
-from .core import SEVEHybridFramework, SEVECoreV3, SEVEUniversalCore
-from .vision import SEVEVisionModule
-from .sense import SEVESenseModule
-from .ethics import SEVEEthicsModule
-from .link import SEVELinkModule
-
-# Import Universal components from internal package
-try:
+import importlib
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from .config import SEVEConfig, SEVEMode, PrivacyLevel, EthicsLevel, BackpressurePolicy, HybridExecutionPolicy, setup_config
+
+if TYPE_CHECKING:
+    from .core import SEVEHybridFramework, SEVECoreV3, SEVEUniversalCore
+    from .vision import SEVEVisionModule
+    from .sense import SEVESenseModule
+    from .ethics import SEVEEthicsModule
+    from .link import SEVELinkModule
+    from .executors import StageExecutor, ExecutorKind
+    from .cache import ResultCache
+    from .deadline import Deadline
+    from .coalesce import SingleFlight
+    from .admission import AdmissionController, RequestPriority
+    from .scheduler import PriorityScheduler
+    from .pool import FrameworkPool
+    from .sync import SyncSEVEFramework
+    from .graph import StageGraph
+    from .shared_frames import SharedFrameRing, FrameHandle
+    from .planes import FramePlanes
+    from .video import VideoReader
+    from .tracking import DetectionTracker
+    from .motion import MotionGate
     from .universal import (
         SEVEUniversalCore as UniversalCore,
         DomainConfig,
@@ -26,20 +43,83 @@ try:
         UniversalEthicsEngine,
         UniversalEmpathyEngine,
     )
-    UNIVERSAL_AVAILABLE = True
-except ImportError as e:
-    UNIVERSAL_AVAILABLE = False
-    UniversalCore = None
-    DomainConfig = None
-    DomainType = None
-    UniversalContext = None
-    AdaptationLevel = None
-    UniversalAdapterRegistry = None
-    UniversalEthicsEngine = None
-    UniversalEmpathyEngine = None
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.warning(f"Universal components not available: {e}")
+
+# Public names imported on first access (PEP 562), as (module, attribute).
+# The pipeline modules pull in numpy, OpenCV and httpx, which short-lived
+# processes that only need the configuration should not pay for.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "SEVEHybridFramework": (".core", "SEVEHybridFramework"),
+    "SEVECoreV3": (".core", "SEVECoreV3"),
+    "SyncSEVEFramework": (".sync", "SyncSEVEFramework"),
+    "SEVEUniversalCore": (".core", "SEVEUniversalCore"),
+    "SEVEVisionModule": (".vision", "SEVEVisionModule"),
+    "SEVESenseModule": (".sense", "SEVESenseModule"),
+    "SEVEEthicsModule": (".ethics", "SEVEEthicsModule"),
+    "SEVELinkModule": (".link", "SEVELinkModule"),
+    "StageExecutor": (".executors", "StageExecutor"),
+    "ExecutorKind": (".executors", "ExecutorKind"),
+    "ResultCache": (".cache", "ResultCache"),
+    "Deadline": (".deadline", "Deadline"),
+    "SingleFlight": (".coalesce", "SingleFlight"),
+    "AdmissionController": (".admission", "AdmissionController"),
+    "RequestPriority": (".admission", "RequestPriority"),
+    "PriorityScheduler": (".scheduler", "PriorityScheduler"),
+    "FrameworkPool": (".pool", "FrameworkPool"),
+    "StageGraph": (".graph", "StageGraph"),
+    "SharedFrameRing": (".shared_frames", "SharedFrameRing"),
+    "FrameHandle": (".shared_frames", "FrameHandle"),
+    "FramePlanes": (".planes", "FramePlanes"),
+    "VideoReader": (".video", "VideoReader"),
+    "DetectionTracker": (".tracking", "DetectionTracker"),
+    "MotionGate": (".motion", "MotionGate"),
+}
+
+# Universal components from the internal package (None when unavailable)
+_UNIVERSAL_ATTRIBUTES: Dict[str, str] = {
+    "UniversalCore": "SEVEUniversalCore",
+    "DomainConfig": "DomainConfig",
+    "DomainType": "DomainType",
+    "UniversalContext": "UniversalContext",
+    "AdaptationLevel": "AdaptationLevel",
+    "UniversalAdapterRegistry": "UniversalAdapterRegistry",
+    "UniversalEthicsEngine": "UniversalEthicsEngine",
+    "UniversalEmpathyEngine": "UniversalEmpathyEngine",
+}
+
+def _load_universal() -> bool:
+    """Import the Universal components, binding them (or None) as package attributes"""
+    if "UNIVERSAL_AVAILABLE" in globals():
+        return globals()["UNIVERSAL_AVAILABLE"]
+    
+    try:
+        universal = importlib.import_module(".universal", __name__)
+        available = True
+    except ImportError as e:
+        universal = None
+        available = False
+        logging.getLogger(__name__).warning(f"Universal components not available: {e}")
+    
+    for name, attribute in _UNIVERSAL_ATTRIBUTES.items():
+        globals()[name] = getattr(universal, attribute) if available else None
+    globals()["UNIVERSAL_AVAILABLE"] = available
+    return available
+
+def __getattr__(name: str) -> Any:
+    """Import public API names on first access"""
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        globals()[name] = value
+        return value
+    
+    if name in _UNIVERSAL_ATTRIBUTES or name == "UNIVERSAL_AVAILABLE":
+        _load_universal()
+        return globals()[name]
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 __version__ = "1.0.0"
 __author__ = "Symbeon Tech - EON Team"
@@ -50,6 +130,7 @@ __all__ = [
     # Core Framework
     "SEVEHybridFramework",
     "SEVECoreV3", 
+    "SyncSEVEFramework",
     "SEVEUniversalCore",
     
     # Modules
@@ -58,11 +139,31 @@ __all__ = [
     "SEVEEthicsModule",
     "SEVELinkModule",
     
+    # Execution
+    "StageExecutor",
+    "ExecutorKind",
+    "ResultCache",
+    "Deadline",
+    "SingleFlight",
+    "AdmissionController",
+    "RequestPriority",
+    "PriorityScheduler",
+    "FrameworkPool",
+    "StageGraph",
+    "SharedFrameRing",
+    "FrameHandle",
+    "FramePlanes",
+    "VideoReader",
+    "DetectionTracker",
+    "MotionGate",
+    
     # Configuration
     "SEVEConfig",
     "SEVEMode",
     "PrivacyLevel", 
     "EthicsLevel",
+    "BackpressurePolicy",
+    "HybridExecutionPolicy",
     "setup_config",
     
     # Universal Components (if available)
@@ -89,9 +190,10 @@ def get_version() -> str:
 
 def get_capabilities() -> dict:
     """Get framework capabilities"""
+    universal_available = _load_universal()
     capabilities = {
         "version": __version__,
-        "universal_available": UNIVERSAL_AVAILABLE,
+        "universal_available": universal_available,
         "modes": [mode.value for mode in SEVEMode],
         "privacy_levels": [level.value for level in PrivacyLevel],
         "ethics_levels": [level.value for level in EthicsLevel],
@@ -103,7 +205,7 @@ def get_capabilities() -> dict:
         ]
     }
     
-    if UNIVERSAL_AVAILABLE:
+    if universal_available:
         capabilities["universal_components"] = [
             "SEVEUniversalCore",
             "DomainConfig",
@@ -113,19 +215,20 @@ def get_capabilities() -> dict:
     
     return capabilities
 
-def create_framework(config: SEVEConfig) -> SEVEHybridFramework:
+def create_framework(config: SEVEConfig) -> "SEVEHybridFramework":
     """Create SEVE Framework instance with given configuration"""
+    from .core import SEVEHybridFramework
     return SEVEHybridFramework(config)
 
-def create_universal_framework(domain_config: DomainConfig) -> UniversalCore:
+def create_universal_framework(domain_config: "DomainConfig") -> "UniversalCore":
     """Create Universal Framework instance (if available)"""
-    if not UNIVERSAL_AVAILABLE:
+    if not _load_universal():
         raise ImportError("Universal components not available. Install seve-universal package.")
     
-    return UniversalCore(domain_config)
+    return globals()["UniversalCore"](domain_config)
 
 # Framework initialization
-def initialize_framework(config_path: str = None) -> SEVEHybridFramework:
+def initialize_framework(config_path: str = None) -> "SEVEHybridFramework":
     """Initialize SEVE Framework with configuration"""
     config = setup_config(config_path)
     return create_framework(config)
@@ -0,0 +1,311 @@
+"""
+SEVE Admission Control - Overload Protection
+Symbiotic Ethical Vision Engine
+
+This module implements the admission controller placed in front of
+SEVEHybridFramework. It bounds the number of requests processed at
+once and the number waiting for a slot, adapts both bounds from the
+latency it observes, and turns requests away early instead of letting
+queueing delay grow until every request misses its deadline.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, Any, Optional
+
+from .config import SEVEConfig
+
+logger = logging.getLogger(__name__)
+
+class RequestPriority(Enum):
+    """Priority of a request, used to decide what is shed first"""
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+    CRITICAL = "critical"
+    
+    @property
+    def rank(self) -> int:
+        """Numeric order of the priority, higher is more urgent"""
+        return _PRIORITY_RANKS[self]
+    
+    @classmethod
+    def from_context(cls, context: Optional[Dict[str, Any]]) -> 'RequestPriority':
+        """Read the priority carried by a request context (NORMAL when absent)"""
+        if not context:
+            return cls.NORMAL
+        if context.get("safety_critical"):
+            return cls.CRITICAL
+        
+        value = context.get("priority")
+        if isinstance(value, RequestPriority):
+            return value
+        try:
+            return cls(str(value).lower()) if value is not None else cls.NORMAL
+        except ValueError:
+            logger.warning(f"Unknown request priority {value!r}, treating as normal")
+            return cls.NORMAL
+
+# Share of the queue each priority may fill before it is shed
+QUEUE_SHARE = {
+    RequestPriority.LOW: 0.5,
+    RequestPriority.NORMAL: 0.8,
+    RequestPriority.HIGH: 1.0,
+    RequestPriority.CRITICAL: 1.0
+}
+
+# Order in which waiting requests are granted a slot
+_PRIORITY_ORDER = (
+    RequestPriority.CRITICAL,
+    RequestPriority.HIGH,
+    RequestPriority.NORMAL,
+    RequestPriority.LOW
+)
+
+_PRIORITY_RANKS = {priority: rank for rank, priority in enumerate(reversed(_PRIORITY_ORDER))}
+
+class AdmissionRejected(Exception):
+    """Raised when a request is turned away by admission control"""
+    
+    def __init__(self, priority: RequestPriority, reason: str):
+        super().__init__(f"{priority.value} priority request rejected: {reason}")
+        self.priority = priority
+        self.reason = reason
+
+class AdmissionController:
+    """
+    Admission Controller
+    
+    The concurrency limit follows AIMD: it grows by about one slot per
+    limit's worth of requests completing within the latency target and
+    shrinks multiplicatively (at most once per observed latency) when
+    they take longer. The queue limit follows Little's law: only as many
+    requests may wait as the current limit can drain before the latency
+    target runs out, capped by max_queue_depth.
+    
+    Waiting requests are granted slots in priority order. A full queue
+    rejects low-priority requests first; a higher-priority arrival
+    displaces the lowest-priority waiter, and CRITICAL requests may use
+    the whole of max_queue_depth.
+    
+    Rejections, queue depth and the current limits are exported to a
+    monitoring.MetricsCollector when one is attached.
+    """
+    
+    # Multiplicative decrease applied when latency exceeds the target
+    DECREASE_FACTOR = 0.9
+    
+    # Weight of the latest sample in the latency moving average
+    LATENCY_SMOOTHING = 0.2
+    
+    def __init__(
+        self,
+        max_concurrency: int = 64,
+        min_concurrency: int = 1,
+        max_queue_depth: int = 128,
+        target_latency_ms: float = 500.0,
+        metrics: Optional[Any] = None
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_queue_depth = max_queue_depth
+        self.target_latency_ms = target_latency_ms
+        self.metrics = metrics
+        
+        self.limit = float(max_concurrency)
+        self.latency_ms: Optional[float] = None
+        self.in_flight = 0
+        
+        self._waiters: Dict[RequestPriority, deque] = {priority: deque() for priority in RequestPriority}
+        self._last_decrease = 0.0
+        
+        # Admission statistics
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {priority.value: 0 for priority in RequestPriority}
+    
+    @classmethod
+    def from_config(cls, config: SEVEConfig, metrics: Optional[Any] = None) -> 'AdmissionController':
+        """
+        Create a controller from the configuration
+        
+        Without an explicit metrics collector the controller reports to
+        the global RealTimeMonitor, when the monitoring module is usable.
+        """
+        if metrics is None:
+            try:
+                from .monitoring import get_monitor
+                metrics = get_monitor().metrics_collector
+            except ImportError as e:
+                logger.debug(f"Admission metrics not reported, monitoring unavailable: {e}")
+        
+        return cls(
+            max_concurrency=config.admission_max_concurrency,
+            min_concurrency=config.admission_min_concurrency,
+            max_queue_depth=config.admission_max_queue_depth,
+            target_latency_ms=config.admission_target_latency_ms,
+            metrics=metrics
+        )
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot"""
+        return sum(len(waiters) for waiters in self._waiters.values())
+    
+    @property
+    def queue_limit(self) -> int:
+        """Number of requests allowed to wait, derived from the observed latency"""
+        if not self.latency_ms:
+            return self.max_queue_depth
+        
+        # Little's law: limit / latency requests drain per ms, and a waiter
+        # has target - latency ms left before it would miss the target
+        headroom_ms = max(self.target_latency_ms - self.latency_ms, 0.0)
+        drainable = int(self.limit * headroom_ms / self.latency_ms)
+        return min(drainable, self.max_queue_depth)
+    
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a processing slot
+        
+        Args:
+            priority: Priority of the request
+            timeout: Seconds the request may wait in the queue (None = no limit)
+        
+        Raises:
+            AdmissionRejected: When the request is shed instead of admitted
+        """
+        if self.in_flight < int(self.limit) and not self.queue_depth:
+            self._grant()
+            return
+        
+        self._make_room(priority)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        self._update_gauges()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self._abandon(priority, future)
+            self._reject(priority, "queue_timeout")
+        except asyncio.CancelledError:
+            self._abandon(priority, future)
+            raise
+    
+    def release(self, latency_ms: Optional[float] = None) -> None:
+        """
+        Return a processing slot and adapt the limits
+        
+        Args:
+            latency_ms: Time the request spent being processed, if it completed
+        """
+        self.in_flight -= 1
+        if latency_ms is not None:
+            self._observe(latency_ms)
+        self._wake_waiters()
+        self._update_gauges()
+    
+    def _make_room(self, priority: RequestPriority) -> None:
+        """Ensure a queue position for priority, shedding lower-priority waiters if needed"""
+        depth = self.queue_depth
+        hard_limit = self.max_queue_depth
+        share_limit = int(self.queue_limit * QUEUE_SHARE[priority])
+        if priority == RequestPriority.CRITICAL:
+            share_limit = hard_limit
+        
+        if depth < share_limit:
+            return
+        
+        # Displace the newest waiter of the lowest priority below this one
+        for lower in reversed(_PRIORITY_ORDER):
+            if lower == priority:
+                break
+            if self._waiters[lower]:
+                victim = self._waiters[lower].pop()
+                if not victim.done():
+                    victim.set_exception(AdmissionRejected(lower, "shed"))
+                self._count_rejection(lower)
+                return
+        
+        self._reject(priority, "queue_full")
+    
+    def _grant(self) -> None:
+        """Account for a newly admitted request"""
+        self.in_flight += 1
+        self.admitted += 1
+        self._update_gauges()
+    
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiting requests, highest priority first"""
+        for priority in _PRIORITY_ORDER:
+            waiters = self._waiters[priority]
+            while waiters and self.in_flight < int(self.limit):
+                future = waiters.popleft()
+                if future.done():
+                    continue
+                self._grant()
+                future.set_result(None)
+    
+    def _abandon(self, priority: RequestPriority, future: asyncio.Future) -> None:
+        """Withdraw a waiter that stopped waiting, returning its slot if one was granted"""
+        try:
+            self._waiters[priority].remove(future)
+        except ValueError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self.release()
+        self._update_gauges()
+    
+    def _observe(self, latency_ms: float) -> None:
+        """Adapt the concurrency limit to one completed request (AIMD)"""
+        if self.latency_ms is None:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += self.LATENCY_SMOOTHING * (latency_ms - self.latency_ms)
+        
+        if latency_ms <= self.target_latency_ms:
+            self.limit = min(self.limit + 1.0 / self.limit, float(self.max_concurrency))
+            return
+        
+        # Back off at most once per round trip so one slow burst doesn't collapse the limit
+        now = time.monotonic()
+        if now - self._last_decrease >= self.latency_ms / 1000:
+            self.limit = max(self.limit * self.DECREASE_FACTOR, float(self.min_concurrency))
+            self._last_decrease = now
+            logger.debug(f"Admission limit lowered to {self.limit:.1f} (latency {latency_ms:.1f}ms)")
+    
+    def _reject(self, priority: RequestPriority, reason: str) -> None:
+        """Turn a request away"""
+        self._count_rejection(priority)
+        raise AdmissionRejected(priority, reason)
+    
+    def _count_rejection(self, priority: RequestPriority) -> None:
+        """Record a rejection and forward it to the metrics collector"""
+        self.rejected[priority.value] += 1
+        if self.metrics is not None:
+            self.metrics.increment_counter("admission_rejected", tags={"priority": priority.value})
+            total = sum(self.rejected.values())
+            self.metrics.set_gauge("admission_rejection_rate", total / (total + self.admitted))
+        self._update_gauges()
+    
+    def _update_gauges(self) -> None:
+        """Forward queue depth and limits to the metrics collector"""
+        if self.metrics is not None:
+            self.metrics.set_gauge("admission_queue_depth", self.queue_depth)
+            self.metrics.set_gauge("admission_in_flight", self.in_flight)
+            self.metrics.set_gauge("admission_concurrency_limit", self.limit)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics"""
+        return {
+            "concurrency_limit": self.limit,
+            "queue_limit": self.queue_limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "latency_ms": self.latency_ms,
+            "target_latency_ms": self.target_latency_ms,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected)
+        }
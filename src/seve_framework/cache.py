@@ -0,0 +1,211 @@
+"""
+SEVE Result Cache - Content-Addressed Result Reuse
+Symbiotic Ethical Vision Engine
+
+This module implements the optional result cache placed in front of
+the v3.0 pipeline. Inputs are fingerprinted by content, so resent
+sensor payloads and byte-identical camera frames reuse the previous
+ProcessingResult instead of running every stage again.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+
+from .config import SEVEConfig
+
+logger = logging.getLogger(__name__)
+
+# Context fields that change on every request without affecting the result
+VOLATILE_CONTEXT_KEYS = frozenset({"timestamp", "request_id", "trace_id", "deadline"})
+
+class ResultCache:
+    """
+    Result Cache
+    
+    Bounded LRU cache with per-entry TTL. Entries are tagged with a
+    generation token describing the configuration, ethical rules and
+    privacy settings they were computed under; a different token
+    clears the cache.
+    
+    Hit, miss, eviction and invalidation counts are exported to a
+    monitoring.MetricsCollector when one is attached.
+    """
+    
+    IGNORED_CONTEXT_KEYS = VOLATILE_CONTEXT_KEYS
+    
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60.0, metrics: Optional[Any] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.metrics = metrics
+        
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._generation: Optional[str] = None
+        
+        # Cache statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    @classmethod
+    def from_config(cls, config: SEVEConfig, metrics: Optional[Any] = None) -> 'ResultCache':
+        """Create a cache sized from the configuration"""
+        return cls(
+            max_entries=config.result_cache_size,
+            ttl_seconds=config.result_cache_ttl_seconds,
+            metrics=metrics
+        )
+    
+    def fingerprint(self, input_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Compute the cache key for an input and its context
+        
+        Args:
+            input_data: Input dictionary as passed to process_context
+            context: Request context; volatile fields are ignored
+        
+        Returns:
+            Hex digest identifying the input content
+        """
+        return input_fingerprint(input_data, context, self.IGNORED_CONTEXT_KEYS)
+    
+    def set_generation(self, generation: str) -> None:
+        """Clear the cache when the settings that shaped its results change"""
+        if generation == self._generation:
+            return
+        
+        if self._generation is not None and self._entries:
+            self.invalidations += 1
+            self._increment("cache_invalidations")
+            logger.info(f"Result cache invalidated, dropping {len(self._entries)} entries")
+            self._entries.clear()
+            self._update_size()
+        self._generation = generation
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result, or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            self.evictions += 1
+            self._increment("cache_evictions")
+            self._update_size()
+            entry = None
+        
+        if entry is None:
+            self.misses += 1
+            self._increment("cache_misses")
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self._increment("cache_hits")
+        return entry[1]
+    
+    def put(self, key: str, result: Any) -> None:
+        """Store a result, evicting the least recently used entries beyond capacity"""
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            self._increment("cache_evictions")
+        self._update_size()
+    
+    def clear(self) -> None:
+        """Drop every cached result"""
+        self._entries.clear()
+        self._update_size()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+    
+    def _increment(self, name: str) -> None:
+        """Forward a counter increment to the metrics collector"""
+        if self.metrics is not None:
+            self.metrics.increment_counter(name)
+    
+    def _update_size(self) -> None:
+        """Forward the current cache size to the metrics collector"""
+        if self.metrics is not None:
+            self.metrics.set_gauge("cache_size", len(self._entries))
+
+def input_fingerprint(
+    input_data: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    ignored_context_keys: FrozenSet[str] = VOLATILE_CONTEXT_KEYS,
+    *extra: Any
+) -> str:
+    """
+    Fingerprint an input and its context by content
+    
+    Args:
+        input_data: Input dictionary as passed to process_context
+        context: Request context
+        ignored_context_keys: Context fields left out of the fingerprint
+        *extra: Additional values that distinguish otherwise equal requests
+    
+    Returns:
+        Hex digest identifying the request content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_digest(digest, input_data)
+    _update_digest(digest, {
+        key: value for key, value in (context or {}).items()
+        if key not in ignored_context_keys
+    })
+    for value in extra:
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+def _update_digest(digest: Any, value: Any) -> None:
+    """Feed a value into a digest, type-tagged so different shapes never collide"""
+    if isinstance(value, dict):
+        digest.update(b"d%d" % len(value))
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"l%d" % len(value))
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        digest.update(b"b%d" % len(value))
+        digest.update(value)
+    elif isinstance(value, (str, int, float, bool)) or value is None:
+        encoded = repr(value).encode()
+        digest.update(b"s%d" % len(encoded))
+        digest.update(encoded)
+    elif hasattr(value, "tobytes"):
+        # numpy arrays and PIL images: hash the raw pixels along with their layout
+        layout = repr((
+            type(value).__name__,
+            getattr(value, "shape", None) or getattr(value, "size", None),
+            str(getattr(value, "dtype", None) or getattr(value, "mode", None))
+        )).encode()
+        digest.update(b"a%d" % len(layout))
+        digest.update(layout)
+        digest.update(value.tobytes())
+    else:
+        # Unknown objects fall back to repr; identity-based reprs simply never hit
+        encoded = repr(value).encode()
+        digest.update(b"o%d" % len(encoded))
+        digest.update(encoded)
@@ -0,0 +1,72 @@
+"""
+SEVE Request Coalescing - Single-Flight Execution
+Symbiotic Ethical Vision Engine
+
+This module implements request coalescing for the framework entry
+points. Concurrent calls for the same input share one in-flight
+computation instead of each running the full pipeline.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """
+    Single-Flight Group
+    
+    The first call for a key starts the computation; calls arriving
+    with the same key while it is running wait for it and receive the
+    same result (or exception). The computation runs as its own task,
+    so a caller giving up does not cancel it for the others.
+    """
+    
+    def __init__(self, metrics: Optional[Any] = None):
+        self.metrics = metrics
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        
+        # Coalescing statistics
+        self.calls = 0
+        self.coalesced = 0
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func for key, or join the computation already running for it
+        
+        Args:
+            key: Fingerprint identifying equivalent requests
+            func: Zero-argument coroutine function doing the work
+        
+        Returns:
+            The shared result of the computation
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _, key=key: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+            if self.metrics is not None:
+                self.metrics.increment_counter("coalesced_requests")
+            logger.debug(f"Coalesced request onto in-flight computation {key}")
+        
+        return await asyncio.shield(task)
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of computations currently running"""
+        return len(self._in_flight)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": self.coalesced / self.calls if self.calls else 0.0,
+            "in_flight": len(self._in_flight)
+        }
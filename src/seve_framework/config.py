@@ -7,7 +7,6 @@ supporting both Universal and v3.0 specific modes.
 """
 
 import os
-import yaml
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
@@ -15,6 +14,11 @@ from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+from .lazy import lazy_import
+
+# Only needed to read and write YAML files
+yaml = lazy_import("yaml")
+
 logger = logging.getLogger(__name__)
 
 class SEVEMode(Enum):
@@ -37,6 +41,24 @@ class EthicsLevel(Enum):
     STRICT = "strict"               # Strict ethical validation
     MAXIMUM = "maximum"             # Maximum ethical validation
 
+class BackpressurePolicy(Enum):
+    """Behaviour of streaming queues when a downstream stage falls behind"""
+    BLOCK = "block"                  # Wait for space, slowing the producer
+    DROP_OLDEST = "drop_oldest"      # Discard the oldest queued frame
+    DROP_NEWEST = "drop_newest"      # Discard the incoming frame
+
+class HybridExecutionPolicy(Enum):
+    """
+    How the hybrid framework combines the Universal and v3.0 cores
+    
+    The concurrent policies run v3.0 without side effects
+    (SEVECoreV3.evaluate): nothing is transmitted or audited.
+    """
+    FALLBACK = "fallback"            # Universal first, v3.0 only if it fails
+    FIRST_SUCCESS = "first_success"  # Run both, first successful result wins
+    MERGED = "merged"                # Run both, combine their results
+    SHADOW = "shadow"                # Universal answers, v3.0 runs off the critical path
+
 @dataclass
 class SEVEConfig:
     """Main configuration class for SEVE Framework"""
@@ -63,11 +85,81 @@ class SEVEConfig:
     batch_size: int = 32
     gpu_enabled: bool = True
     memory_limit_mb: int = 4096
+    lazy_initialization: bool = False
+    stage_budgets_ms: Dict[str, float] = field(default_factory=dict)
+    stage_executors: Dict[str, str] = field(default_factory=dict)
+    
+    # Result Cache Settings
+    result_cache_enabled: bool = False
+    result_cache_size: int = 1024
+    result_cache_ttl_seconds: float = 60.0
+    
+    # Request Coalescing Settings
+    request_coalescing_enabled: bool = False
+    
+    # Admission Control Settings
+    admission_control_enabled: bool = False
+    admission_max_concurrency: int = 64
+    admission_min_concurrency: int = 1
+    admission_max_queue_depth: int = 128
+    admission_target_latency_ms: float = 500.0
+    
+    # Scheduling Settings
+    scheduling_enabled: bool = False
+    scheduler_max_concurrency: int = 16
+    scheduler_aging_ms: float = 1000.0
+    tenant_weights: Dict[str, float] = field(default_factory=dict)
+    link_max_concurrency: int = 8
+    
+    # Hybrid Execution Settings
+    hybrid_execution_policy: HybridExecutionPolicy = HybridExecutionPolicy.FALLBACK
+    
+    # Warm-up Settings
+    warmup_on_start: bool = True
+    warmup_max_rounds: int = 5
+    warmup_settle_tolerance: float = 0.1
+    
+    # Vision Detection Settings
+    vision_detection_heights: Dict[str, int] = field(
+        default_factory=lambda: {"face": 720, "text": 720}
+    )
+    vision_adaptive_resolution: bool = False
+    vision_probe_height: int = 360
+    
+    # Video Ingestion Settings
+    video_frame_stride: int = 1
+    video_sample_interval_s: float = 0.0
+    video_dedup_threshold: float = 2.0
+    video_queue_size: int = 8
+    
+    # Tracking Settings
+    tracking_enabled: bool = False
+    tracking_detection_interval: int = 10
+    tracking_scene_change_threshold: float = 12.0
+    tracking_iou_threshold: float = 0.3
+    
+    # Motion Gating Settings
+    motion_gating_enabled: bool = False
+    motion_threshold: int = 25
+    motion_roi_padding: int = 32
+    motion_max_area_fraction: float = 0.5
+    
+    # Tiling Settings
+    tiling_enabled: bool = False
+    tile_size: int = 1024
+    tile_overlap: int = 128
+    tile_workers: int = 4
+    tile_nms_threshold: float = 0.5
+    
+    # Streaming Settings
+    stream_queue_size: int = 8
+    stream_backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK
     
     # API Settings
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_workers: int = 1
+    api_batch_wait_ms: float = 2.0
     cors_enabled: bool = True
     
     # Database Settings
@@ -93,6 +185,109 @@ class SEVEConfig:
         if self.batch_size < 1:
             raise ValueError("batch_size must be at least 1")
         
+        for stage, kind in self.stage_executors.items():
+            if kind not in ("inline", "thread", "process"):
+                raise ValueError(f"stage_executors[{stage!r}] must be one of inline, thread, process")
+        
+        for stage, budget in self.stage_budgets_ms.items():
+            if budget <= 0:
+                raise ValueError(f"stage_budgets_ms[{stage!r}] must be positive")
+        
+        if self.result_cache_size < 1:
+            raise ValueError("result_cache_size must be at least 1")
+        
+        if self.result_cache_ttl_seconds <= 0:
+            raise ValueError("result_cache_ttl_seconds must be positive")
+        
+        if self.admission_min_concurrency < 1:
+            raise ValueError("admission_min_concurrency must be at least 1")
+        
+        if self.admission_max_concurrency < self.admission_min_concurrency:
+            raise ValueError("admission_max_concurrency must be at least admission_min_concurrency")
+        
+        if self.admission_max_queue_depth < 0:
+            raise ValueError("admission_max_queue_depth must be non-negative")
+        
+        if self.admission_target_latency_ms <= 0:
+            raise ValueError("admission_target_latency_ms must be positive")
+        
+        if self.scheduler_max_concurrency < 1:
+            raise ValueError("scheduler_max_concurrency must be at least 1")
+        
+        if self.scheduler_aging_ms <= 0:
+            raise ValueError("scheduler_aging_ms must be positive")
+        
+        for tenant, weight in self.tenant_weights.items():
+            if weight <= 0:
+                raise ValueError(f"tenant_weights[{tenant!r}] must be positive")
+        
+        if self.link_max_concurrency < 1:
+            raise ValueError("link_max_concurrency must be at least 1")
+        
+        if self.warmup_max_rounds < 1:
+            raise ValueError("warmup_max_rounds must be at least 1")
+        
+        if self.warmup_settle_tolerance <= 0:
+            raise ValueError("warmup_settle_tolerance must be positive")
+        
+        for detector, height in self.vision_detection_heights.items():
+            if height < 0:
+                raise ValueError(f"vision_detection_heights[{detector!r}] must be non-negative")
+        
+        if self.vision_probe_height < 1:
+            raise ValueError("vision_probe_height must be at least 1")
+        
+        if self.video_frame_stride < 1:
+            raise ValueError("video_frame_stride must be at least 1")
+        
+        if self.video_sample_interval_s < 0:
+            raise ValueError("video_sample_interval_s must be non-negative")
+        
+        if self.video_dedup_threshold < 0:
+            raise ValueError("video_dedup_threshold must be non-negative")
+        
+        if self.video_queue_size < 1:
+            raise ValueError("video_queue_size must be at least 1")
+        
+        if self.tracking_detection_interval < 1:
+            raise ValueError("tracking_detection_interval must be at least 1")
+        
+        if self.tracking_scene_change_threshold < 0:
+            raise ValueError("tracking_scene_change_threshold must be non-negative")
+        
+        if not 0 < self.tracking_iou_threshold <= 1:
+            raise ValueError("tracking_iou_threshold must be in (0, 1]")
+        
+        if not 0 <= self.motion_threshold <= 255:
+            raise ValueError("motion_threshold must be between 0 and 255")
+        
+        if self.motion_roi_padding < 0:
+            raise ValueError("motion_roi_padding must be non-negative")
+        
+        if not 0 < self.motion_max_area_fraction <= 1:
+            raise ValueError("motion_max_area_fraction must be in (0, 1]")
+        
+        if self.tile_size < 1:
+            raise ValueError("tile_size must be at least 1")
+        
+        if not 0 <= self.tile_overlap < self.tile_size:
+            raise ValueError("tile_overlap must be non-negative and smaller than tile_size")
+        
+        if self.tile_workers < 1:
+            raise ValueError("tile_workers must be at least 1")
+        
+        if not 0 < self.tile_nms_threshold <= 1:
+            raise ValueError("tile_nms_threshold must be in (0, 1]")
+        
+        if self.stream_queue_size < 1:
+            raise ValueError("stream_queue_size must be at least 1")
+        
+        if self.api_workers < 1:
+            raise ValueError("api_workers must be at least 1")
+        
+        if self.api_batch_wait_ms < 0:
+            raise ValueError("api_batch_wait_ms must be non-negative")
+        
         if self.api_port < 1 or self.api_port > 65535:
             raise ValueError("api_port must be between 1 and 65535")
         
@@ -117,9 +312,53 @@ class SEVEConfig:
             "batch_size": self.batch_size,
             "gpu_enabled": self.gpu_enabled,
             "memory_limit_mb": self.memory_limit_mb,
+            "lazy_initialization": self.lazy_initialization,
+            "stage_budgets_ms": self.stage_budgets_ms,
+            "stage_executors": self.stage_executors,
+            "result_cache_enabled": self.result_cache_enabled,
+            "result_cache_size": self.result_cache_size,
+            "result_cache_ttl_seconds": self.result_cache_ttl_seconds,
+            "request_coalescing_enabled": self.request_coalescing_enabled,
+            "admission_control_enabled": self.admission_control_enabled,
+            "admission_max_concurrency": self.admission_max_concurrency,
+            "admission_min_concurrency": self.admission_min_concurrency,
+            "admission_max_queue_depth": self.admission_max_queue_depth,
+            "admission_target_latency_ms": self.admission_target_latency_ms,
+            "scheduling_enabled": self.scheduling_enabled,
+            "scheduler_max_concurrency": self.scheduler_max_concurrency,
+            "scheduler_aging_ms": self.scheduler_aging_ms,
+            "tenant_weights": self.tenant_weights,
+            "link_max_concurrency": self.link_max_concurrency,
+            "hybrid_execution_policy": self.hybrid_execution_policy.value,
+            "warmup_on_start": self.warmup_on_start,
+            "warmup_max_rounds": self.warmup_max_rounds,
+            "warmup_settle_tolerance": self.warmup_settle_tolerance,
+            "vision_detection_heights": self.vision_detection_heights,
+            "vision_adaptive_resolution": self.vision_adaptive_resolution,
+            "vision_probe_height": self.vision_probe_height,
+            "video_frame_stride": self.video_frame_stride,
+            "video_sample_interval_s": self.video_sample_interval_s,
+            "video_dedup_threshold": self.video_dedup_threshold,
+            "video_queue_size": self.video_queue_size,
+            "tracking_enabled": self.tracking_enabled,
+            "tracking_detection_interval": self.tracking_detection_interval,
+            "tracking_scene_change_threshold": self.tracking_scene_change_threshold,
+            "tracking_iou_threshold": self.tracking_iou_threshold,
+            "motion_gating_enabled": self.motion_gating_enabled,
+            "motion_threshold": self.motion_threshold,
+            "motion_roi_padding": self.motion_roi_padding,
+            "motion_max_area_fraction": self.motion_max_area_fraction,
+            "tiling_enabled": self.tiling_enabled,
+            "tile_size": self.tile_size,
+            "tile_overlap": self.tile_overlap,
+            "tile_workers": self.tile_workers,
+            "tile_nms_threshold": self.tile_nms_threshold,
+            "stream_queue_size": self.stream_queue_size,
+            "stream_backpressure": self.stream_backpressure.value,
             "api_host": self.api_host,
             "api_port": self.api_port,
             "api_workers": self.api_workers,
+            "api_batch_wait_ms": self.api_batch_wait_ms,
             "cors_enabled": self.cors_enabled,
             "database_url": self.database_url,
             "redis_url": self.redis_url,
@@ -141,6 +380,11 @@ class SEVEConfig:
         if "ethics_level" in config_dict:
             config_dict["ethics_level"] = EthicsLevel(config_dict["ethics_level"])
         
+        if "stream_backpressure" in config_dict:
+            config_dict["stream_backpressure"] = BackpressurePolicy(config_dict["stream_backpressure"])
+        if "hybrid_execution_policy" in config_dict:
+            config_dict["hybrid_execution_policy"] = HybridExecutionPolicy(config_dict["hybrid_execution_policy"])
+        
         return cls(**config_dict)
 
 class ConfigManager:
@@ -256,6 +500,7 @@ class ConfigManager:
             'SEVE_ETHICS_LEVEL': ('ethics_level', str),
             'SEVE_API_HOST': ('api_host', str),
             'SEVE_API_PORT': ('api_port', int),
+            'SEVE_API_WORKERS': ('api_workers', int),
             'SEVE_MAX_WORKERS': ('max_workers', int),
             'SEVE_BATCH_SIZE': ('batch_size', int),
             'SEVE_GPU_ENABLED': ('gpu_enabled', bool),
@@ -8,17 +8,27 @@ computer vision features.
 """
 
 import asyncio
+import copy
 import logging
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, field
+from typing import Awaitable, AsyncIterable, Callable, AsyncIterator, Dict, List, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
 from enum import Enum
+import hashlib
 import time
 
-from .config import SEVEConfig, SEVEMode, PrivacyLevel, EthicsLevel
+from .config import SEVEConfig, SEVEMode, PrivacyLevel, EthicsLevel, HybridExecutionPolicy
 from .vision import SEVEVisionModule
 from .sense import SEVESenseModule
-from .ethics import SEVEEthicsModule
+from .ethics import SEVEEthicsModule, EthicalAssessment, ValidationResult
 from .link import SEVELinkModule
+from .executors import StageExecutor
+from .cache import ResultCache, VOLATILE_CONTEXT_KEYS, input_fingerprint
+from .coalesce import SingleFlight
+from .admission import AdmissionController, AdmissionRejected, RequestPriority
+from .scheduler import PriorityScheduler, current_priority, infer_priority, request_tenant
+from .deadline import Deadline
+from .graph import StageGraph
+from .lazy import lazy_import
 
 # Import Universal components from integrated package
 try:
@@ -43,6 +53,8 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+np = lazy_import("numpy")
+
 class ProcessingStatus(Enum):
     """Status of processing operations"""
     PENDING = "pending"
@@ -50,6 +62,8 @@ class ProcessingStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     ETHICS_BLOCKED = "ethics_blocked"
+    PARTIAL = "partial"
+    REJECTED = "rejected"
 
 @dataclass
 class ProcessingResult:
@@ -61,6 +75,22 @@ class ProcessingResult:
     ethics_assessments: List[Dict[str, Any]] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
 
+# Stage latency changes below this are timer noise, not warm-up effects
+WARMUP_NOISE_FLOOR_MS = 5.0
+
+def _latency_settled(previous: Dict[str, float], current: Dict[str, float], tolerance: float) -> bool:
+    """Check whether every stage's latency changed by less than tolerance between two rounds"""
+    return all(
+        abs(current[stage] - previous[stage]) <= max(tolerance * previous[stage], WARMUP_NOISE_FLOOR_MS)
+        for stage in current if stage in previous
+    )
+
+def _is_compliant(assessment: Union[Dict[str, Any], EthicalAssessment]) -> bool:
+    """Check a single ethics assessment, accepting GuardFlow objects or plain dicts"""
+    if isinstance(assessment, dict):
+        return assessment.get("is_compliant", True)
+    return assessment.result != ValidationResult.BLOCKED
+
 class SEVECoreV3:
     """
     SEVE Core v3.0 - Specific Computer Vision Implementation
@@ -69,26 +99,73 @@ class SEVECoreV3:
     for computer vision, ethics, and connectivity.
     """
     
-    def __init__(self, config: SEVEConfig):
+    MODULE_NAMES = ("vision", "sense", "ethics", "link")
+    BUILTIN_STAGES = ("vision", "sense", "fuse", "ethics", "link")
+    
+    # Synthetic camera frame used by warmup()
+    WARMUP_FRAME_SHAPE = (480, 640, 3)
+    
+    def __init__(self, config: SEVEConfig, metrics_collector: Optional[Any] = None):
         self.config = config
         self.vision_module = SEVEVisionModule(config)
         self.sense_module = SEVESenseModule(config)
         self.ethics_module = SEVEEthicsModule(config)
         self.link_module = SEVELinkModule(config)
         
+        # CPU-bound vision and fusion work runs on the stage executor
+        self.executor = StageExecutor(config)
+        self.vision_module.executor = self.executor
+        self.sense_module.executor = self.executor
+        
+        # Optional content-addressed cache in front of process_context
+        self.result_cache: Optional[ResultCache] = None
+        if config.result_cache_enabled:
+            self.result_cache = ResultCache.from_config(config, metrics_collector)
+        self._generation: Optional[str] = None
+        self._generation_settings: Optional[Tuple[Any, ...]] = None
+        
+        # Optional priority scheduler in front of the pipeline
+        self.scheduler: Optional[PriorityScheduler] = None
+        if config.scheduling_enabled:
+            self.scheduler = PriorityScheduler.from_config(config)
+        
+        # Per-request stages, run in dependency order with independent stages overlapping
+        self.stage_graph = self._build_stage_graph()
+        
         # Processing state
         self.is_initialized = False
+        self.is_ready = False
+        self.warmup_report: Optional[Dict[str, Any]] = None
         self.processing_count = 0
         
+        # Streaming statistics: pipelines still running, totals of finished ones
+        self._active_streams: set = set()
+        self._stream_totals = {"streams": 0, "frames_received": 0, "frames_emitted": 0, "frames_dropped": 0}
+        
+        # Guards each module's initializer against concurrent first use;
+        # created on first use, since before Python 3.10 a lock binds to
+        # the event loop current when it is created, not the running one
+        self._module_locks: Dict[str, asyncio.Lock] = {}
+        
         logger.info(f"SEVE Core v3.0 initialized with mode: {config.mode.value}")
     
     async def initialize(self) -> None:
-        """Initialize all modules"""
+        """
+        Initialize all modules
+        
+        The module initializers are independent and run concurrently.
+        With config.lazy_initialization each module is instead
+        initialized the first time a request reaches its stage.
+        """
         try:
-            await self.vision_module.initialize()
-            await self.sense_module.initialize()
-            await self.ethics_module.initialize()
-            await self.link_module.initialize()
+            if self.config.lazy_initialization:
+                self.is_initialized = True
+                logger.info("SEVE Core v3.0 ready, modules will initialize on first use")
+                return
+            
+            await asyncio.gather(*(
+                self._ensure_module_initialized(name) for name in self.MODULE_NAMES
+            ))
             
             self.is_initialized = True
             logger.info("SEVE Core v3.0 fully initialized")
@@ -96,6 +173,93 @@ class SEVECoreV3:
             logger.error(f"Error initializing SEVE Core v3.0: {e}")
             raise
     
+    async def warmup(self, max_rounds: Optional[int] = None, tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Exercise every stage with synthetic input before serving traffic
+        
+        Initializes all modules (also under lazy_initialization), starts
+        the stage executor workers and runs a synthetic camera frame and
+        sensor payload through the vision, sense and ethics stages, so
+        first-touch costs in OpenCV, NumPy and the pools are paid here
+        rather than by the first requests. Rounds repeat until every
+        stage's latency changes by less than the tolerance from the
+        previous round. Nothing is transmitted: the link stage is only
+        initialized, and the synthetic rounds are kept out of the ethics
+        audit trail.
+        
+        Args:
+            max_rounds: Most rounds to run (defaults to config.warmup_max_rounds)
+            tolerance: Relative latency change considered settled
+                (defaults to config.warmup_settle_tolerance)
+        
+        Returns:
+            Warm-up report: rounds run, stage timings per round and
+            whether latency settled; also kept as self.warmup_report
+        """
+        max_rounds = max_rounds or self.config.warmup_max_rounds
+        tolerance = tolerance or self.config.warmup_settle_tolerance
+        start_time = time.time()
+        
+        await asyncio.gather(*(
+            self._ensure_module_initialized(name) for name in self.MODULE_NAMES
+        ))
+        self.is_initialized = True
+        await self.executor.prestart()
+        
+        rounds: List[Dict[str, float]] = []
+        settled = False
+        while len(rounds) < max_rounds and not settled:
+            rounds.append(await self._warmup_round())
+            settled = len(rounds) > 1 and _latency_settled(rounds[-2], rounds[-1], tolerance)
+        
+        self.warmup_report = {
+            "rounds": len(rounds),
+            "settled": settled,
+            "stage_timings_ms": rounds,
+            "duration_ms": (time.time() - start_time) * 1000
+        }
+        self.is_ready = True
+        logger.info(
+            f"SEVE Core v3.0 warmed up in {len(rounds)} round(s)"
+            f"{'' if settled else ', latency not yet settled'}"
+        )
+        return self.warmup_report
+    
+    async def _warmup_round(self) -> Dict[str, float]:
+        """Run the synthetic input through every stage except link once"""
+        stage_timings: Dict[str, float] = {}
+        values = self._graph_values(self._warmup_input(), {}, None)
+        try:
+            values = await self.stage_graph.run(values, stage_timings, self._prepare_stage, exclude=("link",))
+        finally:
+            self._discard_audit_entries(values.get("fused_data"))
+        return stage_timings
+    
+    def _discard_audit_entries(self, decision_data: Optional[Dict[str, Any]]) -> None:
+        """Remove the ethics audit trail entries of a run that must leave no trace"""
+        if decision_data is None:
+            return
+        self.ethics_module.audit_trail = [
+            entry for entry in self.ethics_module.audit_trail
+            if entry.get("decision_data") is not decision_data
+        ]
+    
+    def _warmup_input(self) -> Dict[str, Any]:
+        """Build a synthetic frame (when NumPy is installed) and sensor payload"""
+        input_data: Dict[str, Any] = {
+            "sensor": {
+                "temperature": {"value": 21.0, "unit": "°C", "confidence": 0.95},
+                "humidity": {"value": 45.0, "unit": "%", "confidence": 0.90},
+                "motion": {"value": 0.1, "unit": "m/s²", "confidence": 0.85}
+            }
+        }
+        if np is not None:
+            # Noise rather than a blank frame, so detectors do real work
+            input_data["visual"] = np.random.default_rng(0).integers(
+                0, 256, self.WARMUP_FRAME_SHAPE, dtype=np.uint8
+            )
+        return input_data
+    
     async def process_context(
         self,
         input_data: Dict[str, Any],
@@ -104,6 +268,13 @@ class SEVECoreV3:
         """
         Process data through the v3.0 pipeline
         
+        With the result cache enabled, results are stored and returned
+        as deep copies, so callers may modify the result they receive
+        without changing the cached entry or other callers' results.
+        A cache hit is answered from the stored result alone: it adds no
+        entry to the ethics audit trail and is not transmitted again by
+        the link module.
+        
         Args:
             input_data: Dictionary containing visual and sensor data
             context: Additional context information
@@ -111,40 +282,91 @@ class SEVECoreV3:
         Returns:
             ProcessingResult with status and processed data
         """
+        if self.result_cache is None:
+            return await self._run_scheduled(input_data, context)
+        
         start_time = time.time()
+        self.result_cache.set_generation(self._cache_generation())
+        cache_key = self.result_cache.fingerprint(input_data, context)
+        cached = self._cached_result(cache_key, start_time)
+        if cached is not None:
+            return cached
+        
+        result = await self._run_scheduled(input_data, context)
+        self._store_result(cache_key, result)
+        return result
+    
+    def _cached_result(self, cache_key: str, start_time: float) -> Optional[ProcessingResult]:
+        """Get a deep copy of a cached result marked as a cache hit, or None on a miss"""
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            return None
+        hit = copy.deepcopy(cached)
+        return replace(
+            hit,
+            metadata={**hit.metadata, "cache_hit": True},
+            processing_time_ms=(time.time() - start_time) * 1000
+        )
+    
+    def _store_result(self, cache_key: str, result: ProcessingResult) -> None:
+        """Cache a deep copy of a completed or ethics-blocked result"""
+        if result.status in (ProcessingStatus.COMPLETED, ProcessingStatus.ETHICS_BLOCKED):
+            self.result_cache.put(cache_key, copy.deepcopy(result))
+    
+    async def evaluate(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> ProcessingResult:
+        """
+        Process data through the v3.0 pipeline without side effects
+        
+        As in a warm-up round nothing is transmitted (the link stage
+        does not run) and the run is kept out of the ethics audit
+        trail; it also leaves processing_count and the result cache
+        alone. The hybrid framework runs the v3.0 core this way next to
+        the Universal core, purely for comparison.
+        
+        Args:
+            input_data: Dictionary containing visual and sensor data
+            context: Additional context information
+        
+        Returns:
+            ProcessingResult with status and processed data
+        """
+        return await self._run_scheduled(input_data, context, record=False)
+    
+    async def _run_pipeline(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        record: bool = True
+    ) -> ProcessingResult:
+        """Run one input through every stage of the v3.0 pipeline, or without side effects unless record"""
+        start_time = time.time()
+        stage_timings: Dict[str, float] = {}
+        deadline = self._request_deadline(context)
+        values = self._graph_values(input_data, context, deadline)
         
         if not self.is_initialized:
             await self.initialize()
         
         try:
-            # 1. Process Visual Input
-            vision_results = {}
-            if "visual" in input_data:
-                vision_results = await self.vision_module.process_visual_input(
-                    input_data["visual"], context or {}
-                )
-            
-            # 2. Process Sensor Input
-            sense_results = {}
-            if "sensor" in input_data:
-                sense_results = await self.sense_module.process_sensor_input(
-                    input_data["sensor"], context or {}
-                )
-            
-            # 3. Fuse Data and Make Decision
-            fused_data = {
-                "visual": vision_results,
-                "sensor": sense_results,
-                "context": context or {},
-                "timestamp": time.time()
+            # Vision and sense, fusion, ethical validation (GuardFlow) and
+            # external communication, as declared in the stage graph
+            values = await self.stage_graph.run(
+                values, stage_timings, self._prepare_stage, exclude=() if record else ("link",)
+            )
+            fused_data = values.get("fused_data", {})
+            ethics_assessments = values.get("ethics_assessments", [])
+            stage_outputs = {
+                stage.output: values[stage.output] for stage in self.stage_graph.stages
+                if stage.name not in self.BUILTIN_STAGES and stage.output in values
             }
             
-            # 4. Ethical Validation (GuardFlow)
-            ethics_assessments = await self.ethics_module.validate_decision(fused_data)
-            
             # Check if decision is ethically compliant
             is_compliant = all(
-                assessment.get("is_compliant", True) 
+                _is_compliant(assessment)
                 for assessment in ethics_assessments
             )
             
@@ -153,26 +375,30 @@ class SEVECoreV3:
                 return ProcessingResult(
                     status=ProcessingStatus.ETHICS_BLOCKED,
                     data=fused_data,
+                    metadata={
+                        "stage_timings_ms": stage_timings,
+                        **({"stage_outputs": stage_outputs} if stage_outputs else {}),
+                        **self._deadline_metadata(deadline)
+                    },
                     ethics_assessments=ethics_assessments,
                     processing_time_ms=(time.time() - start_time) * 1000
                 )
             
-            # 5. External Communication
-            transmission_success = await self.link_module.transmit_output(
-                fused_data, context or {}
-            )
-            
             processing_time = (time.time() - start_time) * 1000
-            self.processing_count += 1
+            if record:
+                self.processing_count += 1
             
             return ProcessingResult(
-                status=ProcessingStatus.COMPLETED,
+                status=ProcessingStatus.PARTIAL if deadline and deadline.skipped else ProcessingStatus.COMPLETED,
                 data=fused_data,
                 metadata={
                     "processing_count": self.processing_count,
-                    "transmission_success": transmission_success,
-                    "vision_processed": bool(vision_results),
-                    "sensor_processed": bool(sense_results)
+                    "transmission_success": values.get("transmission_success", False),
+                    "vision_processed": bool(values.get("vision_results")),
+                    "sensor_processed": bool(values.get("sense_results")),
+                    "stage_timings_ms": stage_timings,
+                    **({"stage_outputs": stage_outputs} if stage_outputs else {}),
+                    **self._deadline_metadata(deadline)
                 },
                 processing_time_ms=processing_time,
                 ethics_assessments=ethics_assessments
@@ -183,16 +409,526 @@ class SEVECoreV3:
             return ProcessingResult(
                 status=ProcessingStatus.FAILED,
                 data=input_data,
+                metadata={"stage_timings_ms": stage_timings},
                 processing_time_ms=(time.time() - start_time) * 1000,
                 errors=[str(e)]
             )
+        finally:
+            if not record:
+                self._discard_audit_entries(values.get("fused_data"))
+    
+    async def process_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[ProcessingResult]:
+        """
+        Process many inputs through the v3.0 pipeline
+        
+        Inputs are grouped into chunks of config.batch_size and every
+        stage receives a whole chunk at a time, amortizing per-call
+        overhead across the chunk. When custom stages are registered on
+        self.stage_graph, the inputs of a chunk instead run through the
+        stage graph concurrently, one input each, so custom stages run
+        as they do in process_context.
+        
+        With the result cache enabled, inputs are looked up one by one
+        as in process_context; only the misses are processed, and their
+        results are cached.
+        
+        Args:
+            inputs: List of input dictionaries, as accepted by process_context
+            contexts: Optional per-input context, aligned with inputs
+        
+        Returns:
+            List of ProcessingResult, in input order
+        """
+        if contexts is None:
+            contexts = [None] * len(inputs)
+        elif len(contexts) != len(inputs):
+            raise ValueError("contexts must have the same length as inputs")
+        
+        if not self.is_initialized:
+            await self.initialize()
+        
+        if self.result_cache is None:
+            return await self._process_chunks(inputs, contexts)
+        
+        start_time = time.time()
+        self.result_cache.set_generation(self._cache_generation())
+        keys = [self.result_cache.fingerprint(input_data, context) for input_data, context in zip(inputs, contexts)]
+        results = [self._cached_result(key, start_time) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        computed = await self._process_chunks([inputs[i] for i in misses], [contexts[i] for i in misses])
+        for i, result in zip(misses, computed):
+            self._store_result(keys[i], result)
+            results[i] = result
+        return results
+    
+    async def _process_chunks(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: List[Optional[Dict[str, Any]]]
+    ) -> List[ProcessingResult]:
+        """Process inputs in config.batch_size chunks, each admitted by the scheduler"""
+        process_chunk = self._process_chunk_by_graph if self._custom_stages() else self._process_chunk
+        batch_size = self.config.batch_size
+        results: List[ProcessingResult] = []
+        for offset in range(0, len(inputs), batch_size):
+            chunk_inputs = inputs[offset:offset + batch_size]
+            chunk_contexts = [context or {} for context in contexts[offset:offset + batch_size]]
+            results.extend(await self._scheduled(
+                chunk_inputs, chunk_contexts,
+                lambda: process_chunk(chunk_inputs, chunk_contexts)
+            ))
+        
+        return results
+    
+    async def process_stream(
+        self,
+        source: AsyncIterable[Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[ProcessingResult]:
+        """
+        Process a continuous feed through the pipelined v3.0 stages
+        
+        Vision, sense, ethics and link are connected by bounded queues
+        sized by config.stream_queue_size; config.stream_backpressure
+        decides what happens when a queue fills up. When custom stages
+        are registered on self.stage_graph, each frame runs through the
+        whole stage graph as one pipeline step instead.
+        
+        Frame counts, including frames dropped by backpressure, are
+        reported under "streaming" in get_status().
+        
+        Args:
+            source: Async iterable of input dictionaries, or of
+                (input_data, context) tuples
+            context: Context shared by frames that don't carry their own
+        
+        Yields:
+            ProcessingResult for each frame, in input order
+        """
+        # Imported here because the streaming pipeline builds on this module
+        from .streaming import StreamingPipeline
+        
+        pipeline = StreamingPipeline(self)
+        self._active_streams.add(pipeline)
+        try:
+            async for result in pipeline.run(source, context):
+                yield result
+        finally:
+            self._active_streams.discard(pipeline)
+            self._stream_totals["streams"] += 1
+            for name in ("frames_received", "frames_emitted", "frames_dropped"):
+                self._stream_totals[name] += getattr(pipeline, name)
+    
+    def _stream_stats(self) -> Dict[str, Any]:
+        """Frame counts of every stream, finished or still running"""
+        stats = {"active_streams": len(self._active_streams), **self._stream_totals}
+        for pipeline in self._active_streams:
+            for name in ("frames_received", "frames_emitted", "frames_dropped"):
+                stats[name] += getattr(pipeline, name)
+        return stats
+    
+    async def _process_chunk(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]]
+    ) -> List[ProcessingResult]:
+        """Run one batch_size chunk through every stage, each item under its own deadline"""
+        start_time = time.time()
+        stage_timings: Dict[str, float] = {}
+        deadlines = [self._request_deadline(context) for context in contexts]
+        errors: List[Optional[str]] = [None] * len(inputs)
+        vision_results: List[Any] = [{} for _ in inputs]
+        sense_results: List[Any] = [{} for _ in inputs]
+        
+        # 1-2. Visual and sensor input for the whole chunk, concurrently
+        visual_indices = [i for i, item in enumerate(inputs) if "visual" in item]
+        sensor_indices = [i for i, item in enumerate(inputs) if "sensor" in item]
+        
+        if visual_indices and self.config.lazy_initialization:
+            await self._ensure_module_initialized("vision")
+        
+        stages = {}
+        if visual_indices:
+            # One batched call; a frame that fails only fails its own item
+            stages["vision"] = self.vision_module.process_visual_batch(
+                [inputs[i]["visual"] for i in visual_indices],
+                [self._stage_context(contexts[i], deadlines[i], "vision") for i in visual_indices],
+                return_exceptions=True
+            )
+        if sensor_indices:
+            stages["sense"] = self.sense_module.process_sensor_batch(
+                [inputs[i]["sensor"] for i in sensor_indices],
+                [self._stage_context(contexts[i], deadlines[i], "sense") for i in sensor_indices],
+                return_exceptions=True
+            )
+        
+        outputs = await asyncio.gather(*(
+            self._timed_stage(name, coro, stage_timings)
+            for name, coro in stages.items()
+        ), return_exceptions=True)
+        stage_outputs = dict(zip(stages, outputs))
+        
+        for name, indices, target in (
+            ("vision", visual_indices, vision_results),
+            ("sense", sensor_indices, sense_results)
+        ):
+            output = stage_outputs.get(name)
+            if isinstance(output, Exception):
+                for i in indices:
+                    errors[i] = str(output)
+                continue
+            for i, item_result in zip(indices, output or []):
+                if isinstance(item_result, Exception):
+                    errors[i] = str(item_result)
+                else:
+                    target[i] = item_result
+        
+        # 3. Fuse data for every item that made it through input processing
+        fused_batch = [
+            {
+                "visual": vision_results[i],
+                "sensor": sense_results[i],
+                "context": contexts[i],
+                "timestamp": time.time()
+            }
+            for i in range(len(inputs))
+        ]
+        valid_indices = [i for i in range(len(inputs)) if errors[i] is None]
+        
+        # 4. One GuardFlow pass over the chunk
+        batch_assessments: List[List[Any]] = [[] for _ in inputs]
+        if valid_indices:
+            try:
+                assessed = await self._timed_stage(
+                    "ethics",
+                    self.ethics_module.validate_decisions(
+                        [fused_batch[i] for i in valid_indices],
+                        [self._stage_context(contexts[i], deadlines[i], "ethics") for i in valid_indices]
+                    ),
+                    stage_timings
+                )
+                for i, assessments in zip(valid_indices, assessed):
+                    batch_assessments[i] = assessments
+            except Exception as e:
+                logger.error(f"Error validating batch: {e}")
+                for i in valid_indices:
+                    errors[i] = str(e)
+        
+        compliant_indices = [
+            i for i in valid_indices
+            if errors[i] is None and all(_is_compliant(a) for a in batch_assessments[i])
+        ]
+        
+        # 5. One bulk transmission for the approved items
+        transmission_success = False
+        if compliant_indices:
+            transmission_success = await self._timed_stage(
+                "link",
+                self.link_module.transmit_batch(
+                    [fused_batch[i] for i in compliant_indices],
+                    [contexts[i] for i in compliant_indices]
+                ),
+                stage_timings
+            )
+        
+        processing_time = (time.time() - start_time) * 1000
+        batch_metadata = {"batch_size": len(inputs), "stage_timings_ms": stage_timings}
+        
+        results = []
+        for i, input_data in enumerate(inputs):
+            if errors[i] is not None:
+                results.append(ProcessingResult(
+                    status=ProcessingStatus.FAILED,
+                    data=input_data,
+                    metadata=dict(batch_metadata),
+                    processing_time_ms=processing_time,
+                    errors=[errors[i]]
+                ))
+            elif i not in compliant_indices:
+                results.append(ProcessingResult(
+                    status=ProcessingStatus.ETHICS_BLOCKED,
+                    data=fused_batch[i],
+                    metadata={**batch_metadata, **self._deadline_metadata(deadlines[i])},
+                    ethics_assessments=batch_assessments[i],
+                    processing_time_ms=processing_time
+                ))
+            else:
+                self.processing_count += 1
+                results.append(ProcessingResult(
+                    status=ProcessingStatus.PARTIAL if deadlines[i] and deadlines[i].skipped else ProcessingStatus.COMPLETED,
+                    data=fused_batch[i],
+                    metadata={
+                        **batch_metadata,
+                        "processing_count": self.processing_count,
+                        "transmission_success": transmission_success,
+                        "vision_processed": bool(vision_results[i]),
+                        "sensor_processed": bool(sense_results[i]),
+                        **self._deadline_metadata(deadlines[i])
+                    },
+                    processing_time_ms=processing_time,
+                    ethics_assessments=batch_assessments[i]
+                ))
+        
+        logger.debug(f"Processed batch of {len(inputs)} inputs in {processing_time:.2f}ms")
+        return results
+    
+    async def _process_chunk_by_graph(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]]
+    ) -> List[ProcessingResult]:
+        """Run one chunk through the stage graph concurrently, one input each"""
+        return list(await asyncio.gather(*(
+            self._run_pipeline(input_data, context)
+            for input_data, context in zip(inputs, contexts)
+        )))
+    
+    def _custom_stages(self) -> List[str]:
+        """Names of the stages registered on self.stage_graph besides BUILTIN_STAGES"""
+        return [stage.name for stage in self.stage_graph.stages if stage.name not in self.BUILTIN_STAGES]
+    
+    def _build_stage_graph(self) -> StageGraph:
+        """
+        Declare the per-request v3.0 stages
+        
+        Vision and sense depend only on the request, so they overlap;
+        fusion waits for whichever of them runs, ethics validates the
+        fused decision and link transmits it only when it is compliant.
+        Stages look their module up on every call, so replaced module
+        methods take effect immediately.
+        
+        Custom stages are added to self.stage_graph; they can consume
+        any input_data field, "context", "deadline" or another stage's
+        output, and their outputs are returned in
+        metadata["stage_outputs"]. process_batch and process_stream fall
+        back to running the graph per input while custom stages exist.
+        """
+        graph = StageGraph()
+        graph.add_stage(
+            "vision",
+            lambda values: self.vision_module.process_visual_input(
+                values["visual"], self._stage_context(values["context"], values["deadline"], "vision")
+            ),
+            inputs=("visual", "context", "deadline"),
+            output="vision_results"
+        )
+        graph.add_stage(
+            "sense",
+            lambda values: self.sense_module.process_sensor_input(
+                values["sensor"], self._stage_context(values["context"], values["deadline"], "sense")
+            ),
+            inputs=("sensor", "context", "deadline"),
+            output="sense_results"
+        )
+        graph.add_stage(
+            "fuse",
+            lambda values: {
+                "visual": values.get("vision_results", {}),
+                "sensor": values.get("sense_results", {}),
+                "context": values["context"],
+                "timestamp": time.time()
+            },
+            inputs=("context",),
+            optional_inputs=("vision_results", "sense_results"),
+            output="fused_data",
+            timed=False
+        )
+        graph.add_stage(
+            "ethics",
+            lambda values: self.ethics_module.validate_decision(
+                values["fused_data"], self._stage_context(None, values["deadline"], "ethics")
+            ),
+            inputs=("fused_data", "deadline"),
+            output="ethics_assessments"
+        )
+        graph.add_stage(
+            "link",
+            lambda values: self.link_module.transmit_output(values["fused_data"], values["context"]),
+            inputs=("fused_data", "ethics_assessments", "context"),
+            output="transmission_success",
+            condition=lambda values: all(_is_compliant(a) for a in values["ethics_assessments"])
+        )
+        return graph
+    
+    def _graph_values(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        deadline: Optional[Deadline]
+    ) -> Dict[str, Any]:
+        """Initial stage graph values: the input fields plus the request context and deadline"""
+        return {**input_data, "context": context or {}, "deadline": deadline}
+    
+    async def _prepare_stage(self, name: str) -> None:
+        """Initialize a stage's module on first use under lazy_initialization"""
+        if self.config.lazy_initialization and name in self.MODULE_NAMES:
+            await self._ensure_module_initialized(name)
+    
+    async def _run_scheduled(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        record: bool = True
+    ) -> ProcessingResult:
+        """Run one input through the pipeline once the scheduler admits it"""
+        if self.scheduler is None:
+            return await self._run_pipeline(input_data, context, record)
+        return await self._scheduled(
+            [input_data], [context or {}], lambda: self._run_pipeline(input_data, context, record)
+        )
+    
+    async def _scheduled(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: List[Dict[str, Any]],
+        func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run work for inputs under the scheduler
+        
+        The work is scheduled at the highest priority among its inputs,
+        on behalf of that input's tenant, and the priority is published
+        to the stage executor and link module while it runs.
+        """
+        if self.scheduler is None:
+            return await func()
+        
+        priority, tenant = max(
+            ((infer_priority(input_data, context, self.sense_module), request_tenant(context))
+             for input_data, context in zip(inputs, contexts)),
+            key=lambda item: item[0].rank
+        )
+        await self.scheduler.acquire(priority, tenant)
+        token = current_priority.set(priority)
+        try:
+            return await func()
+        finally:
+            current_priority.reset(token)
+            self.scheduler.release()
+    
+    def _request_deadline(self, context: Optional[Dict[str, Any]]) -> Optional[Deadline]:
+        """
+        Get the deadline for one request
+        
+        Returns None when the context carries no deadline and no stage
+        budgets are configured, so the pipeline runs unconstrained.
+        """
+        deadline = Deadline.from_context(context)
+        if deadline is not None:
+            # A fresh instance so skipped work is reported per request
+            return Deadline(deadline.expires_at)
+        if self.config.stage_budgets_ms:
+            return Deadline(float("inf"))
+        return None
+    
+    def _stage_context(
+        self,
+        context: Optional[Dict[str, Any]],
+        deadline: Optional[Deadline],
+        stage: str
+    ) -> Optional[Dict[str, Any]]:
+        """Give a stage its own deadline, narrowed by the stage budget"""
+        if deadline is None:
+            return context
+        return {
+            **(context or {}),
+            Deadline.CONTEXT_KEY: deadline.for_stage(self.config.stage_budgets_ms.get(stage))
+        }
+    
+    def _deadline_metadata(self, deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """Report skipped work and whether the deadline was met"""
+        if deadline is None:
+            return {}
+        return {
+            "skipped": list(deadline.skipped),
+            "deadline_exceeded": deadline.expired()
+        }
+    
+    async def _timed_stage(
+        self,
+        name: str,
+        coro: Awaitable[Any],
+        stage_timings: Dict[str, float]
+    ) -> Any:
+        """Await a pipeline stage, recording its wall-clock time in milliseconds"""
+        stage_start = time.time()
+        try:
+            try:
+                await self._prepare_stage(name)
+            except Exception:
+                if asyncio.iscoroutine(coro):
+                    coro.close()
+                raise
+            return await coro
+        finally:
+            stage_timings[name] = (time.time() - stage_start) * 1000
+    
+    def _cache_generation(self) -> str:
+        """
+        Describe the settings cached results depend on: config, ethical rules and privacy
+        
+        The digest is recomputed only when these settings differ from a
+        snapshot taken at the previous computation, so most requests pay
+        for an equality check instead of serializing the config.
+        """
+        settings = (
+            self.config,
+            self.ethics_module.ethical_rules,
+            (
+                self.vision_module.privacy_level,
+                self.vision_module.anonymization_enabled,
+                self.vision_module.pseudonymization_enabled
+            )
+        )
+        if self._generation is not None and settings == self._generation_settings:
+            return self._generation
+        
+        config, rules, privacy = settings
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(sorted(config.to_dict().items())).encode())
+        digest.update(repr(rules).encode())
+        digest.update(repr(privacy).encode())
+        self._generation = digest.hexdigest()
+        self._generation_settings = copy.deepcopy(settings)
+        return self._generation
+    
+    async def _ensure_module_initialized(self, name: str) -> None:
+        """Initialize a module once, even when several requests need it at the same time"""
+        module = getattr(self, f"{name}_module")
+        if module.is_initialized:
+            return
+        
+        lock = self._module_locks.get(name)
+        if lock is None:
+            lock = self._module_locks[name] = asyncio.Lock()
+        async with lock:
+            if not module.is_initialized:
+                await module.initialize()
+    
+    async def shutdown(self) -> None:
+        """Release the stage executor and tile detection pools and close the link module's HTTP client"""
+        self.executor.shutdown()
+        self.vision_module.close()
+        await self.link_module.close()
+        logger.info("SEVE Core v3.0 shut down")
     
     def get_status(self) -> Dict[str, Any]:
         """Get current status of SEVE Core v3.0"""
         return {
             "initialized": self.is_initialized,
+            "ready": self.is_ready,
+            "warmup": self.warmup_report,
             "processing_count": self.processing_count,
             "config": self.config.to_dict(),
+            "executor": self.executor.get_status(),
+            "stage_graph": self.stage_graph.describe(),
+            "result_cache": self.result_cache.get_stats() if self.result_cache else None,
+            "scheduler": self.scheduler.get_stats() if self.scheduler else None,
+            "streaming": self._stream_stats(),
             "modules": {
                 "vision": self.vision_module.get_status(),
                 "sense": self.sense_module.get_status(),
@@ -209,10 +945,25 @@ class SEVEHybridFramework:
     computer vision functionality, allowing operation in multiple modes.
     """
     
-    def __init__(self, config: SEVEConfig):
+    def __init__(self, config: SEVEConfig, metrics_collector: Optional[Any] = None):
         self.config = config
-        self.v3_core = SEVECoreV3(config)
+        self.v3_core = SEVECoreV3(config, metrics_collector)
         self.universal_core = None
+        self.metrics_collector = metrics_collector
+        
+        # Secondary v3.0 runs started by the shadow execution policy
+        self._shadow_tasks: set = set()
+        self.shadow_stats = {"runs": 0, "failures": 0, "total_latency_ms": 0.0}
+        
+        # Concurrent identical requests share one computation
+        self.single_flight: Optional[SingleFlight] = None
+        if config.request_coalescing_enabled:
+            self.single_flight = SingleFlight(metrics_collector)
+        
+        # Bounds concurrency and queueing, shedding load under overload
+        self.admission: Optional[AdmissionController] = None
+        if config.admission_control_enabled:
+            self.admission = AdmissionController.from_config(config, metrics_collector)
         
         # Initialize Universal core if available
         if UNIVERSAL_AVAILABLE and config.mode in [SEVEMode.UNIVERSAL, SEVEMode.HYBRID]:
@@ -243,6 +994,20 @@ class SEVEHybridFramework:
             # but we can verify it's ready
             logger.info("Universal core ready")
     
+    async def warmup(self, max_rounds: Optional[int] = None, tolerance: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Warm up the v3.0 pipeline stages
+        
+        See SEVECoreV3.warmup; the Universal core has no first-use costs
+        of its own to pay.
+        """
+        return await self.v3_core.warmup(max_rounds, tolerance)
+    
+    @property
+    def ready(self) -> bool:
+        """Whether warmup() has completed and the framework can take traffic at full speed"""
+        return self.v3_core.is_ready
+    
     async def process_context(
         self,
         input_data: Dict[str, Any],
@@ -252,6 +1017,11 @@ class SEVEHybridFramework:
         """
         Process data through the appropriate pipeline
         
+        With request coalescing enabled, identical concurrent requests
+        share one computation and each caller receives its own deep copy
+        of the result. Requests carrying a deadline are never coalesced,
+        since the shared computation would not be bound by it.
+        
         Args:
             input_data: Input data dictionary
             context: Additional context
@@ -260,6 +1030,92 @@ class SEVEHybridFramework:
         Returns:
             ProcessingResult with processed data
         """
+        return await self.coalesce(
+            input_data, context,
+            lambda: self.admit(context, lambda: self._process_context(input_data, context, use_universal)),
+            use_universal
+        )
+    
+    async def coalesce(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        func: Callable[[], Awaitable[ProcessingResult]],
+        use_universal: Optional[bool] = None
+    ) -> ProcessingResult:
+        """
+        Run one request, sharing the computation with identical concurrent requests
+        
+        Without request coalescing, or when the context carries a
+        deadline, func simply runs.
+        
+        Args:
+            input_data: Input data dictionary, part of the coalescing key
+            context: Request context; volatile fields are ignored
+            func: Zero-argument coroutine function processing the request
+            use_universal: Pipeline selection, part of the coalescing key
+        
+        Returns:
+            A deep copy of the shared ProcessingResult
+        """
+        if self.single_flight is None or Deadline.from_context(context) is not None:
+            return await func()
+        
+        key = input_fingerprint(input_data, context, VOLATILE_CONTEXT_KEYS, use_universal)
+        return copy.deepcopy(await self.single_flight.do(key, func))
+    
+    async def admit(
+        self,
+        context: Optional[Dict[str, Any]],
+        func: Callable[[], Awaitable[ProcessingResult]]
+    ) -> ProcessingResult:
+        """
+        Run one request under admission control
+        
+        The request waits for a processing slot according to its
+        priority (context "priority", or "safety_critical") and at most
+        until its deadline. A request that is shed is answered at once
+        with a REJECTED result instead of being queued.
+        
+        Args:
+            context: Request context
+            func: Zero-argument coroutine function processing the request
+        
+        Returns:
+            The request's ProcessingResult, or a REJECTED result
+        """
+        if self.admission is None:
+            return await func()
+        
+        priority = RequestPriority.from_context(context)
+        deadline = Deadline.from_context(context)
+        try:
+            await self.admission.acquire(priority, deadline.timeout() if deadline else None)
+        except AdmissionRejected as e:
+            logger.warning(f"Request rejected by admission control: {e}")
+            return ProcessingResult(
+                status=ProcessingStatus.REJECTED,
+                data={},
+                metadata={"admission": {"priority": e.priority.value, "reason": e.reason}},
+                errors=[str(e)]
+            )
+        
+        start_time = time.time()
+        latency_ms = None
+        try:
+            result = await func()
+            latency_ms = (time.time() - start_time) * 1000
+            return result
+        finally:
+            self.admission.release(latency_ms)
+    
+    async def _process_context(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        use_universal: bool = None
+    ) -> ProcessingResult:
+        """Route one request to the Universal or v3.0 core"""
         # Determine which core to use
         if use_universal is None:
             use_universal = (
@@ -267,38 +1123,275 @@ class SEVEHybridFramework:
                 (self.config.mode == SEVEMode.HYBRID and self.universal_core)
             )
         
-        if use_universal and self.universal_core:
-            # Use Universal core for adaptive processing
-            try:
-                # Convert to Universal context format
-                universal_context = UniversalContext(
-                    domain=DomainType.BUSINESS,  # Default domain
-                    user_profile=context.get("user_profile", {}),
-                    environmental_data=context.get("environmental_data", {}),
-                    cultural_context=context.get("cultural_context", "global"),
-                    temporal_context=context.get("temporal_context", {}),
-                    metadata=context or {}
-                )
-                
-                # Process with Universal core
-                universal_result = await self.universal_core.process_universal_context(
-                    universal_context, input_data
-                )
-                
-                # Convert back to ProcessingResult format
-                return ProcessingResult(
-                    status=ProcessingStatus.COMPLETED,
-                    data=universal_result,
-                    metadata={"mode": "universal", "domain": "adaptive"}
-                )
-                
-            except Exception as e:
-                logger.error(f"Universal processing failed, falling back to v3.0: {e}")
-                # Fall back to v3.0 processing
-                return await self.v3_core.process_context(input_data, context)
-        else:
+        if not (use_universal and self.universal_core):
             # Use v3.0 core for specific processing
             return await self.v3_core.process_context(input_data, context)
+        
+        policy = self.config.hybrid_execution_policy
+        if policy == HybridExecutionPolicy.FIRST_SUCCESS:
+            return await self._process_first_success(input_data, context)
+        if policy == HybridExecutionPolicy.MERGED:
+            return await self._process_merged(input_data, context)
+        if policy == HybridExecutionPolicy.SHADOW:
+            return await self._process_shadowed(input_data, context)
+        
+        try:
+            return await self._process_universal(input_data, context)
+        except Exception as e:
+            logger.error(f"Universal processing failed, falling back to v3.0: {e}")
+            # Fall back to v3.0 processing
+            return await self.v3_core.process_context(input_data, context)
+    
+    async def _process_universal(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> ProcessingResult:
+        """Process one request with the Universal core, raising on failure"""
+        # Convert to Universal context format
+        universal_context = UniversalContext(
+            domain=DomainType.BUSINESS,  # Default domain
+            user_profile=context.get("user_profile", {}),
+            environmental_data=context.get("environmental_data", {}),
+            cultural_context=context.get("cultural_context", "global"),
+            temporal_context=context.get("temporal_context", {}),
+            metadata=context or {}
+        )
+        
+        # Process with Universal core
+        universal_result = await self.universal_core.process_universal_context(
+            universal_context, input_data
+        )
+        
+        # Convert back to ProcessingResult format
+        return ProcessingResult(
+            status=ProcessingStatus.COMPLETED,
+            data=universal_result,
+            metadata={"mode": "universal", "domain": "adaptive"}
+        )
+    
+    async def _process_first_success(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> ProcessingResult:
+        """
+        Run both cores concurrently and return the first successful result
+        
+        The v3.0 core runs through evaluate(), so whichever core loses
+        the race has transmitted nothing.
+        """
+        start_time = time.time()
+        tasks = {
+            asyncio.ensure_future(self._process_universal(input_data, context)): "universal",
+            asyncio.ensure_future(self.v3_core.evaluate(input_data, context)): "v3"
+        }
+        pending = set(tasks)
+        errors: List[str] = []
+        v3_result: Optional[ProcessingResult] = None
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    core = tasks[task]
+                    if task.exception() is not None:
+                        errors.append(f"{core}: {task.exception()}")
+                        continue
+                    
+                    result = task.result()
+                    if result.status == ProcessingStatus.FAILED:
+                        v3_result = result
+                        errors.extend(f"{core}: {error}" for error in result.errors)
+                        continue
+                    
+                    return replace(result, metadata={
+                        **result.metadata, "hybrid_policy": "first_success", "winner": core
+                    })
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        logger.error(f"Both cores failed under the first_success policy: {errors}")
+        if v3_result is not None:
+            return replace(v3_result, errors=errors)
+        return ProcessingResult(
+            status=ProcessingStatus.FAILED,
+            data=input_data,
+            metadata={"hybrid_policy": "first_success"},
+            processing_time_ms=(time.time() - start_time) * 1000,
+            errors=errors
+        )
+    
+    async def _process_merged(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> ProcessingResult:
+        """
+        Run both cores concurrently and combine their results
+        
+        The merged data holds each successful core's data under its
+        name ("universal", "v3"). Status and ethics assessments come
+        from the v3.0 core, so an ethics block there blocks the merged
+        result too. The v3.0 core runs through evaluate(), without
+        transmission or audit trail entries.
+        """
+        start_time = time.time()
+        universal_result, v3_result = await asyncio.gather(
+            self._process_universal(input_data, context),
+            self.v3_core.evaluate(input_data, context),
+            return_exceptions=True
+        )
+        
+        results: Dict[str, ProcessingResult] = {}
+        errors: List[str] = []
+        if isinstance(universal_result, BaseException):
+            errors.append(f"universal: {universal_result}")
+        else:
+            results["universal"] = universal_result
+        if isinstance(v3_result, BaseException):
+            errors.append(f"v3: {v3_result}")
+        elif v3_result.status == ProcessingStatus.FAILED:
+            errors.extend(f"v3: {error}" for error in v3_result.errors)
+        else:
+            results["v3"] = v3_result
+        
+        processing_time = (time.time() - start_time) * 1000
+        if not results:
+            logger.error(f"Both cores failed under the merged policy: {errors}")
+            return ProcessingResult(
+                status=ProcessingStatus.FAILED,
+                data=input_data,
+                metadata={"hybrid_policy": "merged"},
+                processing_time_ms=processing_time,
+                errors=errors
+            )
+        
+        return ProcessingResult(
+            status=results["v3"].status if "v3" in results else ProcessingStatus.COMPLETED,
+            data={core: result.data for core, result in results.items()},
+            metadata={
+                "mode": "merged",
+                "hybrid_policy": "merged",
+                "merged_cores": list(results),
+                "core_metadata": {core: result.metadata for core, result in results.items()}
+            },
+            processing_time_ms=processing_time,
+            ethics_assessments=results["v3"].ethics_assessments if "v3" in results else [],
+            errors=errors
+        )
+    
+    async def _process_shadowed(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> ProcessingResult:
+        """
+        Answer from the Universal core while the v3.0 core runs as a shadow
+        
+        The shadow run goes through evaluate(), so it transmits nothing
+        and leaves no audit trail entries, and only feeds metrics. It is
+        not awaited unless the Universal core fails, in which case its
+        (already running) result is used as the fallback.
+        """
+        start_time = time.time()
+        shadow = asyncio.ensure_future(self.v3_core.evaluate(input_data, context))
+        self._shadow_tasks.add(shadow)
+        shadow.add_done_callback(self._shadow_tasks.discard)
+        shadow.add_done_callback(lambda task: self._record_shadow_run(task, start_time))
+        
+        try:
+            return await self._process_universal(input_data, context)
+        except Exception as e:
+            logger.error(f"Universal processing failed, using the shadow v3.0 result: {e}")
+            return await asyncio.shield(shadow)
+    
+    def _record_shadow_run(self, task: asyncio.Future, start_time: float) -> None:
+        """Record the outcome and latency of a finished shadow run"""
+        latency_ms = (time.time() - start_time) * 1000
+        failed = (
+            task.cancelled() or task.exception() is not None or
+            task.result().status == ProcessingStatus.FAILED
+        )
+        
+        self.shadow_stats["runs"] += 1
+        self.shadow_stats["total_latency_ms"] += latency_ms
+        if failed:
+            self.shadow_stats["failures"] += 1
+        
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_timer("shadow_processing_time", latency_ms, tags={"core": "v3"})
+            self.metrics_collector.increment_counter("shadow_runs")
+            if failed:
+                self.metrics_collector.increment_counter("shadow_failures")
+    
+    async def process_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        use_universal: bool = None
+    ) -> List[ProcessingResult]:
+        """
+        Process many inputs through the appropriate pipeline
+        
+        The v3.0 pipeline processes inputs in config.batch_size chunks;
+        the Universal core has no batch entry point, so inputs routed
+        there are processed concurrently, one request each.
+        
+        Admission is left to the caller (SEVEServer admits each request
+        before batching it), so inputs routed to the Universal core do
+        not pass through admit() a second time.
+        
+        Args:
+            inputs: List of input data dictionaries
+            contexts: Optional per-input context, aligned with inputs
+            use_universal: Force Universal mode (None = auto-detect)
+        
+        Returns:
+            List of ProcessingResult, in input order
+        """
+        if use_universal is None:
+            use_universal = (
+                self.config.mode == SEVEMode.UNIVERSAL or
+                (self.config.mode == SEVEMode.HYBRID and self.universal_core)
+            )
+        
+        if use_universal and self.universal_core:
+            contexts = contexts or [None] * len(inputs)
+            return list(await asyncio.gather(*(
+                self._process_context(input_data, context or {}, use_universal=True)
+                for input_data, context in zip(inputs, contexts)
+            )))
+        
+        return await self.v3_core.process_batch(inputs, contexts)
+    
+    async def process_stream(
+        self,
+        source: AsyncIterable[Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[ProcessingResult]:
+        """
+        Process a continuous feed through the pipelined v3.0 stages
+        
+        Streaming always uses the staged v3.0 pipeline, since the
+        Universal core processes one context at a time.
+        
+        Args:
+            source: Async iterable of input dictionaries, or of
+                (input_data, context) tuples
+            context: Context shared by frames that don't carry their own
+        
+        Yields:
+            ProcessingResult for each frame, in input order
+        """
+        async for result in self.v3_core.process_stream(source, context):
+            yield result
+    
+    async def shutdown(self) -> None:
+        """Wait for running shadow work, then release resources held by the v3.0 core"""
+        await asyncio.gather(*self._shadow_tasks, return_exceptions=True)
+        await self.v3_core.shutdown()
     
     def switch_mode(self, new_mode: SEVEMode) -> None:
         """Switch framework operating mode"""
@@ -338,9 +1431,23 @@ class SEVEHybridFramework:
             "framework": {
                 "mode": self.config.mode.value,
                 "initialized": True,
+                "ready": self.ready,
                 "capabilities": self.get_capabilities()
             },
-            "v3_core": self.v3_core.get_status()
+            "v3_core": self.v3_core.get_status(),
+            "request_coalescing": self.single_flight.get_stats() if self.single_flight else None,
+            "admission": self.admission.get_stats() if self.admission else None,
+            "hybrid_execution": {
+                "policy": self.config.hybrid_execution_policy.value,
+                "shadow": {
+                    **self.shadow_stats,
+                    "in_flight": len(self._shadow_tasks),
+                    "average_latency_ms": (
+                        self.shadow_stats["total_latency_ms"] / self.shadow_stats["runs"]
+                        if self.shadow_stats["runs"] else 0.0
+                    )
+                }
+            }
         }
         
         if self.universal_core:
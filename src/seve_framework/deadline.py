@@ -0,0 +1,70 @@
+"""
+SEVE Deadlines - Time Budgets for Pipeline Stages
+Symbiotic Ethical Vision Engine
+
+This module implements deadline propagation for the v3.0 pipeline.
+A request carries an absolute deadline in its context; each stage
+receives a deadline narrowed by its configured budget and skips
+optional work once that time has run out.
+"""
+
+import math
+import time
+from typing import Dict, List, Any, Optional
+
+class Deadline:
+    """
+    Deadline
+    
+    Absolute point in time (as returned by time.time()) by which work
+    has to finish. Stage deadlines derived with for_stage() share the
+    request's list of skipped work, so the core can report everything
+    that was dropped to stay on time.
+    """
+    
+    # Context key holding the deadline, as epoch seconds or a Deadline
+    CONTEXT_KEY = "deadline"
+    
+    def __init__(self, expires_at: float, skipped: Optional[List[str]] = None):
+        self.expires_at = expires_at
+        self.skipped: List[str] = skipped if skipped is not None else []
+    
+    @classmethod
+    def from_context(cls, context: Optional[Dict[str, Any]]) -> Optional['Deadline']:
+        """Get the deadline carried by a context, or None when there is none"""
+        if not context:
+            return None
+        
+        value = context.get(cls.CONTEXT_KEY)
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(float(value))
+    
+    def remaining_ms(self) -> float:
+        """Milliseconds left before the deadline (negative once it has passed)"""
+        return (self.expires_at - time.time()) * 1000
+    
+    def timeout(self) -> Optional[float]:
+        """Seconds left, in the form asyncio.wait_for expects (None when unbounded)"""
+        if math.isinf(self.expires_at):
+            return None
+        return max(self.expires_at - time.time(), 0.0)
+    
+    def expired(self) -> bool:
+        """Check whether the deadline has passed"""
+        return time.time() >= self.expires_at
+    
+    def for_stage(self, budget_ms: Optional[float]) -> 'Deadline':
+        """Derive a stage deadline, capped by the stage budget starting now"""
+        expires_at = self.expires_at
+        if budget_ms is not None:
+            expires_at = min(expires_at, time.time() + budget_ms / 1000)
+        return Deadline(expires_at, self.skipped)
+    
+    def skip(self, work: str) -> None:
+        """Record optional work that was skipped or cancelled to meet the deadline"""
+        if work not in self.skipped:
+            self.skipped.append(work)
+    
+    def __repr__(self) -> str:
+        return f"Deadline(remaining_ms={self.remaining_ms():.1f}, skipped={self.skipped})"
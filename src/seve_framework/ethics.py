@@ -17,6 +17,7 @@ from enum import Enum
 from datetime import datetime
 
 from .config import SEVEConfig, EthicsLevel
+from .deadline import Deadline
 
 # Import Universal Ethics Engine if available
 try:
@@ -277,53 +278,11 @@ class SEVEEthicsModule:
         if not self.is_initialized:
             await self.initialize()
         
-        # Determine if we should use Universal Ethics Engine
-        should_use_universal = (
-            use_universal is not None and use_universal
-        ) or (
-            use_universal is None
-            and self.universal_ethics_engine is not None
-            and self.config.mode.value in ["universal", "hybrid"]
-        )
-        
         assessments = []
         
         # Use Universal Ethics Engine if available and requested
-        if should_use_universal and self.universal_ethics_engine:
-            try:
-                # Get domain from context if available
-                domain = None
-                if context:
-                    domain = context.get("domain") or context.get("domain_type")
-                
-                # Assess using Universal Ethics Engine
-                universal_result = await self.universal_ethics_engine.assess_universal_compliance(
-                    decision_data,
-                    context or {},
-                    domain=domain
-                )
-                
-                # Convert Universal assessments to GuardFlow format
-                for universal_assessment_dict in universal_result.get("assessments", []):
-                    # Map Universal assessment to GuardFlow format
-                    guardflow_assessment = EthicalAssessment(
-                        rule_name=universal_assessment_dict.get("rule_id", "universal_rule"),
-                        principle=EthicalPrinciple.PRIVACY,  # Default, will be mapped if needed
-                        result=ValidationResult.APPROVED if universal_assessment_dict.get("compliance_score", 0) > 0.8 else ValidationResult.REQUIRES_REVIEW,
-                        confidence=universal_assessment_dict.get("compliance_score", 0.5),
-                        reason=f"Universal assessment: {universal_assessment_dict.get('rule_id', 'unknown')}",
-                        suggested_mitigation=universal_result.get("recommendations", [""])[0] if universal_result.get("recommendations") else None,
-                        metadata={
-                            "source": "universal_ethics_engine",
-                            "universal_data": universal_assessment_dict
-                        }
-                    )
-                    assessments.append(guardflow_assessment)
-                
-                logger.debug(f"Universal Ethics Engine assessed: {len(assessments)} assessments")
-            except Exception as e:
-                logger.error(f"Error in Universal Ethics Engine assessment: {e}")
-                # Fall through to GuardFlow
+        if self._should_use_universal(use_universal):
+            assessments = await self._assess_universal_by_deadline(decision_data, context)
         
         # Always run GuardFlow for critical policy enforcement
         guardflow_assessments = []
@@ -345,6 +304,140 @@ class SEVEEthicsModule:
         
         return all_assessments
     
+    async def validate_decisions(
+        self,
+        decisions: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        use_universal: Optional[bool] = None
+    ) -> List[List[EthicalAssessment]]:
+        """
+        Validate a batch of decisions in a single GuardFlow pass
+        
+        Each rule is evaluated against the whole batch before moving on
+        to the next one, so rule lookup and readiness checks are paid
+        once per batch instead of once per decision.
+        
+        Args:
+            decisions: List of decision data dictionaries
+            contexts: Optional per-decision context, aligned with decisions
+            use_universal: Force use of Universal Ethics Engine (None = auto-detect)
+        
+        Returns:
+            List of assessment lists, one per decision
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        contexts = contexts or [None] * len(decisions)
+        batch_assessments: List[List[EthicalAssessment]] = [[] for _ in decisions]
+        
+        if self._should_use_universal(use_universal):
+            for assessments, decision_data, context in zip(batch_assessments, decisions, contexts):
+                assessments.extend(await self._assess_universal_by_deadline(decision_data, context))
+        
+        for rule in self.ethical_rules:
+            for assessments, decision_data, context in zip(batch_assessments, decisions, contexts):
+                try:
+                    assessments.append(await self._evaluate_rule(rule, decision_data, context))
+                except Exception as e:
+                    logger.error(f"Error evaluating rule {rule.name}: {e}")
+        
+        if self.audit_logging_enabled:
+            for assessments, decision_data, context in zip(batch_assessments, decisions, contexts):
+                await self._log_audit_trail(decision_data, assessments, context)
+        
+        return batch_assessments
+    
+    def _should_use_universal(self, use_universal: Optional[bool]) -> bool:
+        """Determine if the Universal Ethics Engine should assess a decision"""
+        if self.universal_ethics_engine is None:
+            return False
+        if use_universal is not None:
+            return use_universal
+        return self.config.mode.value in ["universal", "hybrid"]
+    
+    async def _assess_universal(
+        self,
+        decision_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[EthicalAssessment]:
+        """Assess a decision with the Universal Ethics Engine in GuardFlow format"""
+        assessments = []
+        try:
+            # Get domain from context if available
+            domain = None
+            if context:
+                domain = context.get("domain") or context.get("domain_type")
+            
+            # Assess using Universal Ethics Engine
+            universal_result = await self.universal_ethics_engine.assess_universal_compliance(
+                decision_data,
+                context or {},
+                domain=domain
+            )
+            
+            # Convert Universal assessments to GuardFlow format
+            for universal_assessment_dict in universal_result.get("assessments", []):
+                # Map Universal assessment to GuardFlow format
+                guardflow_assessment = EthicalAssessment(
+                    rule_name=universal_assessment_dict.get("rule_id", "universal_rule"),
+                    principle=EthicalPrinciple.PRIVACY,  # Default, will be mapped if needed
+                    result=ValidationResult.APPROVED if universal_assessment_dict.get("compliance_score", 0) > 0.8 else ValidationResult.REQUIRES_REVIEW,
+                    confidence=universal_assessment_dict.get("compliance_score", 0.5),
+                    reason=f"Universal assessment: {universal_assessment_dict.get('rule_id', 'unknown')}",
+                    suggested_mitigation=universal_result.get("recommendations", [""])[0] if universal_result.get("recommendations") else None,
+                    metadata={
+                        "source": "universal_ethics_engine",
+                        "universal_data": universal_assessment_dict
+                    }
+                )
+                assessments.append(guardflow_assessment)
+            
+            logger.debug(f"Universal Ethics Engine assessed: {len(assessments)} assessments")
+        except Exception as e:
+            logger.error(f"Error in Universal Ethics Engine assessment: {e}")
+            # Fall through to GuardFlow
+            return []
+        
+        return assessments
+    
+    async def _assess_universal_by_deadline(
+        self,
+        decision_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> List[EthicalAssessment]:
+        """Run the Universal assessment, within the context's deadline when it carries one"""
+        deadline = Deadline.from_context(context)
+        if deadline is None:
+            return await self._assess_universal(decision_data, context)
+        return await self._assess_universal_within(decision_data, context, deadline)
+    
+    async def _assess_universal_within(
+        self,
+        decision_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        deadline: Deadline
+    ) -> List[EthicalAssessment]:
+        """
+        Run the Universal assessment only while the deadline allows
+        
+        The Universal engine is advisory, so it is skipped or cancelled
+        when time runs out; GuardFlow rules are always evaluated.
+        """
+        if deadline.expired():
+            deadline.skip("universal_ethics")
+            return []
+        
+        try:
+            return await asyncio.wait_for(
+                self._assess_universal(decision_data, context),
+                deadline.timeout()
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Universal Ethics Engine assessment cancelled at deadline")
+            deadline.skip("universal_ethics")
+            return []
+    
     async def _evaluate_rule(
         self,
         rule: EthicalRule,
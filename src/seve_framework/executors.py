@@ -0,0 +1,163 @@
+"""
+SEVE Executors - CPU-Bound Stage Execution
+Symbiotic Ethical Vision Engine
+
+This module provides the execution layer used by the v3.0 modules to
+move CPU-bound work off the event loop. Code that releases the GIL
+(OpenCV) runs on a thread pool, pure-Python work runs on a process
+pool, and both are sized from SEVEConfig.max_workers.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Any, Optional, Callable
+from enum import Enum
+
+from .config import SEVEConfig
+from .scheduler import PriorityScheduler, current_priority
+
+logger = logging.getLogger(__name__)
+
+def _occupy_worker(seconds: float) -> None:
+    """Keep a pool worker busy briefly, so the pool starts another for the next task"""
+    time.sleep(seconds)
+
+class ExecutorKind(Enum):
+    """Where a stage's CPU-bound work runs"""
+    INLINE = "inline"      # On the event loop thread
+    THREAD = "thread"      # Thread pool, for code that releases the GIL
+    PROCESS = "process"    # Process pool, for pure-Python work
+
+class StageExecutor:
+    """
+    Stage Executor
+    
+    Dispatches stage work to a thread or process pool according to
+    SEVEConfig.stage_executors. Stages not listed there run inline,
+    and pools are created on first use, so inline stages never pay for
+    them.
+    
+    Work sent to the process pool must be picklable: module-level
+    functions, or bound methods of objects that can be pickled.
+    
+    With config.scheduling_enabled, submissions to each pool are held
+    in a priority queue once every worker is busy, so the work of the
+    most urgent request (scheduler.current_priority) runs next instead
+    of waiting behind everything submitted before it.
+    """
+    
+    def __init__(self, config: SEVEConfig):
+        self.config = config
+        self.max_workers = config.max_workers
+        self.stage_kinds: Dict[str, ExecutorKind] = {
+            stage: ExecutorKind(kind) for stage, kind in config.stage_executors.items()
+        }
+        
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Priority-ordered admission to the pools
+        self._gates: Dict[ExecutorKind, PriorityScheduler] = {}
+        if config.scheduling_enabled:
+            self._gates = {
+                kind: PriorityScheduler(self.max_workers, config.scheduler_aging_ms)
+                for kind in (ExecutorKind.THREAD, ExecutorKind.PROCESS)
+            }
+        
+        # Dispatch statistics
+        self.dispatch_counts: Dict[str, int] = {kind.value: 0 for kind in ExecutorKind}
+    
+    def kind_for(self, stage: str) -> ExecutorKind:
+        """Get the executor kind configured for a stage"""
+        return self.stage_kinds.get(stage, ExecutorKind.INLINE)
+    
+    async def run(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a stage's CPU-bound function on its configured executor
+        
+        Args:
+            stage: Stage name used to look up the executor kind
+            func: Synchronous function to run
+            *args: Positional arguments for func
+        
+        Returns:
+            The function's return value
+        """
+        kind = self.kind_for(stage)
+        self.dispatch_counts[kind.value] += 1
+        
+        if kind == ExecutorKind.INLINE:
+            return func(*args)
+        
+        loop = asyncio.get_running_loop()
+        gate = self._gates.get(kind)
+        if gate is None:
+            return await loop.run_in_executor(self._get_pool(kind), functools.partial(func, *args))
+        
+        await gate.acquire(current_priority.get())
+        try:
+            return await loop.run_in_executor(self._get_pool(kind), functools.partial(func, *args))
+        finally:
+            gate.release()
+    
+    def _get_pool(self, kind: ExecutorKind) -> Executor:
+        """Get (creating on first use) the pool for an executor kind"""
+        if kind == ExecutorKind.THREAD:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="seve-stage"
+                )
+                logger.info(f"Stage thread pool started with {self.max_workers} workers")
+            return self._thread_pool
+        
+        if self._process_pool is None:
+            # Spawned workers don't inherit the event loop or pool threads of the parent
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"Stage process pool started with {self.max_workers} workers")
+        return self._process_pool
+    
+    async def prestart(self) -> None:
+        """
+        Start every worker of the pools used by configured stages
+        
+        Pools otherwise start workers one task at a time, so the first
+        requests after startup would pay for thread and process start-up
+        (for spawned processes, re-importing the framework).
+        """
+        loop = asyncio.get_running_loop()
+        kinds = {kind for kind in self.stage_kinds.values() if kind != ExecutorKind.INLINE}
+        for kind in sorted(kinds, key=lambda kind: kind.value):
+            pool = self._get_pool(kind)
+            await asyncio.gather(*(
+                loop.run_in_executor(pool, _occupy_worker, 0.05)
+                for _ in range(self.max_workers)
+            ))
+            logger.info(f"Stage {kind.value} pool warmed with {self.max_workers} workers")
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down any pools that were started"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get current status of the executor layer"""
+        return {
+            "max_workers": self.max_workers,
+            "stage_executors": {stage: kind.value for stage, kind in self.stage_kinds.items()},
+            "thread_pool_active": self._thread_pool is not None,
+            "process_pool_active": self._process_pool is not None,
+            "dispatch_counts": dict(self.dispatch_counts),
+            "queued": {kind.value: gate.queue_depth for kind, gate in self._gates.items()}
+        }
@@ -0,0 +1,271 @@
+"""
+SEVE Stage Graph - Declarative Pipeline Stages
+Symbiotic Ethical Vision Engine
+
+This module implements the stage graph the v3.0 pipeline runs on.
+Each stage declares the named values it consumes and the value it
+produces; the graph starts a stage as soon as its inputs exist, so
+independent stages overlap without any ordering written in core code,
+and stages whose inputs can never be produced are skipped.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Awaitable, Callable, Collection, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Stage:
+    """
+    One node of a stage graph
+    
+    func receives a dict holding the stage's available inputs and
+    returns its output, directly or as an awaitable. Required inputs
+    must all exist for the stage to run; optional inputs are waited
+    for while some stage may still produce them, and left out when
+    none will. A stage whose condition returns False is skipped, as
+    are the stages depending on its output.
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    inputs: Tuple[str, ...] = ()
+    output: Optional[str] = None
+    optional_inputs: Tuple[str, ...] = ()
+    condition: Optional[Callable[[Dict[str, Any]], bool]] = None
+    timed: bool = True
+    
+    def __post_init__(self):
+        self.inputs = tuple(self.inputs)
+        self.optional_inputs = tuple(self.optional_inputs)
+        if self.output is None:
+            self.output = self.name
+
+class StageGraph:
+    """
+    Stage Graph
+    
+    A directed acyclic graph of stages connected by the names of the
+    values they consume and produce. Running the graph starts every
+    stage whose inputs are ready concurrently, records per-stage
+    timings and returns all values produced.
+    """
+    
+    def __init__(self, stages: Optional[List[Stage]] = None):
+        self._stages: Dict[str, Stage] = {}
+        for stage in stages or []:
+            self.add(stage)
+    
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        inputs: Collection[str] = (),
+        output: Optional[str] = None,
+        optional_inputs: Collection[str] = (),
+        condition: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timed: bool = True
+    ) -> Stage:
+        """
+        Declare a stage
+        
+        Args:
+            name: Unique stage name, also used for its timing
+            func: Callable taking the inputs dict and returning the output
+            inputs: Names of values the stage requires
+            output: Name of the value it produces (defaults to name)
+            optional_inputs: Names of values used when some stage produces them
+            condition: Predicate on the inputs deciding whether the stage runs
+            timed: Record the stage in the timings
+        
+        Returns:
+            The added Stage
+        """
+        return self.add(Stage(name, func, tuple(inputs), output, tuple(optional_inputs), condition, timed))
+    
+    def add(self, stage: Stage) -> Stage:
+        """Add a Stage, rejecting duplicate names or outputs and cycles"""
+        if stage.name in self._stages:
+            raise ValueError(f"Stage {stage.name!r} is already defined")
+        for other in self._stages.values():
+            if other.output == stage.output:
+                raise ValueError(f"Value {stage.output!r} is already produced by stage {other.name!r}")
+        
+        self._stages[stage.name] = stage
+        try:
+            self.order()
+        except ValueError:
+            del self._stages[stage.name]
+            raise
+        return stage
+    
+    def remove_stage(self, name: str) -> Stage:
+        """Remove a stage by name"""
+        if name not in self._stages:
+            raise KeyError(f"Unknown stage {name!r}")
+        return self._stages.pop(name)
+    
+    def replace_stage(self, name: str, func: Callable[[Dict[str, Any]], Any]) -> Stage:
+        """Swap the implementation of a stage, keeping its inputs and output"""
+        stage = self._stages[name]
+        stage.func = func
+        return stage
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._stages
+    
+    @property
+    def stages(self) -> List[Stage]:
+        """Stages in insertion order"""
+        return list(self._stages.values())
+    
+    def order(self) -> List[str]:
+        """
+        Get the stage names in dependency order
+        
+        Returns:
+            Topologically sorted stage names
+        
+        Raises:
+            ValueError: If the stages depend on each other in a cycle
+        """
+        producers = {stage.output: stage.name for stage in self._stages.values()}
+        dependencies = {
+            stage.name: {
+                producers[value] for value in stage.inputs + stage.optional_inputs
+                if value in producers
+            }
+            for stage in self._stages.values()
+        }
+        
+        ordered: List[str] = []
+        while dependencies:
+            ready = [name for name, needs in dependencies.items() if not needs - set(ordered)]
+            if not ready:
+                raise ValueError(f"Stage graph has a cycle between {sorted(dependencies)}")
+            for name in ready:
+                ordered.append(name)
+                del dependencies[name]
+        return ordered
+    
+    async def run(
+        self,
+        values: Dict[str, Any],
+        timings: Optional[Dict[str, float]] = None,
+        prepare: Optional[Callable[[str], Awaitable[None]]] = None,
+        exclude: Collection[str] = ()
+    ) -> Dict[str, Any]:
+        """
+        Run every stage whose inputs can be satisfied
+        
+        Args:
+            values: Initial named values (request inputs, context, ...)
+            timings: Dict receiving each timed stage's wall-clock milliseconds
+            prepare: Coroutine function awaited with the stage name before
+                the stage runs (counted in its timing)
+            exclude: Stage names not to run in this pass
+        
+        Returns:
+            The initial values together with every value produced
+        
+        Raises:
+            Exception: The first stage failure; running stages are cancelled
+        """
+        available = dict(values)
+        timings = timings if timings is not None else {}
+        pending = {name: stage for name, stage in self._stages.items() if name not in exclude}
+        running: Dict[asyncio.Task, Stage] = {}
+        
+        try:
+            while True:
+                self._start_ready(pending, running, available, timings, prepare)
+                if not running:
+                    break
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    available[stage.output] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+        
+        return available
+    
+    def _start_ready(
+        self,
+        pending: Dict[str, Stage],
+        running: Dict[asyncio.Task, Stage],
+        available: Dict[str, Any],
+        timings: Dict[str, float],
+        prepare: Optional[Callable[[str], Awaitable[None]]]
+    ) -> None:
+        """Start stages whose inputs are ready and drop those that can no longer run"""
+        changed = True
+        while changed:
+            changed = False
+            producible = {stage.output for stage in pending.values()} | {
+                stage.output for stage in running.values()
+            }
+            
+            for name, stage in list(pending.items()):
+                if any(value not in available and value not in producible for value in stage.inputs):
+                    logger.debug(f"Skipping stage {name}: inputs will not be produced")
+                    del pending[name]
+                    changed = True
+                    continue
+                
+                waiting = [
+                    value for value in stage.inputs + stage.optional_inputs
+                    if value not in available and value in producible
+                ]
+                if waiting:
+                    continue
+                
+                del pending[name]
+                changed = True
+                inputs = {
+                    value: available[value]
+                    for value in stage.inputs + stage.optional_inputs if value in available
+                }
+                if stage.condition is not None and not stage.condition(inputs):
+                    logger.debug(f"Skipping stage {name}: condition not met")
+                    continue
+                
+                running[asyncio.ensure_future(self._run_stage(stage, inputs, timings, prepare))] = stage
+    
+    async def _run_stage(
+        self,
+        stage: Stage,
+        inputs: Dict[str, Any],
+        timings: Dict[str, float],
+        prepare: Optional[Callable[[str], Awaitable[None]]]
+    ) -> Any:
+        """Run one stage, recording its wall-clock time"""
+        stage_start = time.time()
+        try:
+            if prepare is not None:
+                await prepare(stage.name)
+            output = stage.func(inputs)
+            if inspect.isawaitable(output):
+                output = await output
+            return output
+        finally:
+            if stage.timed:
+                timings[stage.name] = (time.time() - stage_start) * 1000
+    
+    def describe(self) -> List[Dict[str, Any]]:
+        """Describe the stages in dependency order"""
+        return [
+            {
+                "name": name,
+                "inputs": list(self._stages[name].inputs),
+                "optional_inputs": list(self._stages[name].optional_inputs),
+                "output": self._stages[name].output,
+                "conditional": self._stages[name].condition is not None
+            }
+            for name in self.order()
+        ]
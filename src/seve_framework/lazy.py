@@ -0,0 +1,70 @@
+"""
+SEVE Lazy Imports - Deferred Loading of Heavy Dependencies
+Symbiotic Ethical Vision Engine
+
+This module lets the framework modules name heavy third-party
+dependencies (numpy, PIL, OpenCV, httpx, psutil, ...) at module level
+without paying for importing them until they are actually used, so
+`import seve_framework` stays cheap for short-lived processes.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Optional, Union
+
+class LazyModule:
+    """
+    Lazy Module
+    
+    Stand-in for a module that is imported the first time one of its
+    attributes is read. Afterwards every attribute access is forwarded
+    to the real module.
+    """
+    
+    def __init__(self, name: str):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+    
+    def _load(self) -> ModuleType:
+        """Import the real module (once, even with concurrent first use)"""
+        with self._lock:
+            if self._module is None:
+                self.__dict__["_module"] = importlib.import_module(self._name)
+        return self._module
+    
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._module or self._load(), attr)
+    
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._module or self._load(), attr, value)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+def lazy_import(name: str) -> Optional[Union[ModuleType, LazyModule]]:
+    """
+    Get a module that is imported on first use
+    
+    Args:
+        name: Absolute module name, e.g. "cv2"
+    
+    Returns:
+        The module itself when it is already imported, a LazyModule
+        when it is installed but not imported yet, or None when it is
+        not installed (matching the `except ImportError: x = None`
+        convention for optional dependencies)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    return LazyModule(name) if spec is not None else None
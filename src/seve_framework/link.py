@@ -8,6 +8,7 @@ transmission capabilities.
 """
 
 import asyncio
+import functools
 import logging
 import time
 import json
@@ -16,17 +17,14 @@ from typing import Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-try:
-    import httpx
-except ImportError:
-    httpx = None
-
-try:
-    import aiofiles
-except ImportError:
-    aiofiles = None
 
 from .config import SEVEConfig
+from .lazy import lazy_import
+from .scheduler import PriorityScheduler, current_priority
+
+# Optional transport dependencies, loaded on first use (None when not installed)
+httpx = lazy_import("httpx")
+aiofiles = lazy_import("aiofiles")
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +99,7 @@ class SEVELinkModule:
         # Security settings
         self.security_level = SecurityLevel.STANDARD
         self.ssl_context = None
+        self.http_client = None
         
         # API management
         self.api_endpoints: Dict[str, str] = {}
@@ -109,6 +108,11 @@ class SEVELinkModule:
         # Transmission tracking
         self.transmission_history: List[TransmissionResult] = []
         
+        # Orders transmissions by request priority when scheduling is enabled
+        self.transmission_gate: Optional[PriorityScheduler] = None
+        if config.scheduling_enabled:
+            self.transmission_gate = PriorityScheduler(config.link_max_concurrency, config.scheduler_aging_ms)
+        
         logger.info("SEVE Link Module initialized")
     
     async def initialize(self) -> None:
@@ -135,8 +139,9 @@ class SEVELinkModule:
     
     async def _initialize_security(self) -> None:
         """Initialize security context"""
-        # Create SSL context for secure connections
-        self.ssl_context = ssl.create_default_context()
+        # Create SSL context for secure connections (loading CA certificates blocks)
+        loop = asyncio.get_running_loop()
+        self.ssl_context = await loop.run_in_executor(None, ssl.create_default_context)
         
         # Configure SSL based on security level
         if self.security_level == SecurityLevel.HIGH:
@@ -192,10 +197,12 @@ class SEVELinkModule:
             return
 
         # Create HTTP client with security context
-        self.http_client = httpx.AsyncClient(
+        loop = asyncio.get_running_loop()
+        self.http_client = await loop.run_in_executor(None, functools.partial(
+            httpx.AsyncClient,
             timeout=httpx.Timeout(30.0),
             verify=self.ssl_context if self.security_level in [SecurityLevel.HIGH, SecurityLevel.MAXIMUM] else False
-        )
+        ))
         
         logger.info("HTTP client initialized")
     
@@ -249,8 +256,16 @@ class SEVELinkModule:
             # Prepare transmission
             transmission_data = await self._prepare_transmission_data(data, context)
             
-            # Transmit data
-            result = await self._transmit_data(transmission_data, connection)
+            # Transmit data, urgent requests first when transmissions queue up
+            if self.transmission_gate is None:
+                result = await self._transmit_data(transmission_data, connection)
+            else:
+                transmission_data["priority"] = current_priority.get().value
+                await self.transmission_gate.acquire(current_priority.get())
+                try:
+                    result = await self._transmit_data(transmission_data, connection)
+                finally:
+                    self.transmission_gate.release()
             
             # Log transmission result
             self.transmission_history.append(result)
@@ -265,6 +280,37 @@ class SEVELinkModule:
             logger.error(f"Error transmitting data: {e}")
             return False
     
+    async def transmit_batch(
+        self,
+        data_items: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        connection_name: Optional[str] = None
+    ) -> bool:
+        """
+        Transmit a batch of outputs to external systems in one request
+        
+        Args:
+            data_items: List of data payloads to transmit
+            contexts: Optional per-item context, aligned with data_items
+            connection_name: Specific connection to use
+        
+        Returns:
+            True if the bulk transmission was successful, False otherwise
+        """
+        if not data_items:
+            return True
+        
+        contexts = contexts or [None] * len(data_items)
+        batch_data = {
+            "batch": [
+                {"data": data, "context": context or {}}
+                for data, context in zip(data_items, contexts)
+            ],
+            "batch_size": len(data_items)
+        }
+        
+        return await self.transmit_output(batch_data, {"batch": True}, connection_name)
+    
     async def _prepare_transmission_data(
         self,
         data: Dict[str, Any],
@@ -513,6 +559,16 @@ class SEVELinkModule:
             logger.error(f"Error removing connection {connection_name}: {e}")
             return False
     
+    async def close(self) -> None:
+        """Close the HTTP client and drop active connections"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+        
+        self.active_connections.clear()
+        self.is_initialized = False
+        logger.info("SEVE Link Module closed")
+    
     def get_transmission_history(self) -> List[TransmissionResult]:
         """Get transmission history"""
         return self.transmission_history.copy()
@@ -526,7 +582,8 @@ class SEVELinkModule:
             "security_level": self.security_level.value,
             "api_endpoints": len(self.api_endpoints),
             "transmission_history_count": len(self.transmission_history),
-            "ssl_context_configured": self.ssl_context is not None
+            "ssl_context_configured": self.ssl_context is not None,
+            "transmission_queue": self.transmission_gate.get_stats() if self.transmission_gate else None
         }
 
 # Demo function
@@ -16,11 +16,13 @@ from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
-import psutil
 import threading
 from collections import defaultdict, deque
-import websockets
-import aiohttp
+
+from .lazy import lazy_import
+
+# Carregado no primeiro uso (None quando não instalado)
+psutil = lazy_import("psutil")
 
 logger = logging.getLogger(__name__)
 
@@ -361,11 +363,30 @@ class RealTimeMonitor:
                 )
             return None
         
+        def load_shedding_rule(metrics):
+            """Regra para rejeição de requisições pelo controle de admissão"""
+            rejection_rate = metrics.get("gauges", {}).get("admission_rejection_rate", 0)
+            queue_depth = metrics.get("gauges", {}).get("admission_queue_depth", 0)
+            if rejection_rate > 0.2:  # 20%
+                return (
+                    AlertLevel.CRITICAL,
+                    f"Sobrecarga: {rejection_rate:.2%} das requisições rejeitadas",
+                    {"rejection_rate": rejection_rate, "queue_depth": queue_depth}
+                )
+            elif rejection_rate > 0.05:  # 5%
+                return (
+                    AlertLevel.WARNING,
+                    f"Descarte de carga ativo: {rejection_rate:.2%} das requisições rejeitadas",
+                    {"rejection_rate": rejection_rate, "queue_depth": queue_depth}
+                )
+            return None
+        
         # Registrar regras
         self.alert_manager.add_alert_rule("high_error_rate", high_error_rate_rule)
         self.alert_manager.add_alert_rule("low_ethics_compliance", low_ethics_compliance_rule)
         self.alert_manager.add_alert_rule("high_processing_time", high_processing_time_rule)
         self.alert_manager.add_alert_rule("memory_usage", memory_usage_rule)
+        self.alert_manager.add_alert_rule("load_shedding", load_shedding_rule)
     
     def _setup_default_alert_handlers(self):
         """Configura handlers de alerta padrão"""
@@ -435,6 +456,10 @@ class RealTimeMonitor:
     
     async def _collect_system_metrics(self):
         """Coleta métricas do sistema"""
+        if psutil is None:
+            logger.debug("psutil não instalado, métricas do sistema indisponíveis")
+            return
+        
         # Métricas de CPU
         cpu_percent = psutil.cpu_percent(interval=1)
         self.metrics_collector.set_gauge("cpu_usage_percent", cpu_percent)
@@ -0,0 +1,188 @@
+"""
+SEVE Motion - Motion-Gated Detection Regions
+Symbiotic Ethical Vision Engine
+
+This module implements the motion pre-stage of the vision module. For
+fixed cameras most of a frame is identical to the previous one; the
+gate differences consecutive frames at low resolution, turns the
+changed pixels into padded, merged regions of interest, and keeps the
+previous detections of everything outside them, so detector work
+follows scene activity instead of frame size.
+"""
+
+# Annotations name numpy types, which must not force that import
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Dict, Any, Collection, List, Optional, Tuple
+
+from .lazy import lazy_import
+from .planes import FramePlanes
+
+if TYPE_CHECKING:
+    from .vision import Detection, DetectionType
+
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]
+
+def _intersects(first: Box, second: Box) -> bool:
+    """Whether two (x, y, width, height) boxes overlap"""
+    ax, ay, aw, ah = first
+    bx, by, bw, bh = second
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+def _union(first: Box, second: Box) -> Box:
+    """Smallest box containing both boxes"""
+    left = min(first[0], second[0])
+    top = min(first[1], second[1])
+    right = max(first[0] + first[2], second[0] + second[2])
+    bottom = max(first[1] + first[3], second[1] + second[3])
+    return (left, top, right - left, bottom - top)
+
+def merge_boxes(boxes: List[Box]) -> List[Box]:
+    """Merge overlapping boxes until no two boxes overlap"""
+    merged = list(boxes)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(i + 1, len(merged)):
+                if _intersects(merged[i], merged[j]):
+                    merged[i] = _union(merged[i], merged.pop(j))
+                    changed = True
+                    break
+            if changed:
+                break
+    return merged
+
+class MotionGate:
+    """
+    Motion Gate
+    
+    Keeps the previous frame of one stream (at analysis_height rows)
+    and its detections of the gated types. regions() reports where the
+    current frame changed, in full-frame coordinates; merge() combines
+    the fresh detections of those regions with the previous detections
+    of the static remainder.
+    
+    One gate follows one video stream; it is driven by a single task
+    at a time.
+    """
+    
+    def __init__(
+        self,
+        gated_types: Collection[DetectionType],
+        threshold: int = 25,
+        padding: int = 32,
+        max_area_fraction: float = 0.5,
+        analysis_height: int = 360
+    ):
+        self.gated_types = frozenset(gated_types)
+        self.threshold = threshold
+        self.padding = padding
+        self.max_area_fraction = max_area_fraction
+        self.analysis_height = analysis_height
+        
+        self._previous_gray = None
+        self._previous_detections: List[Detection] = []
+        
+        # Gate statistics
+        self.frames = 0
+        self.full_frames = 0
+        self.static_frames = 0
+        self.region_area_fraction = 0.0
+    
+    def regions(self, planes: FramePlanes) -> Optional[List[Box]]:
+        """
+        Get the regions of the frame to run the detectors on
+        
+        Regions are padded, grown to cover previous detections they
+        touch (so a moving object is re-detected whole), and merged.
+        
+        Args:
+            planes: Planes of the current frame
+        
+        Returns:
+            Full-frame boxes (empty when nothing changed), or None when
+            the whole frame must be processed
+        """
+        analysis = planes.scaled(self.analysis_height)
+        gray = cv2.GaussianBlur(analysis["gray"], (5, 5), 0)
+        previous, self._previous_gray = self._previous_gray, gray
+        self.frames += 1
+        
+        if previous is None or previous.shape != gray.shape:
+            self.full_frames += 1
+            return None
+        
+        changed = cv2.absdiff(gray, previous) > self.threshold
+        mask = cv2.dilate(changed.astype(np.uint8), None, iterations=2)
+        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        
+        height, width = planes.shape[:2]
+        boxes = []
+        for contour in contours:
+            x, y, w, h = analysis.to_original(cv2.boundingRect(contour))
+            left, top = max(0, x - self.padding), max(0, y - self.padding)
+            right = min(width, x + w + self.padding)
+            bottom = min(height, y + h + self.padding)
+            box = (left, top, right - left, bottom - top)
+            for detection in self._previous_detections:
+                if _intersects(box, detection.bbox):
+                    box = _union(box, detection.bbox)
+            boxes.append(box)
+        boxes = merge_boxes(boxes)
+        
+        area = sum(w * h for _, _, w, h in boxes) / float(width * height)
+        if area > self.max_area_fraction:
+            self.full_frames += 1
+            return None
+        if not boxes:
+            self.static_frames += 1
+        self.region_area_fraction += area
+        return boxes
+    
+    def merge(self, regions: Optional[List[Box]], detections: List[Detection]) -> List[Detection]:
+        """
+        Combine fresh detections with the previous ones of static areas
+        
+        Only detections of the gated types come from the regions;
+        other detections are passed through as they are.
+        
+        Args:
+            regions: What regions() returned for this frame
+            detections: Detector output for this frame
+        
+        Returns:
+            The frame's detections, which the next frame builds on
+        """
+        if regions is not None:
+            reused = [
+                dataclasses.replace(
+                    detection,
+                    anonymized=False,
+                    metadata=dict(detection.metadata, reused=True)
+                )
+                for detection in self._previous_detections
+                if not any(_intersects(detection.bbox, region) for region in regions)
+            ]
+            detections = reused + detections
+        self._previous_detections = [
+            detection for detection in detections if detection.type in self.gated_types
+        ]
+        return detections
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gate statistics"""
+        gated = self.frames - self.full_frames
+        return {
+            "frames": self.frames,
+            "full_frames": self.full_frames,
+            "static_frames": self.static_frames,
+            "mean_region_area_fraction": self.region_area_fraction / gated if gated else 0.0
+        }
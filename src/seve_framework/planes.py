@@ -0,0 +1,214 @@
+"""
+SEVE Frame Planes - Shared Per-Frame Preprocessing
+Symbiotic Ethical Vision Engine
+
+This module implements the preprocessing cache the vision detectors
+read from. Derived planes of a frame (grayscale, image pyramid, edge
+map, integral image, ...) are computed the first time a detector asks
+for them and reused by every other detector of the same frame, so each
+full-frame pass runs at most once.
+"""
+
+# Annotations name numpy types, which must not force that import
+from __future__ import annotations
+
+import logging
+import math
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+from .lazy import lazy_import
+from .shared_frames import FrameHandle, resolve_frame
+
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+# Builders take the FramePlanes of a frame and return the derived plane
+PlaneBuilder = Callable[["FramePlanes"], Any]
+
+# Pyramid levels stop before either side drops below this many pixels
+PYRAMID_MIN_SIDE = 32
+PYRAMID_MAX_LEVELS = 4
+
+def _build_gray(planes: FramePlanes) -> np.ndarray:
+    """Grayscale plane of a BGR frame (single-channel frames are used as they are)"""
+    image = planes.image
+    if image.ndim == 2:
+        return image
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+def _build_pyramid(planes: FramePlanes) -> List[np.ndarray]:
+    """Grayscale pyramid, full resolution first, each level half the size of the previous"""
+    levels = [planes["gray"]]
+    while len(levels) < PYRAMID_MAX_LEVELS and min(levels[-1].shape[:2]) >= 2 * PYRAMID_MIN_SIDE:
+        levels.append(cv2.pyrDown(levels[-1]))
+    return levels
+
+def _build_edges(planes: FramePlanes) -> np.ndarray:
+    """Canny edge map of the grayscale plane"""
+    return cv2.Canny(planes["gray"], 50, 150)
+
+def _build_integral(planes: FramePlanes) -> np.ndarray:
+    """Integral image of the grayscale plane, for constant-time region sums"""
+    return cv2.integral(planes["gray"])
+
+# Planes every SEVEVisionModule can provide
+DEFAULT_PLANE_BUILDERS: Dict[str, PlaneBuilder] = {
+    "gray": _build_gray,
+    "pyramid": _build_pyramid,
+    "edges": _build_edges,
+    "integral": _build_integral,
+}
+
+class FramePlanes:
+    """
+    Frame Planes
+    
+    Lazily computed, cached derived planes of one frame, looked up by
+    name (planes["edges"]). Builders may read other planes, so a plane
+    built on the grayscale image shares the one conversion.
+    
+    scaled() gives the planes of a downscaled copy for detectors that
+    run below full resolution, and crop() those of a region of the
+    frame; their to_original() maps boxes back to the coordinates of
+    the full frame. They share the frame's escalations list, where
+    detectors record passes repeated at a higher resolution.
+    
+    A FramePlanes object belongs to the processing of one frame and is
+    not meant to be shared between threads. Pickling it (to reach a
+    worker process) keeps the frame and builders but drops the cache,
+    so builders must be module-level functions for process executors.
+    """
+    
+    def __init__(
+        self,
+        frame: Union[np.ndarray, FrameHandle],
+        builders: Optional[Dict[str, PlaneBuilder]] = None
+    ):
+        self.frame = frame
+        self.builders = builders if builders is not None else DEFAULT_PLANE_BUILDERS
+        self._planes: Dict[str, Any] = {}
+        self._image: Optional[np.ndarray] = None
+        self._scaled: Dict[int, FramePlanes] = {}
+        
+        # Factors from full-frame to these planes' coordinates, full-frame
+        # position of their origin, and full-frame size
+        self.scale: Tuple[float, float] = (1.0, 1.0)
+        self.offset: Tuple[float, float] = (0.0, 0.0)
+        self.original_size: Tuple[int, int] = tuple(self.shape[:2])
+        
+        # Detectors that escalated from a probe to their full resolution
+        self.escalations: List[str] = []
+    
+    @property
+    def image(self) -> np.ndarray:
+        """The frame itself; shared-memory handles are mapped on first access"""
+        if self._image is None:
+            self._image = resolve_frame(self.frame) if isinstance(self.frame, FrameHandle) else self.frame
+        return self._image
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Shape of the frame"""
+        return self.frame.shape
+    
+    def __getitem__(self, name: str) -> Any:
+        plane = self._planes.get(name)
+        if plane is None:
+            builder = self.builders.get(name)
+            if builder is None:
+                raise KeyError(f"No builder registered for plane {name!r}")
+            plane = builder(self)
+            self._planes[name] = plane
+        return plane
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._planes or name in self.builders
+    
+    def set(self, name: str, plane: Any) -> None:
+        """Provide a plane computed elsewhere (e.g. for a whole batch at once)"""
+        self._planes[name] = plane
+    
+    def scaled(self, height: Optional[int]) -> FramePlanes:
+        """
+        Get the planes downscaled as if the full frame had height rows
+        
+        The downscaled grayscale plane is resized from this frame's
+        grayscale plane once per height, and the returned FramePlanes
+        builds every other plane from it. Crops scale by the same
+        factor as their full frame.
+        
+        Args:
+            height: Target full-frame height in pixels; None or 0 for
+                full resolution
+        
+        Returns:
+            This FramePlanes when it is not above that resolution,
+            otherwise the cached downscaled FramePlanes
+        """
+        if not height:
+            return self
+        factor = height / self.original_size[0] / self.scale[1]
+        if factor >= 1.0:
+            return self
+        
+        child = self._scaled.get(height)
+        if child is None:
+            frame_height, frame_width = self.shape[:2]
+            width = max(1, round(frame_width * factor))
+            rows = max(1, round(frame_height * factor))
+            gray = cv2.resize(self["gray"], (width, rows), interpolation=cv2.INTER_AREA)
+            child = FramePlanes(gray, self.builders)
+            child.scale = (self.scale[0] * width / frame_width, self.scale[1] * rows / frame_height)
+            child.offset = self.offset
+            child.original_size = self.original_size
+            child.escalations = self.escalations
+            self._scaled[height] = child
+        return child
+    
+    def crop(self, bbox: Tuple[int, int, int, int]) -> FramePlanes:
+        """
+        Get the planes of a region, given in these planes' coordinates
+        
+        The region's grayscale plane is a view of this frame's, and its
+        other planes are built from it on demand.
+        """
+        x, y, w, h = (int(value) for value in bbox)
+        child = FramePlanes(self["gray"][y:y + h, x:x + w], self.builders)
+        child.scale = self.scale
+        child.offset = (self.offset[0] + x / self.scale[0], self.offset[1] + y / self.scale[1])
+        child.original_size = self.original_size
+        child.escalations = self.escalations
+        return child
+    
+    def to_original(self, bbox: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+        """
+        Map an (x, y, width, height) box from these planes to the full frame
+        
+        The box is widened to whole pixels and clipped to the frame, so
+        anonymizing the mapped box covers everything the detector saw.
+        """
+        x, y, w, h = bbox
+        scale_x, scale_y = self.scale
+        offset_x, offset_y = self.offset
+        if scale_x == 1.0 and scale_y == 1.0:
+            return (int(x + offset_x), int(y + offset_y), int(w), int(h))
+        
+        height, width = self.original_size
+        left = max(0, math.floor(offset_x + x / scale_x))
+        top = max(0, math.floor(offset_y + y / scale_y))
+        right = min(width, math.ceil(offset_x + (x + w) / scale_x))
+        bottom = min(height, math.ceil(offset_y + (y + h) / scale_y))
+        return (left, top, right - left, bottom - top)
+    
+    def computed(self) -> List[str]:
+        """Names of the planes built so far"""
+        return list(self._planes)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the frame and builders only; planes are rebuilt where needed"""
+        return {"frame": self.frame, "builders": self.builders}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["frame"], state["builders"])
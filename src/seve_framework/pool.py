@@ -0,0 +1,251 @@
+"""
+SEVE Framework Pool - Reusable Framework Instances per Configuration
+Symbiotic Ethical Vision Engine
+
+This module implements a pool of fully initialized SEVEHybridFramework
+instances keyed by their configuration. Multi-tenant deployments serve
+tenants with different privacy and ethics settings; with the pool a
+tenant switch is a dictionary lookup instead of building the four
+modules, the HTTP client and the Universal core from scratch.
+"""
+
+import copy
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, Callable, Optional
+
+from .config import SEVEConfig
+from .cache import input_fingerprint
+from .coalesce import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+def config_key(config: SEVEConfig) -> str:
+    """
+    Compute a stable key for a configuration
+    
+    Equal settings give the same key regardless of object identity or
+    dictionary ordering, so separately loaded copies of one tenant
+    configuration share a pooled instance.
+    
+    Args:
+        config: Framework configuration
+    
+    Returns:
+        Hex digest of the configuration settings
+    """
+    return input_fingerprint(config.to_dict(), None)
+
+@dataclass
+class _PoolEntry:
+    """A pooled framework instance and its usage bookkeeping"""
+    framework: Any
+    last_used: float
+    leases: int = 0
+    evicted: bool = False
+
+class FrameworkPool:
+    """
+    Framework Pool
+    
+    Bounded LRU pool of initialized frameworks. Instances idle for
+    longer than idle_timeout_seconds and the least recently used
+    instances beyond max_size are evicted and shut down, which closes
+    the link module's HTTP client. Concurrent requests for a missing
+    configuration build it once.
+    
+    Instances handed out through lease() are pinned: evicting a leased
+    instance removes it from the pool immediately but defers its
+    shutdown until the last lease is released.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 8,
+        idle_timeout_seconds: float = 300.0,
+        factory: Optional[Callable[[SEVEConfig], Any]] = None,
+        metrics: Optional[Any] = None
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if idle_timeout_seconds <= 0:
+            raise ValueError("idle_timeout_seconds must be positive")
+        
+        self.max_size = max_size
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.factory = factory or _default_factory
+        self.metrics = metrics
+        
+        self._entries: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._builds = SingleFlight()
+        
+        # Pool statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    async def get(self, config: SEVEConfig) -> Any:
+        """
+        Get the initialized framework for a configuration
+        
+        The instance is not pinned; callers holding on to it across
+        awaits should use lease() so it is not shut down under them.
+        
+        Args:
+            config: Framework configuration
+        
+        Returns:
+            Initialized SEVEHybridFramework for the configuration
+        """
+        return (await self._checkout(config)).framework
+    
+    @asynccontextmanager
+    async def lease(self, config: SEVEConfig) -> AsyncIterator[Any]:
+        """
+        Borrow the initialized framework for a configuration
+        
+        Args:
+            config: Framework configuration
+        
+        Yields:
+            Initialized SEVEHybridFramework, pinned until the block exits
+        """
+        entry = await self._checkout(config)
+        entry.leases += 1
+        try:
+            yield entry.framework
+        finally:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if entry.evicted and entry.leases == 0:
+                await self._shutdown(entry)
+    
+    async def _checkout(self, config: SEVEConfig) -> _PoolEntry:
+        """Look up or build the pool entry for a configuration"""
+        await self.evict_idle()
+        key = config_key(config)
+        
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            self._increment("framework_pool_misses")
+            entry = await self._builds.do(key, lambda: self._build(key, config))
+        else:
+            self.hits += 1
+            self._increment("framework_pool_hits")
+        
+        entry.last_used = time.monotonic()
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        return entry
+    
+    async def _build(self, key: str, config: SEVEConfig) -> _PoolEntry:
+        """Create and initialize a framework, then make room for it"""
+        # Pooled instances get their own copy, so later changes to the
+        # caller's config object cannot drift away from the pool key
+        framework = self.factory(copy.deepcopy(config))
+        await framework.initialize()
+        logger.info(f"Framework pool built instance {key[:12]}")
+        
+        entry = _PoolEntry(framework=framework, last_used=time.monotonic())
+        self._entries[key] = entry
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            await self._evict(oldest_key)
+        self._update_size()
+        return entry
+    
+    async def evict(self, config: SEVEConfig) -> bool:
+        """
+        Remove and shut down the instance for a configuration
+        
+        Args:
+            config: Framework configuration
+        
+        Returns:
+            True if an instance was pooled for the configuration
+        """
+        key = config_key(config)
+        if key not in self._entries:
+            return False
+        
+        await self._evict(key)
+        self._update_size()
+        return True
+    
+    async def evict_idle(self) -> int:
+        """
+        Evict every instance idle for longer than the idle timeout
+        
+        Returns:
+            Number of instances evicted
+        """
+        cutoff = time.monotonic() - self.idle_timeout_seconds
+        idle = [
+            key for key, entry in self._entries.items()
+            if entry.leases == 0 and entry.last_used < cutoff
+        ]
+        for key in idle:
+            await self._evict(key)
+        if idle:
+            self._update_size()
+        return len(idle)
+    
+    async def _evict(self, key: str) -> None:
+        """Remove an entry, shutting it down now or when its last lease ends"""
+        entry = self._entries.pop(key)
+        entry.evicted = True
+        self.evictions += 1
+        self._increment("framework_pool_evictions")
+        logger.info(f"Framework pool evicted instance {key[:12]}")
+        
+        if entry.leases == 0:
+            await self._shutdown(entry)
+    
+    async def _shutdown(self, entry: _PoolEntry) -> None:
+        """Shut down an evicted framework, logging rather than raising on failure"""
+        try:
+            await entry.framework.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down pooled framework: {e}")
+    
+    async def close(self) -> None:
+        """Shut down every pooled instance"""
+        for key in list(self._entries):
+            await self._evict(key)
+        self._update_size()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "idle_timeout_seconds": self.idle_timeout_seconds,
+            "leased": sum(1 for entry in self._entries.values() if entry.leases),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions
+        }
+    
+    def _increment(self, name: str) -> None:
+        """Forward a counter increment to the metrics collector"""
+        if self.metrics is not None:
+            self.metrics.increment_counter(name)
+    
+    def _update_size(self) -> None:
+        """Forward the current pool size to the metrics collector"""
+        if self.metrics is not None:
+            self.metrics.set_gauge("framework_pool_size", len(self._entries))
+
+def _default_factory(config: SEVEConfig) -> Any:
+    """Build a SEVEHybridFramework, importing the pipeline on first use"""
+    from .core import SEVEHybridFramework
+    return SEVEHybridFramework(config)
@@ -0,0 +1,219 @@
+"""
+SEVE Scheduler - Priority-Aware Request Scheduling
+Symbiotic Ethical Vision Engine
+
+This module implements the scheduler placed in front of the v3.0
+pipeline. Requests are ordered by priority class, explicit or inferred
+from hazard flags and sensor anomalies, and by weighted fair queuing
+across tenants within a class. The priority of the running request is
+published through a context variable, so the stage executor and the
+link module can let latency-critical frames overtake batch work too.
+"""
+
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
+
+from .config import SEVEConfig
+from .admission import RequestPriority
+
+logger = logging.getLogger(__name__)
+
+# Priority of the request whose work is currently running
+current_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    "seve_current_priority", default=RequestPriority.NORMAL
+)
+
+# Tenant used for requests that don't name one
+DEFAULT_TENANT = "default"
+
+def request_tenant(context: Optional[Dict[str, Any]]) -> str:
+    """Get the tenant (or connection) a request is accounted to"""
+    if not context:
+        return DEFAULT_TENANT
+    return str(context.get("tenant_id") or context.get("connection_id") or DEFAULT_TENANT)
+
+def infer_priority(
+    input_data: Dict[str, Any],
+    context: Optional[Dict[str, Any]] = None,
+    sense_module: Optional[Any] = None
+) -> RequestPriority:
+    """
+    Determine the scheduling priority of a request
+    
+    An explicit context "priority" (or "safety_critical") wins.
+    Otherwise a hazard flag, as checked by the Safety_HazardDetection_Alert
+    rule, makes the request CRITICAL when its severity is critical and
+    HIGH otherwise; sensor anomalies make it HIGH.
+    
+    Args:
+        input_data: Input dictionary as passed to process_context
+        context: Request context
+        sense_module: SEVESenseModule used to check sensor anomalies
+    
+    Returns:
+        The request's priority
+    """
+    context = context or {}
+    if "priority" in context or context.get("safety_critical"):
+        return RequestPriority.from_context(context)
+    
+    for source in (context, input_data):
+        if source.get("hazard_detected"):
+            if source.get("severity") == "critical":
+                return RequestPriority.CRITICAL
+            return RequestPriority.HIGH
+    
+    sensor_data = input_data.get("sensor")
+    if sense_module is not None and isinstance(sensor_data, dict) and sensor_data:
+        if sense_module.detect_anomalies(sensor_data):
+            return RequestPriority.HIGH
+    
+    return RequestPriority.NORMAL
+
+@dataclass
+class _Waiter:
+    """A request waiting for a slot"""
+    priority: RequestPriority
+    tenant: str
+    start_tag: float
+    finish_tag: float
+    enqueued_at: float
+    sequence: int
+    future: asyncio.Future
+
+class PriorityScheduler:
+    """
+    Priority Scheduler
+    
+    Grants up to `capacity` slots at a time. Waiting requests are
+    served by priority class; within a class, tenants share slots in
+    proportion to their weights (weighted fair queuing on virtual
+    finish tags), so one busy tenant cannot starve the others.
+    
+    A waiting request is promoted one class for every aging_ms it has
+    waited, up to HIGH: bulk work keeps moving under sustained load,
+    while CRITICAL requests always go first.
+    """
+    
+    def __init__(
+        self,
+        capacity: int,
+        aging_ms: float = 1000.0,
+        tenant_weights: Optional[Dict[str, float]] = None
+    ):
+        self.capacity = capacity
+        self.aging_ms = aging_ms
+        self.tenant_weights = dict(tenant_weights or {})
+        
+        self.in_use = 0
+        self._waiters: List[_Waiter] = []
+        self._virtual_time = 0.0
+        self._finish_tags: Dict[str, float] = {}
+        self._sequence = itertools.count()
+        
+        # Scheduling statistics
+        self.granted: Dict[str, int] = {priority.value: 0 for priority in RequestPriority}
+        self.promoted = 0
+        self.max_wait_ms = 0.0
+    
+    @classmethod
+    def from_config(cls, config: SEVEConfig) -> 'PriorityScheduler':
+        """Create the request scheduler from the configuration"""
+        return cls(
+            capacity=config.scheduler_max_concurrency,
+            aging_ms=config.scheduler_aging_ms,
+            tenant_weights=config.tenant_weights
+        )
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot"""
+        return len(self._waiters)
+    
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL, tenant: str = DEFAULT_TENANT) -> None:
+        """
+        Wait for a slot
+        
+        Args:
+            priority: Priority class of the request
+            tenant: Tenant or connection the request is accounted to
+        """
+        if self.in_use < self.capacity and not self._waiters:
+            self.in_use += 1
+            self.granted[priority.value] += 1
+            return
+        
+        # Virtual finish tag: the tenant's previous tag (or now) plus its weighted cost
+        weight = self.tenant_weights.get(tenant, 1.0)
+        start_tag = max(self._virtual_time, self._finish_tags.get(tenant, 0.0))
+        finish_tag = start_tag + 1.0 / weight
+        self._finish_tags[tenant] = finish_tag
+        
+        waiter = _Waiter(
+            priority=priority,
+            tenant=tenant,
+            start_tag=start_tag,
+            finish_tag=finish_tag,
+            enqueued_at=time.monotonic(),
+            sequence=next(self._sequence),
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                self.release()
+            raise
+    
+    def release(self) -> None:
+        """Return a slot and hand it to the next waiting request"""
+        self.in_use -= 1
+        self._dispatch()
+    
+    def _dispatch(self) -> None:
+        """Grant free slots to the most urgent waiters"""
+        now = time.monotonic()
+        while self._waiters and self.in_use < self.capacity:
+            waiter = min(self._waiters, key=lambda w: (-self._effective_rank(w, now), w.finish_tag, w.sequence))
+            self._waiters.remove(waiter)
+            if waiter.future.done():
+                continue
+            
+            if self._effective_rank(waiter, now) > waiter.priority.rank:
+                self.promoted += 1
+            self._virtual_time = max(self._virtual_time, waiter.start_tag)
+            self.max_wait_ms = max(self.max_wait_ms, (now - waiter.enqueued_at) * 1000)
+            self.granted[waiter.priority.value] += 1
+            self.in_use += 1
+            waiter.future.set_result(None)
+    
+    def _effective_rank(self, waiter: _Waiter, now: float) -> int:
+        """Priority rank after aging, never promoted past HIGH"""
+        if waiter.priority == RequestPriority.CRITICAL:
+            return waiter.priority.rank
+        aged = int((now - waiter.enqueued_at) * 1000 / self.aging_ms)
+        return min(waiter.priority.rank + aged, RequestPriority.HIGH.rank)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduling statistics"""
+        waiting: Dict[str, int] = {priority.value: 0 for priority in RequestPriority}
+        for waiter in self._waiters:
+            waiting[waiter.priority.value] += 1
+        
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "queue_depth": len(self._waiters),
+            "waiting": waiting,
+            "granted": dict(self.granted),
+            "promoted": self.promoted,
+            "max_wait_ms": self.max_wait_ms
+        }
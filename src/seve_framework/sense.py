@@ -14,7 +14,6 @@ import json
 from typing import Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import numpy as np
 
 from .config import SEVEConfig
 
@@ -93,8 +92,17 @@ class SEVESenseModule:
             SensorType.MOTION: {"min": 0, "max": 1, "std_threshold": 0.1},
         }
         
+        # Stage executor for fusion work (None runs it inline)
+        self.executor = None
+        
         logger.info("SEVE Sense Module initialized")
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the executor so fusion can run in worker processes"""
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
+    
     async def initialize(self) -> None:
         """Initialize sensor modules and fusion algorithms"""
         try:
@@ -209,41 +217,129 @@ class SEVESenseModule:
             await self.initialize()
         
         try:
-            # Parse sensor readings
-            readings = await self._parse_sensor_data(sensor_data)
-            
-            # Assess data quality
-            quality_assessments = await self._assess_data_quality(readings)
-            
-            # Detect anomalies
-            anomalies = await self._detect_anomalies(readings, context)
-            
-            # Fuse sensor data
-            fused_data = await self._fuse_sensor_data(readings, context)
-            
-            # Calculate overall quality score
-            quality_score = await self._calculate_quality_score(quality_assessments)
+            return await self._offload(self._fuse_sensor_input, sensor_data, context, start_time)
             
-            processing_time = (time.time() - start_time) * 1000
+        except Exception as e:
+            logger.error(f"Error processing sensor input: {e}")
+            raise
+    
+    async def process_sensor_batch(
+        self,
+        sensor_batch: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[SensorFusionResult, Exception]]:
+        """
+        Process a batch of multi-sensor inputs in a single call
+        
+        Readiness checks and timing are done once for the whole batch,
+        so per-reading overhead is amortized across the chunk. Items are
+        fused independently; a malformed item only fails itself.
+        
+        Args:
+            sensor_batch: List of sensor reading dictionaries
+            contexts: Optional per-item context, aligned with sensor_batch
+            return_exceptions: Return an item's exception in its place
+                instead of raising it
             
-            return SensorFusionResult(
-                fused_data=fused_data,
-                individual_readings=readings,
-                processing_time_ms=processing_time,
-                data_quality_score=quality_score,
-                anomalies_detected=anomalies,
-                metadata={
-                    "sensor_count": len(readings),
-                    "fusion_algorithm": "weighted_average",
-                    "context": context or {}
-                }
-            )
+        Returns:
+            SensorFusionResult (or exception) for each input, in input order
+        """
+        start_time = time.time()
+        
+        if not self.is_initialized:
+            await self.initialize()
+        
+        contexts = contexts or [None] * len(sensor_batch)
+        
+        try:
+            results = await self._offload(self._fuse_sensor_batch, sensor_batch, contexts, start_time)
             
         except Exception as e:
-            logger.error(f"Error processing sensor input: {e}")
+            logger.error(f"Error processing sensor batch: {e}")
             raise
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    
+    def detect_anomalies(self, sensor_data: Dict[str, Any]) -> List[str]:
+        """
+        Check raw sensor data for anomalies without fusing it
+        
+        The readings are only parsed and range-checked, which is cheap
+        enough to run before a request is scheduled.
+        
+        Args:
+            sensor_data: Dictionary containing sensor readings
+        
+        Returns:
+            Descriptions of the anomalies found
+        """
+        return self._detect_anomalies(self._parse_sensor_data(sensor_data))
+    
+    async def _offload(self, func, *args):
+        """Run CPU-bound fusion work on the configured stage executor"""
+        if self.executor is None:
+            return func(*args)
+        return await self.executor.run("sense", func, *args)
+    
+    def _fuse_sensor_batch(
+        self,
+        sensor_batch: List[Dict[str, Any]],
+        contexts: List[Optional[Dict[str, Any]]],
+        start_time: float
+    ) -> List[Union[SensorFusionResult, Exception]]:
+        """Fuse every item of a batch in one executor call, returning each item's exception in its place"""
+        results: List[Union[SensorFusionResult, Exception]] = []
+        for index, (sensor_data, context) in enumerate(zip(sensor_batch, contexts)):
+            try:
+                results.append(self._fuse_sensor_input(sensor_data, context, start_time))
+            except Exception as e:
+                logger.error(f"Error processing sensor batch item {index}: {e}")
+                results.append(e)
+        return results
+    
+    def _fuse_sensor_input(
+        self,
+        sensor_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]],
+        start_time: float
+    ) -> SensorFusionResult:
+        """Run parsing, quality assessment, anomaly detection and fusion"""
+        # Parse sensor readings
+        readings = self._parse_sensor_data(sensor_data)
+        
+        # Assess data quality
+        quality_assessments = self._assess_data_quality(readings)
+        
+        # Detect anomalies
+        anomalies = self._detect_anomalies(readings, context)
+        
+        # Fuse sensor data
+        fused_data = self._fuse_sensor_data(readings, context)
+        
+        # Calculate overall quality score
+        quality_score = self._calculate_quality_score(quality_assessments)
+        
+        processing_time = (time.time() - start_time) * 1000
+        
+        return SensorFusionResult(
+            fused_data=fused_data,
+            individual_readings=readings,
+            processing_time_ms=processing_time,
+            data_quality_score=quality_score,
+            anomalies_detected=anomalies,
+            metadata={
+                "sensor_count": len(readings),
+                "fusion_algorithm": "weighted_average",
+                "context": context or {}
+            }
+        )
     
-    async def _parse_sensor_data(self, sensor_data: Dict[str, Any]) -> List[SensorReading]:
+    def _parse_sensor_data(self, sensor_data: Dict[str, Any]) -> List[SensorReading]:
         """Parse raw sensor data into structured readings"""
         readings = []
         current_time = time.time()
@@ -268,7 +364,7 @@ class SEVESenseModule:
                     metadata = {}
                 
                 # Apply calibration
-                calibrated_value = await self._apply_calibration(sensor_type, value)
+                calibrated_value = self._apply_calibration(sensor_type, value)
                 
                 reading = SensorReading(
                     sensor_type=sensor_type,
@@ -343,14 +439,14 @@ class SEVESenseModule:
         }
         return units.get(sensor_type, "unknown")
     
-    async def _apply_calibration(self, sensor_type: SensorType, value: float) -> float:
+    def _apply_calibration(self, sensor_type: SensorType, value: float) -> float:
         """Apply calibration to sensor value"""
         if sensor_type in self.calibration_data:
             calibration = self.calibration_data[sensor_type]
             return value * calibration["scale"] + calibration["offset"]
         return value
     
-    async def _assess_data_quality(self, readings: List[SensorReading]) -> Dict[SensorType, DataQuality]:
+    def _assess_data_quality(self, readings: List[SensorReading]) -> Dict[SensorType, DataQuality]:
         """Assess quality of sensor readings"""
         quality_assessments = {}
         
@@ -375,7 +471,7 @@ class SEVESenseModule:
         
         return quality_assessments
     
-    async def _detect_anomalies(
+    def _detect_anomalies(
         self,
         readings: List[SensorReading],
         context: Optional[Dict[str, Any]] = None
@@ -403,7 +499,7 @@ class SEVESenseModule:
         
         return anomalies
     
-    async def _fuse_sensor_data(
+    def _fuse_sensor_data(
         self,
         readings: List[SensorReading],
         context: Optional[Dict[str, Any]] = None
@@ -434,15 +530,15 @@ class SEVESenseModule:
         
         # Fuse environmental data
         if environmental_readings:
-            fused_data["environmental"] = await self._fuse_environmental_data(environmental_readings)
+            fused_data["environmental"] = self._fuse_environmental_data(environmental_readings)
         
         # Fuse motion data
         if motion_readings:
-            fused_data["motion"] = await self._fuse_motion_data(motion_readings)
+            fused_data["motion"] = self._fuse_motion_data(motion_readings)
         
         # Fuse spatial data
         if spatial_readings:
-            fused_data["spatial"] = await self._fuse_spatial_data(spatial_readings)
+            fused_data["spatial"] = self._fuse_spatial_data(spatial_readings)
         
         # Add temporal information
         fused_data["temporal"] = {
@@ -462,7 +558,7 @@ class SEVESenseModule:
         
         return fused_data
     
-    async def _fuse_environmental_data(self, readings: List[SensorReading]) -> Dict[str, Any]:
+    def _fuse_environmental_data(self, readings: List[SensorReading]) -> Dict[str, Any]:
         """Fuse environmental sensor data"""
         environmental = {}
         
@@ -497,7 +593,7 @@ class SEVESenseModule:
         
         return environmental
     
-    async def _fuse_motion_data(self, readings: List[SensorReading]) -> Dict[str, Any]:
+    def _fuse_motion_data(self, readings: List[SensorReading]) -> Dict[str, Any]:
         """Fuse motion sensor data"""
         motion = {}
         
@@ -523,7 +619,7 @@ class SEVESenseModule:
         
         return motion
     
-    async def _fuse_spatial_data(self, readings: List[SensorReading]) -> Dict[str, Any]:
+    def _fuse_spatial_data(self, readings: List[SensorReading]) -> Dict[str, Any]:
         """Fuse spatial sensor data"""
         spatial = {}
         
@@ -558,7 +654,7 @@ class SEVESenseModule:
         
         return spatial
     
-    async def _calculate_quality_score(self, quality_assessments: Dict[SensorType, DataQuality]) -> float:
+    def _calculate_quality_score(self, quality_assessments: Dict[SensorType, DataQuality]) -> float:
         """Calculate overall data quality score"""
         if not quality_assessments:
             return 0.0
@@ -0,0 +1,485 @@
+"""
+SEVE Server - Built-in HTTP Serving Mode
+Symbiotic Ethical Vision Engine
+
+This module implements the asyncio HTTP server behind `seve serve`.
+Each worker process keeps one warm SEVEHybridFramework, groups
+concurrent /process requests into micro-batches, and shares the
+listening port with its sibling workers through SO_REUSEPORT.
+"""
+
+import asyncio
+import base64
+import dataclasses
+import json
+import logging
+import multiprocessing
+import signal
+import socket
+import time
+from collections import deque
+from enum import Enum
+from typing import Dict, List, Any, Optional, Tuple
+
+from .config import SEVEConfig
+from .core import SEVEHybridFramework, ProcessingResult, ProcessingStatus
+from .deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+HTTP_REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable"
+}
+
+class MicroBatcher:
+    """
+    Micro-Batcher
+    
+    Collects concurrent requests and hands them to
+    SEVEHybridFramework.process_batch together. A batch is dispatched
+    when it reaches max_batch_size or when its oldest request has
+    waited max_wait_ms, whichever comes first.
+    """
+    
+    def __init__(
+        self,
+        framework: SEVEHybridFramework,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_concurrent_batches: int = 1
+    ):
+        self.framework = framework
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        
+        self._pending: deque = deque()
+        self._wakeup = asyncio.Event()
+        self._batch_slots = asyncio.Semaphore(max_concurrent_batches)
+        self._collector: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+        
+        # Batching statistics
+        self.batches_dispatched = 0
+        self.items_dispatched = 0
+    
+    def start(self) -> None:
+        """Start collecting requests into batches"""
+        if self._collector is None:
+            self._collector = asyncio.ensure_future(self._collect())
+    
+    async def stop(self) -> None:
+        """Stop collecting and wait for batches already dispatched"""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+    
+    async def submit(self, input_data: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> ProcessingResult:
+        """
+        Queue one request for the next batch
+        
+        Args:
+            input_data: Input dictionary, as accepted by process_context
+            context: Optional request context
+        
+        Returns:
+            ProcessingResult for this request
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((input_data, context or {}, future))
+        self._wakeup.set()
+        return await future
+    
+    async def _collect(self) -> None:
+        """Form batches from pending requests and dispatch them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            
+            # The window opens when the first request of the batch arrives
+            window_end = loop.time() + self.max_wait_ms / 1000
+            while len(self._pending) < self.max_batch_size:
+                remaining = window_end - loop.time()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                if len(self._pending) >= self.max_batch_size:
+                    break
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            
+            batch = [self._pending.popleft() for _ in range(min(len(self._pending), self.max_batch_size))]
+            
+            await self._batch_slots.acquire()
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], Dict[str, Any], asyncio.Future]]) -> None:
+        """Run one batch through the framework and resolve its futures"""
+        try:
+            self.batches_dispatched += 1
+            self.items_dispatched += len(batch)
+            results = await self.framework.process_batch(
+                [input_data for input_data, _, _ in batch],
+                [context for _, context, _ in batch]
+            )
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logger.error(f"Error processing micro-batch of {len(batch)} requests: {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self._batch_slots.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        return {
+            "pending": len(self._pending),
+            "batches_dispatched": self.batches_dispatched,
+            "items_dispatched": self.items_dispatched,
+            "average_batch_size": (
+                self.items_dispatched / self.batches_dispatched if self.batches_dispatched else 0.0
+            ),
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms
+        }
+
+class SEVEServer:
+    """
+    SEVE HTTP Server
+    
+    Minimal HTTP/1.1 server with keep-alive, exposing:
+    
+    - POST /process: {"input": {...}, "context": {...}} -> ProcessingResult
+      (503 when admission control sheds the request)
+    - GET /health: readiness of this worker (503 until warmed up)
+    - GET /metrics: server, batching and framework statistics
+    
+    Visual input can be sent inline as {"visual": {"image_base64": ...}}.
+    Requests go through the framework's coalescing and admission
+    control before joining a micro-batch; the batch path applies the
+    result cache and per-request deadlines, and a request that fails
+    in its batch does not fail the others.
+    """
+    
+    MAX_BODY_BYTES = 32 * 1024 * 1024
+    
+    def __init__(self, config: SEVEConfig, framework: Optional[SEVEHybridFramework] = None):
+        self.config = config
+        self.framework = framework or SEVEHybridFramework(config)
+        self.batcher = MicroBatcher(
+            self.framework,
+            max_batch_size=config.batch_size,
+            max_wait_ms=config.api_batch_wait_ms,
+            max_concurrent_batches=config.max_workers
+        )
+        
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.is_ready = False
+        self.started_at: Optional[float] = None
+        
+        # Request statistics
+        self.requests_total = 0
+        self.requests_failed = 0
+    
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None) -> None:
+        """
+        Warm up the framework and start listening
+        
+        Args:
+            host: Interface to bind (defaults to config.api_host)
+            port: Port to bind (defaults to config.api_port; 0 picks a free port)
+        """
+        await self.framework.initialize()
+        if self.config.warmup_on_start:
+            await self.framework.warmup()
+        self.batcher.start()
+        
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            host if host is not None else self.config.api_host,
+            port if port is not None else self.config.api_port,
+            reuse_port=hasattr(socket, "SO_REUSEPORT")
+        )
+        self.started_at = time.time()
+        self.is_ready = True
+        logger.info(f"SEVE server listening on {self.address[0]}:{self.address[1]}")
+    
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host and port the server is bound to"""
+        return self._server.sockets[0].getsockname()[:2]
+    
+    async def serve_forever(self) -> None:
+        """Serve until the server is closed"""
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+    
+    async def close(self) -> None:
+        """Stop accepting requests, finish queued batches and release the framework"""
+        self.is_ready = False
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+        await self.framework.shutdown()
+        logger.info("SEVE server stopped")
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP requests on one connection until it closes"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    writer.write(self._render(400, {"error": "Malformed request line"}, False))
+                    break
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    writer.write(self._render(400, {"error": "Invalid Content-Length"}, False))
+                    break
+                if length > self.MAX_BODY_BYTES:
+                    writer.write(self._render(413, {"error": "Request body too large"}, False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+                
+                status, payload = await self._dispatch(method, path.split("?", 1)[0], body)
+                writer.write(self._render(status, payload, keep_alive))
+                await writer.drain()
+                
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        except Exception as e:
+            logger.error(f"Error handling connection: {e}")
+        finally:
+            writer.close()
+    
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        """Route a request to its handler"""
+        if method == "OPTIONS" and self.config.cors_enabled:
+            return 204, None
+        
+        routes = {
+            "/process": ("POST", self._handle_process),
+            "/health": ("GET", self._handle_health),
+            "/metrics": ("GET", self._handle_metrics)
+        }
+        if path not in routes:
+            return 404, {"error": f"Unknown path: {path}"}
+        
+        allowed_method, handler = routes[path]
+        if method != allowed_method:
+            return 405, {"error": f"{path} only accepts {allowed_method}"}
+        
+        try:
+            return await handler(body)
+        except Exception as e:
+            logger.error(f"Error handling {method} {path}: {e}")
+            self.requests_failed += 1
+            return 500, {"error": str(e)}
+    
+    async def _handle_process(self, body: bytes) -> Tuple[int, Any]:
+        """POST /process"""
+        self.requests_total += 1
+        try:
+            request = json.loads(body or b"{}")
+            input_data = _decode_input(request["input"])
+            context = request.get("context")
+            if context is not None and not isinstance(context, dict):
+                raise TypeError("context must be a JSON object")
+            Deadline.from_context(context)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.requests_failed += 1
+            return 400, {"error": f"Invalid request body: {e}"}
+        
+        result = await self.framework.coalesce(
+            input_data, context,
+            lambda: self.framework.admit(context, lambda: self.batcher.submit(input_data, context))
+        )
+        if result.status == ProcessingStatus.REJECTED:
+            return 503, result
+        return 200, result
+    
+    async def _handle_health(self, body: bytes) -> Tuple[int, Any]:
+        """GET /health"""
+        status = {
+            "status": "ok" if self.is_ready else "starting",
+            "uptime_s": time.time() - self.started_at if self.started_at else 0.0,
+            "warmup": self.framework.v3_core.warmup_report
+        }
+        return (200 if self.is_ready else 503), status
+    
+    async def _handle_metrics(self, body: bytes) -> Tuple[int, Any]:
+        """GET /metrics"""
+        return 200, {
+            "server": {
+                "requests_total": self.requests_total,
+                "requests_failed": self.requests_failed
+            },
+            "batching": self.batcher.get_stats(),
+            "framework": self.framework.get_status()
+        }
+    
+    def _render(self, status: int, payload: Any, keep_alive: bool) -> bytes:
+        """Render an HTTP response with a JSON body"""
+        body = b"" if payload is None else json.dumps(_to_jsonable(payload)).encode()
+        headers = [
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, 'Unknown')}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        if body:
+            headers.append("Content-Type: application/json")
+        if self.config.cors_enabled:
+            headers.extend([
+                "Access-Control-Allow-Origin: *",
+                "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+                "Access-Control-Allow-Headers: Content-Type"
+            ])
+        return ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
+
+def _decode_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the input and turn inline base64 images into encoded image bytes for the vision module"""
+    if not isinstance(input_data, dict):
+        raise TypeError("input must be a JSON object")
+    if "sensor" in input_data and not isinstance(input_data["sensor"], dict):
+        raise TypeError("sensor must be a JSON object")
+    
+    if "visual" not in input_data:
+        return input_data
+    visual = input_data["visual"]
+    if isinstance(visual, dict) and isinstance(visual.get("image_base64"), str):
+        return {**input_data, "visual": base64.b64decode(visual["image_base64"], validate=True)}
+    if not (isinstance(visual, str) or isinstance(visual, dict) and isinstance(visual.get("image_path"), str)):
+        raise TypeError("visual must be an image path, {\"image_path\": ...} or {\"image_base64\": ...}")
+    return input_data
+
+def _to_jsonable(value: Any) -> Any:
+    """Convert results to JSON-compatible values; image arrays are summarized, not returned"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: _to_jsonable(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, dict):
+        return {str(key): _to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_to_jsonable(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        return {"bytes": len(value)}
+    if hasattr(value, "shape") and hasattr(value, "dtype"):
+        if getattr(value, "ndim", 1) == 0:
+            return value.item()
+        return {"shape": list(value.shape), "dtype": str(value.dtype)}
+    return str(value)
+
+async def _serve_worker(config: SEVEConfig) -> None:
+    """Run one server process until SIGINT/SIGTERM"""
+    server = SEVEServer(config)
+    await server.start()
+    
+    loop = asyncio.get_running_loop()
+    serving = asyncio.ensure_future(server.serve_forever())
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, serving.cancel)
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers are unavailable on some platforms
+            pass
+    
+    try:
+        await serving
+    finally:
+        await server.close()
+
+def _run_worker(config: SEVEConfig) -> None:
+    """Process entry point for a server worker"""
+    try:
+        asyncio.run(_serve_worker(config))
+    except KeyboardInterrupt:
+        pass
+
+def serve(config: SEVEConfig) -> None:
+    """
+    Serve the framework over HTTP
+    
+    Starts config.api_workers processes that all bind
+    config.api_host:config.api_port with SO_REUSEPORT, so the kernel
+    balances connections between them. Each worker also sizes its own
+    stage executors from config.max_workers.
+    
+    Args:
+        config: Framework and API configuration
+    """
+    workers = config.api_workers
+    if workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+        logger.warning("SO_REUSEPORT is not available on this platform, serving with a single worker")
+        workers = 1
+    
+    if workers == 1:
+        _run_worker(config)
+        return
+    
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_run_worker, args=(config,), name=f"seve-api-{index}")
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {workers} SEVE server workers on {config.api_host}:{config.api_port}")
+    
+    # Treat SIGTERM like Ctrl-C so orchestrators can stop the worker group
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        logger.info("SEVE server workers stopped")
+
+def _raise_keyboard_interrupt(signum: int, frame: Any) -> None:
+    """Signal handler converting SIGTERM into KeyboardInterrupt"""
+    raise KeyboardInterrupt
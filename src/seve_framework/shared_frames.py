@@ -0,0 +1,254 @@
+"""
+SEVE Shared Frames - Zero-Copy Frame Transport Between Processes
+Symbiotic Ethical Vision Engine
+
+This module implements a ring of frame slots in shared memory. A frame
+is written into the ring once; afterwards only a small FrameHandle is
+passed to worker processes, which map the same memory instead of
+receiving a pickled copy of every image.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Any, Optional, Tuple
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+
+logger = logging.getLogger(__name__)
+
+# Header: slot count and slot size, then one generation counter per slot
+_HEADER_FIELDS = 2
+_COUNTER_BYTES = 8
+
+class StaleFrameError(RuntimeError):
+    """The ring slot a handle points to has been overwritten by a newer frame"""
+
+@dataclass(frozen=True)
+class FrameHandle:
+    """
+    Reference to a frame stored in a SharedFrameRing
+    
+    Handles are a few dozen bytes when pickled, so they are what
+    crosses process boundaries instead of the pixels.
+    """
+    ring_name: str
+    slot: int
+    generation: int
+    shape: Tuple[int, ...]
+    dtype: str
+    
+    @property
+    def nbytes(self) -> int:
+        """Size of the referenced frame in bytes"""
+        size = np.dtype(self.dtype).itemsize
+        for dim in self.shape:
+            size *= dim
+        return size
+
+class SharedFrameRing:
+    """
+    Shared Frame Ring
+    
+    Fixed number of equally sized slots in one shared memory block,
+    reused round-robin. Each slot carries a generation counter, so a
+    handle to a slot that has since been overwritten is detected
+    rather than silently reading another frame; size the ring to hold
+    every frame that can be in flight at once.
+    
+    The creating process owns the memory and must close() it (which
+    also unlinks it); other processes attach by name, usually through
+    resolve_frame().
+    """
+    
+    def __init__(
+        self,
+        slots: int = 8,
+        max_frame_bytes: int = 1920 * 1080 * 3,
+        name: Optional[str] = None,
+        _attach: bool = False
+    ):
+        if _attach:
+            self._shm = _attach_shared_memory(name)
+            header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=self._shm.buf)
+            slots, max_frame_bytes = int(header[0]), int(header[1])
+        else:
+            if slots < 1:
+                raise ValueError("slots must be at least 1")
+            if max_frame_bytes < 1:
+                raise ValueError("max_frame_bytes must be positive")
+            size = (_HEADER_FIELDS + slots) * _COUNTER_BYTES + slots * max_frame_bytes
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=self._shm.buf)
+            header[:] = (slots, max_frame_bytes)
+        
+        self.slots = slots
+        self.max_frame_bytes = max_frame_bytes
+        self.owner = not _attach
+        self._generations = np.ndarray(
+            (slots,), dtype=np.int64, buffer=self._shm.buf, offset=_HEADER_FIELDS * _COUNTER_BYTES
+        )
+        self._data_offset = (_HEADER_FIELDS + slots) * _COUNTER_BYTES
+        self._next_slot = 0
+        self._lock = threading.Lock()
+        
+        # Ring statistics
+        self.frames_written = 0
+        
+        # Handles to this ring resolve in this process without attaching again
+        _attached_rings[self.name] = self
+    
+    @classmethod
+    def attach(cls, name: str) -> 'SharedFrameRing':
+        """Map a ring created by another process"""
+        return cls(name=name, _attach=True)
+    
+    @property
+    def name(self) -> str:
+        """Shared memory block name, used by other processes to attach"""
+        return self._shm.name
+    
+    def allocate(self, shape: Tuple[int, ...], dtype: Any = "uint8") -> Tuple[FrameHandle, Any]:
+        """
+        Reserve the next slot for a frame written in place
+        
+        Decoders can fill the returned array directly, so the frame is
+        written exactly once.
+        
+        Args:
+            shape: Frame shape, e.g. (1080, 1920, 3)
+            dtype: Frame dtype
+        
+        Returns:
+            Tuple of (handle, writable array backed by the slot)
+        """
+        dtype = np.dtype(dtype)
+        nbytes = dtype.itemsize
+        for dim in shape:
+            nbytes *= dim
+        if nbytes > self.max_frame_bytes:
+            raise ValueError(f"Frame of {nbytes} bytes exceeds the ring slot size of {self.max_frame_bytes}")
+        
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot = (slot + 1) % self.slots
+            self._generations[slot] += 1
+            generation = int(self._generations[slot])
+            self.frames_written += 1
+        
+        handle = FrameHandle(self.name, slot, generation, tuple(int(dim) for dim in shape), dtype.str)
+        return handle, self._view(handle)
+    
+    def put(self, frame: Any) -> FrameHandle:
+        """
+        Copy a frame into the next slot
+        
+        Args:
+            frame: numpy array
+        
+        Returns:
+            Handle to the stored frame
+        """
+        frame = np.asarray(frame)
+        handle, view = self.allocate(frame.shape, frame.dtype)
+        view[...] = frame
+        return handle
+    
+    def get(self, handle: FrameHandle) -> Any:
+        """
+        Get a frame as an array backed by shared memory, without copying
+        
+        Raises:
+            StaleFrameError: If the slot has been reused for a newer frame
+        """
+        if not self.is_current(handle):
+            raise StaleFrameError(
+                f"Frame slot {handle.slot} of ring {handle.ring_name} was overwritten"
+            )
+        return self._view(handle)
+    
+    def is_current(self, handle: FrameHandle) -> bool:
+        """Whether the handle's slot still holds the frame it was created for"""
+        return int(self._generations[handle.slot]) == handle.generation
+    
+    def _view(self, handle: FrameHandle) -> Any:
+        """Array over a slot's memory"""
+        return np.ndarray(
+            handle.shape,
+            dtype=np.dtype(handle.dtype),
+            buffer=self._shm.buf,
+            offset=self._data_offset + handle.slot * self.max_frame_bytes
+        )
+    
+    def close(self) -> None:
+        """Unmap the ring, and free the shared memory when this process created it"""
+        _attached_rings.pop(self.name, None)
+        self._generations = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Arrays handed out by get() still reference the mapping; it is
+            # released with them, and unlinking below still frees the block
+            logger.warning(f"Shared frame ring {self.name} closed while frames are still referenced")
+        if self.owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+    
+    def __enter__(self) -> 'SharedFrameRing':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ring statistics"""
+        return {
+            "name": self.name,
+            "slots": self.slots,
+            "max_frame_bytes": self.max_frame_bytes,
+            "frames_written": self.frames_written,
+            "owner": self.owner
+        }
+
+# Rings this process has mapped, by shared memory name
+_attached_rings: Dict[str, SharedFrameRing] = {}
+_attach_lock = threading.Lock()
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Map an existing block without taking responsibility for unlinking it"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching also registers the block with the resource
+    # tracker; worker processes share their parent's tracker, where the
+    # block is already registered, so this is harmless for them
+    return shared_memory.SharedMemory(name=name)
+
+def resolve_frame(handle: FrameHandle) -> Any:
+    """
+    Get the array for a handle, attaching to its ring on first use
+    
+    Works in any process: rings are known to the process that created
+    them, and other processes map them by name the first time they see
+    one of their handles.
+    
+    Args:
+        handle: Frame handle
+    
+    Returns:
+        Array backed by shared memory (no copy)
+    """
+    ring = _attached_rings.get(handle.ring_name)
+    if ring is None:
+        with _attach_lock:
+            ring = _attached_rings.get(handle.ring_name)
+            if ring is None:
+                ring = SharedFrameRing.attach(handle.ring_name)
+    return ring.get(handle)
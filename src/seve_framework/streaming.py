@@ -0,0 +1,274 @@
+"""
+SEVE Streaming Pipeline - Pipelined Frame Processing
+Symbiotic Ethical Vision Engine
+
+This module implements the streaming mode of the v3.0 pipeline.
+Vision, sense, ethics and link run as independent stages connected by
+bounded queues, so each stage works on the next frame while the
+following stage handles the current one.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Any, Optional, Tuple, Union, AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+
+from .config import BackpressurePolicy
+from .core import SEVECoreV3, ProcessingResult, ProcessingStatus, _is_compliant
+from .deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of the stream as it travels through the stage queues
+_END_OF_STREAM = object()
+
+@dataclass
+class StreamItem:
+    """A frame travelling through the streaming pipeline"""
+    sequence: int
+    input_data: Dict[str, Any]
+    context: Dict[str, Any]
+    start_time: float = field(default_factory=time.time)
+    deadline: Optional[Deadline] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    vision_results: Any = field(default_factory=dict)
+    sense_results: Any = field(default_factory=dict)
+    fused_data: Dict[str, Any] = field(default_factory=dict)
+    ethics_assessments: List[Any] = field(default_factory=list)
+    result: Optional[ProcessingResult] = None
+
+class StreamingPipeline:
+    """
+    Streaming Pipeline
+    
+    Connects the v3.0 stages with bounded asyncio queues. Every stage
+    has a single worker, so frames leave the pipeline in input order;
+    frames discarded by the backpressure policy are counted and never
+    yielded. When the core's stage graph has custom stages, which the
+    fixed stages below know nothing of, the whole graph runs as a
+    single stage.
+    """
+    
+    STAGES = ("vision", "sense", "ethics", "link")
+    
+    def __init__(
+        self,
+        core: SEVECoreV3,
+        queue_size: Optional[int] = None,
+        policy: Optional[BackpressurePolicy] = None
+    ):
+        self.core = core
+        self.queue_size = queue_size or core.config.stream_queue_size
+        self.policy = policy or core.config.stream_backpressure
+        
+        # Stream statistics
+        self.frames_received = 0
+        self.frames_emitted = 0
+        self.frames_dropped = 0
+        
+        self._source_error: Optional[BaseException] = None
+    
+    async def run(
+        self,
+        source: AsyncIterable[Union[Dict[str, Any], Tuple[Dict[str, Any], Dict[str, Any]]]],
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[ProcessingResult]:
+        """
+        Run frames from an async iterable through the pipeline
+        
+        Args:
+            source: Async iterable of input dictionaries, or of
+                (input_data, context) tuples for per-frame context
+            context: Context shared by frames that don't carry their own
+        
+        Yields:
+            ProcessingResult for every frame that was not dropped, in input order
+        """
+        if not self.core.is_initialized:
+            await self.core.initialize()
+        
+        if self.core._custom_stages():
+            stage_handlers = [self._run_graph]
+        else:
+            stage_handlers = [self._run_vision, self._run_sense, self._run_ethics, self._run_link]
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(len(stage_handlers) + 1)]
+        
+        tasks = [asyncio.ensure_future(self._feed(source, context or {}, queues[0]))]
+        for index, handler in enumerate(stage_handlers):
+            tasks.append(asyncio.ensure_future(
+                self._stage_worker(handler, queues[index], queues[index + 1])
+            ))
+        
+        try:
+            while True:
+                item = await queues[-1].get()
+                if item is _END_OF_STREAM:
+                    break
+                self.frames_emitted += 1
+                yield item.result
+            
+            if self._source_error is not None:
+                raise self._source_error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get streaming statistics"""
+        return {
+            "frames_received": self.frames_received,
+            "frames_emitted": self.frames_emitted,
+            "frames_dropped": self.frames_dropped,
+            "queue_size": self.queue_size,
+            "backpressure_policy": self.policy.value
+        }
+    
+    async def _feed(
+        self,
+        source: AsyncIterable[Any],
+        context: Dict[str, Any],
+        queue: asyncio.Queue
+    ) -> None:
+        """Pull frames from the source into the first stage queue"""
+        try:
+            async for entry in source:
+                if isinstance(entry, tuple):
+                    input_data, frame_context = entry
+                else:
+                    input_data, frame_context = entry, context
+                
+                item = StreamItem(
+                    sequence=self.frames_received,
+                    input_data=input_data,
+                    context=frame_context or {},
+                    deadline=self.core._request_deadline(frame_context)
+                )
+                self.frames_received += 1
+                await self._put(queue, item)
+        except Exception as e:
+            logger.error(f"Error reading stream source: {e}")
+            self._source_error = e
+        finally:
+            await queue.put(_END_OF_STREAM)
+    
+    async def _stage_worker(self, handler, in_queue: asyncio.Queue, out_queue: asyncio.Queue) -> None:
+        """Apply one stage to every frame, forwarding finished frames untouched"""
+        while True:
+            item = await in_queue.get()
+            if item is _END_OF_STREAM:
+                await out_queue.put(_END_OF_STREAM)
+                return
+            
+            if item.result is None:
+                try:
+                    await handler(item)
+                except Exception as e:
+                    logger.error(f"Error processing stream frame {item.sequence}: {e}")
+                    item.result = ProcessingResult(
+                        status=ProcessingStatus.FAILED,
+                        data=item.input_data,
+                        metadata={"sequence": item.sequence, "stage_timings_ms": item.stage_timings},
+                        processing_time_ms=(time.time() - item.start_time) * 1000,
+                        errors=[str(e)]
+                    )
+            
+            await self._put(out_queue, item)
+    
+    async def _put(self, queue: asyncio.Queue, item: StreamItem) -> None:
+        """Enqueue a frame, applying the backpressure policy when the queue is full"""
+        if self.policy == BackpressurePolicy.BLOCK or not queue.full():
+            await queue.put(item)
+            return
+        
+        self.frames_dropped += 1
+        if self.policy == BackpressurePolicy.DROP_NEWEST:
+            logger.debug(f"Stream queue full, dropping frame {item.sequence}")
+            return
+        
+        dropped = queue.get_nowait()
+        logger.debug(f"Stream queue full, dropping frame {dropped.sequence}")
+        queue.put_nowait(item)
+    
+    async def _run_graph(self, item: StreamItem) -> None:
+        """Whole stage graph, custom stages included"""
+        item.result = await self.core._run_pipeline(item.input_data, item.context)
+        item.result.metadata["sequence"] = item.sequence
+    
+    async def _run_vision(self, item: StreamItem) -> None:
+        """Vision stage"""
+        if "visual" in item.input_data:
+            item.vision_results = await self.core._timed_stage(
+                "vision",
+                self.core.vision_module.process_visual_input(
+                    item.input_data["visual"], self.core._stage_context(item.context, item.deadline, "vision")
+                ),
+                item.stage_timings
+            )
+    
+    async def _run_sense(self, item: StreamItem) -> None:
+        """Sense stage"""
+        if "sensor" in item.input_data:
+            item.sense_results = await self.core._timed_stage(
+                "sense",
+                self.core.sense_module.process_sensor_input(
+                    item.input_data["sensor"], self.core._stage_context(item.context, item.deadline, "sense")
+                ),
+                item.stage_timings
+            )
+    
+    async def _run_ethics(self, item: StreamItem) -> None:
+        """Fusion and ethics stage"""
+        item.fused_data = {
+            "visual": item.vision_results,
+            "sensor": item.sense_results,
+            "context": item.context,
+            "timestamp": time.time()
+        }
+        item.ethics_assessments = await self.core._timed_stage(
+            "ethics",
+            self.core.ethics_module.validate_decision(
+                item.fused_data, self.core._stage_context(None, item.deadline, "ethics")
+            ),
+            item.stage_timings
+        )
+        
+        if not all(_is_compliant(assessment) for assessment in item.ethics_assessments):
+            logger.warning(f"Stream frame {item.sequence} blocked by ethical validation")
+            item.result = ProcessingResult(
+                status=ProcessingStatus.ETHICS_BLOCKED,
+                data=item.fused_data,
+                metadata={
+                    "sequence": item.sequence,
+                    "stage_timings_ms": item.stage_timings,
+                    **self.core._deadline_metadata(item.deadline)
+                },
+                ethics_assessments=item.ethics_assessments,
+                processing_time_ms=(time.time() - item.start_time) * 1000
+            )
+    
+    async def _run_link(self, item: StreamItem) -> None:
+        """Link stage"""
+        transmission_success = await self.core._timed_stage(
+            "link",
+            self.core.link_module.transmit_output(item.fused_data, item.context),
+            item.stage_timings
+        )
+        self.core.processing_count += 1
+        
+        item.result = ProcessingResult(
+            status=ProcessingStatus.PARTIAL if item.deadline and item.deadline.skipped else ProcessingStatus.COMPLETED,
+            data=item.fused_data,
+            metadata={
+                "sequence": item.sequence,
+                "processing_count": self.core.processing_count,
+                "transmission_success": transmission_success,
+                "vision_processed": bool(item.vision_results),
+                "sensor_processed": bool(item.sense_results),
+                "stage_timings_ms": item.stage_timings,
+                **self.core._deadline_metadata(item.deadline)
+            },
+            processing_time_ms=(time.time() - item.start_time) * 1000,
+            ethics_assessments=item.ethics_assessments
+        )
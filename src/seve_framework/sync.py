@@ -0,0 +1,204 @@
+"""
+SEVE Sync Facade - Blocking API over a Persistent Event Loop
+Symbiotic Ethical Vision Engine
+
+This module implements a synchronous wrapper around
+SEVEHybridFramework for batch jobs and command line tools. Instead of
+calling asyncio.run() per item, which creates a new event loop and
+HTTP client every time, the wrapper keeps one loop running in a
+background thread and submits every call to it.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Dict, Any, Awaitable, Callable, List, Optional
+
+from .config import SEVEConfig
+
+logger = logging.getLogger(__name__)
+
+class SyncSEVEFramework:
+    """
+    Synchronous SEVE Framework
+    
+    Owns an event loop running in a daemon thread and a framework
+    living on that loop. The blocking methods are thread-safe: any
+    number of caller threads can submit work concurrently, and their
+    requests run interleaved on the shared loop just like concurrent
+    async callers would.
+    
+    Use it as a context manager, or call close() when done, so the
+    framework shuts down and the HTTP client is closed.
+    """
+    
+    def __init__(
+        self,
+        config: SEVEConfig,
+        metrics_collector: Optional[Any] = None,
+        framework: Optional[Any] = None,
+        initialize: bool = True
+    ):
+        """
+        Start the background loop and set up the framework on it
+        
+        Args:
+            config: Framework configuration
+            metrics_collector: Metrics collector passed to the framework
+            framework: Existing framework to drive instead of building one
+            initialize: Initialize the framework before returning
+        """
+        self.config = config
+        self._closed = False
+        self._close_lock = threading.Lock()
+        
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="seve-sync-loop", daemon=True)
+        self._thread.start()
+        
+        try:
+            self.framework = framework or self._run(self._create(config, metrics_collector))
+            if initialize:
+                self._run(self.framework.initialize())
+        except BaseException:
+            self._stop_loop()
+            raise
+        
+        logger.info("SEVE sync facade started")
+    
+    def _run_loop(self) -> None:
+        """Thread target: run the event loop until stopped"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+    
+    @staticmethod
+    async def _create(config: SEVEConfig, metrics_collector: Optional[Any]) -> Any:
+        """Build the framework on the loop, so its asyncio state belongs to it"""
+        from .core import SEVEHybridFramework
+        return SEVEHybridFramework(config, metrics_collector)
+    
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the background loop without waiting
+        
+        Args:
+            coro: Coroutine to run, usually a framework method call
+        
+        Returns:
+            concurrent.futures.Future resolving to the coroutine's result
+        """
+        if self._closed:
+            coro.close()
+            raise RuntimeError("SyncSEVEFramework is closed")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def _run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the background loop and block for its result"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Blocking SyncSEVEFramework calls cannot be made from its own event loop")
+        
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+    
+    def process(
+        self,
+        input_data: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+        use_universal: Optional[bool] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Process one input, blocking until the result is ready
+        
+        Args:
+            input_data: Input data dictionary
+            context: Additional context
+            use_universal: Force Universal mode (None = auto-detect)
+            timeout: Seconds to wait before cancelling the request
+        
+        Returns:
+            ProcessingResult
+        """
+        return self._run(self.framework.process_context(input_data, context, use_universal), timeout)
+    
+    def process_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        use_universal: Optional[bool] = None,
+        timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Process a list of inputs, blocking until every result is ready
+        
+        Args:
+            inputs: Input data dictionaries
+            contexts: Optional per-input contexts
+            use_universal: Force Universal mode (None = auto-detect)
+            timeout: Seconds to wait before cancelling the batch
+        
+        Returns:
+            List of ProcessingResult, in input order
+        """
+        return self._run(self.framework.process_batch(inputs, contexts, use_universal), timeout)
+    
+    def call(self, func: Callable[..., Awaitable[Any]], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """
+        Run any framework coroutine function on the background loop
+        
+        Args:
+            func: Coroutine function, e.g. framework.process_stream helpers
+            *args: Positional arguments for func
+            timeout: Seconds to wait before cancelling the call
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            The coroutine's result
+        """
+        return self._run(func(*args, **kwargs), timeout)
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get framework status, read on the loop thread"""
+        return self._run(self._status())
+    
+    async def _status(self) -> Dict[str, Any]:
+        """Collect the framework status together with the loop state"""
+        return {**self.framework.get_status(), "sync_loop_running": self._loop.is_running()}
+    
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        Shut down the framework and stop the background loop
+        
+        Args:
+            timeout: Seconds to wait for the framework shutdown
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            try:
+                self._run(self.framework.shutdown(), timeout)
+            except Exception as e:
+                logger.error(f"Error shutting down framework: {e}")
+            finally:
+                self._closed = True
+                self._stop_loop()
+        
+        logger.info("SEVE sync facade closed")
+    
+    def _stop_loop(self) -> None:
+        """Stop the loop, join its thread and close it"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+    
+    def __enter__(self) -> 'SyncSEVEFramework':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
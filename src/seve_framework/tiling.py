@@ -0,0 +1,108 @@
+"""
+SEVE Tiling - Tiled Detection on Very Large Images
+Symbiotic Ethical Vision Engine
+
+This module implements the geometry behind the vision module's tiling
+mode. Large frames are split into overlapping tiles that the detectors
+process concurrently; objects cut by one tile's border are whole in its
+neighbour, and non-maximum suppression keeps one detection per object
+where tiles overlap.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Box = Tuple[int, int, int, int]
+
+def _tile_starts(length: int, tile_size: int, overlap: int) -> List[int]:
+    """Start positions of tiles along one side; the last tile ends at the border"""
+    if length <= tile_size:
+        return [0]
+    starts = list(range(0, length - tile_size, tile_size - overlap))
+    starts.append(length - tile_size)
+    return starts
+
+def tile_boxes(width: int, height: int, tile_size: int, overlap: int) -> List[Box]:
+    """
+    Split a width x height area into overlapping tiles
+    
+    Neighbouring tiles share at least overlap pixels, so any object no
+    larger than the overlap lies entirely inside some tile. Tiles at the
+    right and bottom borders are moved inwards rather than shrunk.
+    
+    Args:
+        width: Area width in pixels
+        height: Area height in pixels
+        tile_size: Side of a tile in pixels
+        overlap: Pixels shared by neighbouring tiles (less than tile_size)
+    
+    Returns:
+        (x, y, width, height) tiles, row by row
+    """
+    if not 0 <= overlap < tile_size:
+        raise ValueError("overlap must be non-negative and smaller than tile_size")
+    
+    tile_w, tile_h = min(tile_size, width), min(tile_size, height)
+    return [
+        (x, y, tile_w, tile_h)
+        for y in _tile_starts(height, tile_size, overlap)
+        for x in _tile_starts(width, tile_size, overlap)
+    ]
+
+def overlap_ratio(first: Box, second: Box) -> float:
+    """
+    Intersection of two (x, y, width, height) boxes over the smaller box
+    
+    Unlike IoU this is 1.0 when one box lies inside the other, which is
+    how a fragment seen at a tile border relates to the whole object.
+    """
+    ax, ay, aw, ah = first
+    bx, by, bw, bh = second
+    overlap_w = min(ax + aw, bx + bw) - max(ax, bx)
+    overlap_h = min(ay + ah, by + bh) - max(ay, by)
+    if overlap_w <= 0 or overlap_h <= 0:
+        return 0.0
+    return overlap_w * overlap_h / float(min(aw * ah, bw * bh))
+
+def enclosing_box(boxes: Iterable[Box]) -> Box:
+    """Smallest (x, y, width, height) box containing all the boxes"""
+    boxes = list(boxes)
+    left = min(x for x, _, _, _ in boxes)
+    top = min(y for _, y, _, _ in boxes)
+    right = max(x + w for x, _, w, _ in boxes)
+    bottom = max(y + h for _, y, _, h in boxes)
+    return (left, top, right - left, bottom - top)
+
+def non_max_suppression(boxes: Sequence[Box], scores: Sequence[float], threshold: float) -> Dict[int, List[int]]:
+    """
+    Select boxes so that no two kept boxes overlap by more than threshold
+    
+    Boxes are visited by descending score, larger boxes first among
+    equal scores, and suppressed by the first kept box they overlap by
+    more than threshold (measured with overlap_ratio()).
+    
+    Args:
+        boxes: (x, y, width, height) boxes
+        scores: Confidence of each box
+        threshold: Largest overlap ratio two kept boxes may have
+    
+    Returns:
+        Index of each kept box, best first, mapped to the indices of the
+        boxes it suppressed
+    """
+    order = sorted(
+        range(len(boxes)),
+        key=lambda index: (scores[index], boxes[index][2] * boxes[index][3]),
+        reverse=True
+    )
+    kept: Dict[int, List[int]] = {}
+    for index in order:
+        for other, suppressed in kept.items():
+            if overlap_ratio(boxes[index], boxes[other]) > threshold:
+                suppressed.append(index)
+                break
+        else:
+            kept[index] = []
+    return kept
@@ -0,0 +1,252 @@
+"""
+SEVE Tracking - Detection Tracking Across Video Frames
+Symbiotic Ethical Vision Engine
+
+This module implements the tracker behind the vision module's tracking
+mode. The full detectors run only on keyframes (every N frames, or when
+the scene changes); in between, the boxes of the last keyframe are
+carried forward with sparse optical flow, and detections keep a stable
+track ID and pseudonym from frame to frame.
+"""
+
+# Annotations name numpy types, which must not force that import
+from __future__ import annotations
+
+import dataclasses
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+
+from .lazy import lazy_import
+from .planes import FramePlanes
+from .video import frame_signature, mean_abs_difference
+
+if TYPE_CHECKING:
+    from .vision import Detection
+
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+# Feature points followed per tracked box
+POINTS_PER_TRACK = 12
+
+def iou(first: Tuple[int, int, int, int], second: Tuple[int, int, int, int]) -> float:
+    """Intersection over union of two (x, y, width, height) boxes"""
+    ax, ay, aw, ah = first
+    bx, by, bw, bh = second
+    overlap_w = min(ax + aw, bx + bw) - max(ax, bx)
+    overlap_h = min(ay + ah, by + bh) - max(ay, by)
+    if overlap_w <= 0 or overlap_h <= 0:
+        return 0.0
+    intersection = overlap_w * overlap_h
+    return intersection / float(aw * ah + bw * bh - intersection)
+
+@dataclass
+class Track:
+    """A detection followed across frames"""
+    track_id: int
+    detection: Detection
+    frames_since_detection: int = 0
+
+class DetectionTracker:
+    """
+    Detection Tracker
+    
+    Decides per frame whether the detectors must run, assigns stable
+    IDs to keyframe detections by greedy IoU matching against the
+    current tracks, and moves the tracked boxes between keyframes by
+    the median Lucas-Kanade flow of feature points inside each box.
+    
+    One tracker follows one video stream; it is driven by a single
+    task at a time.
+    """
+    
+    def __init__(
+        self,
+        detection_interval: int = 10,
+        scene_change_threshold: float = 12.0,
+        iou_threshold: float = 0.3,
+        flow_height: int = 360
+    ):
+        if detection_interval < 1:
+            raise ValueError("detection_interval must be at least 1")
+        
+        self.detection_interval = detection_interval
+        self.scene_change_threshold = scene_change_threshold
+        self.iou_threshold = iou_threshold
+        self.flow_height = flow_height
+        
+        self.tracks: List[Track] = []
+        self._next_track_id = 1
+        self._frames_since_keyframe = 0
+        self._keyframe_signature = None
+        self._previous_gray = None
+        self._previous_scale: Tuple[float, float] = (1.0, 1.0)
+        
+        # Tracker statistics
+        self.keyframes = 0
+        self.tracked_frames = 0
+        self.scene_changes = 0
+    
+    def needs_detection(self, planes: FramePlanes) -> bool:
+        """Whether the detectors must run on this frame"""
+        if self._keyframe_signature is None or self._frames_since_keyframe + 1 >= self.detection_interval:
+            return True
+        
+        signature = frame_signature(planes["gray"])
+        if mean_abs_difference(signature, self._keyframe_signature) > self.scene_change_threshold:
+            self.scene_changes += 1
+            return True
+        return False
+    
+    def update(self, planes: FramePlanes, detections: List[Detection]) -> List[Detection]:
+        """
+        Adopt a keyframe's detections
+        
+        Detections overlapping a track of the same type by at least
+        iou_threshold continue that track (its ID and pseudonym); the
+        others start new tracks, and unmatched tracks end.
+        
+        Args:
+            planes: Planes of the keyframe
+            detections: Full detector output for the keyframe
+        
+        Returns:
+            The detections, each with metadata["track_id"] set
+        """
+        pairs = sorted(
+            (
+                (iou(track.detection.bbox, detection.bbox), t, d)
+                for t, track in enumerate(self.tracks)
+                for d, detection in enumerate(detections)
+                if track.detection.type == detection.type
+            ),
+            key=lambda pair: pair[0],
+            reverse=True
+        )
+        
+        matched: Dict[int, Track] = {}
+        used_tracks = set()
+        for overlap, t, d in pairs:
+            if overlap < self.iou_threshold:
+                break
+            if t in used_tracks or d in matched:
+                continue
+            used_tracks.add(t)
+            matched[d] = self.tracks[t]
+        
+        tracks = []
+        for d, detection in enumerate(detections):
+            track = matched.get(d)
+            if track is None:
+                track = Track(self._next_track_id, detection)
+                self._next_track_id += 1
+            elif detection.pseudonym is None:
+                detection.pseudonym = track.detection.pseudonym
+            track.detection = detection
+            track.frames_since_detection = 0
+            detection.metadata["track_id"] = track.track_id
+            tracks.append(track)
+        
+        self.tracks = tracks
+        self._frames_since_keyframe = 0
+        self._keyframe_signature = frame_signature(planes["gray"])
+        self._remember(planes)
+        self.keyframes += 1
+        return detections
+    
+    def propagate(self, planes: FramePlanes) -> List[Detection]:
+        """
+        Carry the tracked boxes into a frame without running the detectors
+        
+        Args:
+            planes: Planes of the current frame
+        
+        Returns:
+            One detection per track, moved by the optical flow inside its box
+        """
+        flow_planes = planes.scaled(self.flow_height)
+        gray = flow_planes["gray"]
+        shifts = self._box_shifts(gray, flow_planes.scale)
+        
+        height, width = planes.shape[:2]
+        detections = []
+        for track, (dx, dy) in zip(self.tracks, shifts):
+            x, y, w, h = track.detection.bbox
+            x = int(min(max(0, round(x + dx)), max(0, width - w)))
+            y = int(min(max(0, round(y + dy)), max(0, height - h)))
+            detection = dataclasses.replace(
+                track.detection,
+                bbox=(x, y, w, h),
+                anonymized=False,
+                metadata=dict(track.detection.metadata, tracked=True)
+            )
+            track.detection = detection
+            track.frames_since_detection += 1
+            detections.append(detection)
+        
+        self._previous_gray = gray
+        self._previous_scale = flow_planes.scale
+        self._frames_since_keyframe += 1
+        self.tracked_frames += 1
+        return detections
+    
+    def _remember(self, planes: FramePlanes) -> None:
+        """Keep the flow-resolution grayscale plane to track from"""
+        flow_planes = planes.scaled(self.flow_height)
+        self._previous_gray = flow_planes["gray"]
+        self._previous_scale = flow_planes.scale
+    
+    def _box_shifts(self, gray: np.ndarray, scale: Tuple[float, float]) -> List[Tuple[float, float]]:
+        """Median flow of each track's box from the previous frame, in full-frame pixels"""
+        shifts = [(0.0, 0.0)] * len(self.tracks)
+        previous = self._previous_gray
+        if previous is None or previous.shape != gray.shape or not self.tracks:
+            return shifts
+        
+        scale_x, scale_y = self._previous_scale
+        points, owners = [], []
+        for index, track in enumerate(self.tracks):
+            x, y, w, h = track.detection.bbox
+            left, top = int(x * scale_x), int(y * scale_y)
+            right = min(previous.shape[1], int((x + w) * scale_x) + 1)
+            bottom = min(previous.shape[0], int((y + h) * scale_y) + 1)
+            if right - left < 3 or bottom - top < 3:
+                continue
+            
+            corners = cv2.goodFeaturesToTrack(
+                previous[top:bottom, left:right], POINTS_PER_TRACK, 0.01, 3
+            )
+            if corners is None:
+                continue
+            corners = corners.reshape(-1, 2) + (left, top)
+            points.append(corners)
+            owners.extend([index] * len(corners))
+        
+        if not points:
+            return shifts
+        
+        start = np.concatenate(points).astype(np.float32).reshape(-1, 1, 2)
+        end, status, _ = cv2.calcOpticalFlowPyrLK(previous, gray, start, None)
+        moves = (end - start).reshape(-1, 2)
+        found = status.reshape(-1).astype(bool)
+        owners = np.asarray(owners)
+        
+        for index in range(len(self.tracks)):
+            selected = found & (owners == index)
+            if selected.any():
+                dx, dy = np.median(moves[selected], axis=0)
+                shifts[index] = (float(dx) / scale[0], float(dy) / scale[1])
+        return shifts
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker statistics"""
+        return {
+            "active_tracks": len(self.tracks),
+            "keyframes": self.keyframes,
+            "tracked_frames": self.tracked_frames,
+            "scene_changes": self.scene_changes,
+            "detection_interval": self.detection_interval
+        }
@@ -0,0 +1,216 @@
+"""
+SEVE Video - Video File and Stream Ingestion
+Symbiotic Ethical Vision Engine
+
+This module implements the frame source behind
+SEVEVisionModule.process_video. Frames are decoded on a background
+thread, thinned by a frame stride and a minimum sampling interval, and
+near-duplicates of the last delivered frame are dropped with a cheap
+thumbnail comparison before any detector sees them.
+"""
+
+# Annotations name numpy types, which must not force that import
+from __future__ import annotations
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Any, AsyncIterator, Optional, Tuple, Union
+
+from .lazy import lazy_import
+
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+logger = logging.getLogger(__name__)
+
+# Side of the grayscale thumbnail compared for near-duplicates
+SIGNATURE_SIZE = 32
+
+# Marks the end of the decoded frames in the queue
+_END = object()
+
+def frame_signature(frame: np.ndarray) -> np.ndarray:
+    """
+    Small grayscale thumbnail used to compare frames
+    
+    The frame is subsampled before resizing, so the cost stays far
+    below one full-frame pass.
+    """
+    step = max(1, min(frame.shape[:2]) // (SIGNATURE_SIZE * 4))
+    sample = np.ascontiguousarray(frame[::step, ::step])
+    if sample.ndim == 3:
+        sample = cv2.cvtColor(sample, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(sample, (SIGNATURE_SIZE, SIGNATURE_SIZE), interpolation=cv2.INTER_AREA).astype(np.int16)
+
+def mean_abs_difference(first: np.ndarray, second: np.ndarray) -> float:
+    """Mean absolute difference of two signatures, in gray levels"""
+    return float(np.abs(first - second).mean())
+
+class VideoReader:
+    """
+    Video Reader
+    
+    Decodes a video file or capture device on a daemon thread into a
+    bounded queue, so decoding overlaps with detection and a slow
+    consumer holds the decoder back instead of buffering the video.
+    
+    Skipped frames are grabbed but not decoded into arrays where the
+    backend allows it. Iterate with frames(); the decoder stops when
+    iteration ends, or on stop().
+    """
+    
+    def __init__(
+        self,
+        source: Union[str, int],
+        stride: int = 1,
+        sample_interval_s: float = 0.0,
+        dedup_threshold: float = 0.0,
+        queue_size: int = 8
+    ):
+        if stride < 1:
+            raise ValueError("stride must be at least 1")
+        if sample_interval_s < 0:
+            raise ValueError("sample_interval_s must be non-negative")
+        if dedup_threshold < 0:
+            raise ValueError("dedup_threshold must be non-negative")
+        
+        self.source = source
+        self.stride = stride
+        self.sample_interval_s = sample_interval_s
+        self.dedup_threshold = dedup_threshold
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        
+        # Reader statistics
+        self.frames_read = 0
+        self.frames_delivered = 0
+        self.frames_skipped = 0
+        self.duplicates_skipped = 0
+    
+    def start(self) -> None:
+        """Open the source and start decoding"""
+        if self._thread is not None:
+            return
+        
+        capture = cv2.VideoCapture(self.source)
+        if not capture.isOpened():
+            capture.release()
+            raise ValueError(f"Could not open video source: {self.source}")
+        
+        self._thread = threading.Thread(
+            target=self._decode, args=(capture,), name="seve-video-decoder", daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop decoding and release the source"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        
+        # Wake a consumer still waiting on the queue
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put_nowait(_END)
+    
+    async def frames(self) -> AsyncIterator[Tuple[int, float, np.ndarray]]:
+        """
+        Iterate over the sampled frames
+        
+        Yields:
+            Tuple of (frame index in the source, timestamp in seconds,
+            BGR frame)
+        
+        Raises:
+            Exception: Whatever made decoding fail
+        """
+        # Opening a capture device can block for a while
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.start)
+        try:
+            while True:
+                item = await loop.run_in_executor(None, self._queue.get)
+                if item is _END:
+                    break
+                yield item
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.stop()
+    
+    def _decode(self, capture: Any) -> None:
+        """Decoder thread: read, sample and deduplicate frames"""
+        started = time.monotonic()
+        index = -1
+        next_sample_time = 0.0
+        last_signature = None
+        try:
+            while not self._stop.is_set():
+                if not capture.grab():
+                    break
+                index += 1
+                self.frames_read += 1
+                
+                # Files report the frame's own timestamp; live devices may not
+                position = capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+                timestamp = position if position > 0 or index == 0 else time.monotonic() - started
+                
+                # Container timestamps carry rounding error; allow a millisecond
+                if index % self.stride or timestamp < next_sample_time - 0.001:
+                    self.frames_skipped += 1
+                    continue
+                
+                ok, frame = capture.retrieve()
+                if not ok:
+                    break
+                
+                if self.dedup_threshold > 0:
+                    signature = frame_signature(frame)
+                    if (
+                        last_signature is not None
+                        and mean_abs_difference(signature, last_signature) < self.dedup_threshold
+                    ):
+                        self.duplicates_skipped += 1
+                        continue
+                    last_signature = signature
+                
+                if self.sample_interval_s > 0:
+                    next_sample_time = timestamp + self.sample_interval_s
+                if not self._put((index, timestamp, frame)):
+                    break
+                self.frames_delivered += 1
+        except Exception as e:
+            logger.error(f"Error decoding video source {self.source}: {e}")
+            self._error = e
+        finally:
+            capture.release()
+            self._put(_END)
+    
+    def _put(self, item: Any) -> bool:
+        """Queue an item, giving up once the reader is stopped"""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reader statistics"""
+        return {
+            "source": str(self.source),
+            "frames_read": self.frames_read,
+            "frames_delivered": self.frames_delivered,
+            "frames_skipped": self.frames_skipped,
+            "duplicates_skipped": self.duplicates_skipped
+        }
@@ -7,21 +7,33 @@ computer vision capabilities with built-in privacy protection
 through anonymization and pseudonymization.
 """
 
+# Annotations name numpy/PIL types, which must not force those imports
+from __future__ import annotations
+
 import asyncio
 import logging
+import threading
 import time
-from typing import Dict, List, Any, Optional, Union, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, AsyncIterator, Callable, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import numpy as np
-from PIL import Image
-try:
-    import cv2
-except ImportError:
-    cv2 = None
-    # Logger ainda não está definido aqui, será logado na inicialização se necessário
 
 from .config import SEVEConfig, PrivacyLevel
+from .deadline import Deadline
+from .executors import ExecutorKind
+from .lazy import lazy_import
+from .motion import MotionGate
+from .planes import FramePlanes, PlaneBuilder, DEFAULT_PLANE_BUILDERS
+from .shared_frames import FrameHandle, resolve_frame
+from .tiling import enclosing_box, non_max_suppression, tile_boxes
+from .tracking import DetectionTracker
+from .video import VideoReader
+
+# Heavy imaging libraries are loaded on first use
+np = lazy_import("numpy")
+Image = lazy_import("PIL.Image")
+cv2 = lazy_import("cv2")
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +69,7 @@ class Detection:
 class VisionResult:
     """Result of vision processing"""
     detections: List[Detection]
-    anonymized_image: Optional[np.ndarray] = None
+    anonymized_image: Optional[Union[np.ndarray, FrameHandle]] = None  # handle for shared-memory input
     processing_time_ms: float = 0.0
     privacy_applied: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -70,6 +82,9 @@ class SEVEVisionModule:
     built into the processing pipeline.
     """
     
+    # Detection types whose regions are anonymized
+    SENSITIVE_TYPES = (DetectionType.FACE, DetectionType.TEXT, DetectionType.LICENSE_PLATE)
+    
     def __init__(self, config: SEVEConfig):
         self.config = config
         self.is_initialized = False
@@ -87,6 +102,22 @@ class SEVEVisionModule:
         # Pseudonym generator
         self.pseudonym_counter = 0
         
+        # Adaptive-resolution probes that found candidates and reran higher
+        self.resolution_escalations = 0
+        
+        # Stage executor for CPU-bound work (None runs it inline)
+        self.executor = None
+        
+        # Derived planes detectors can read from each frame's FramePlanes
+        self.plane_builders: Dict[str, PlaneBuilder] = dict(DEFAULT_PLANE_BUILDERS)
+        
+        # Cascade classifiers are not safe to share between threads
+        self._local = threading.local()
+        
+        # Threads detecting the tiles of large frames, started on first use
+        self._tile_pool: Optional[ThreadPoolExecutor] = None
+        self._tile_pool_lock = threading.Lock()
+        
         logger.info(f"SEVE Vision Module initialized with privacy level: {self.privacy_level.value}")
     
     async def initialize(self) -> None:
@@ -100,10 +131,8 @@ class SEVEVisionModule:
             # Initialize detection models (placeholder)
             await self._load_detection_models()
             
-            # Initialize face detector
-            self.face_detector = cv2.CascadeClassifier(
-                cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-            )
+            # Initialize face detector (OpenCV releases the GIL while parsing the cascade)
+            self.face_detector = await asyncio.get_running_loop().run_in_executor(None, self._load_face_detector)
             
             self.is_initialized = True
             logger.info("SEVE Vision Module fully initialized")
@@ -113,6 +142,101 @@ class SEVEVisionModule:
             # Não lança exceção para não impedir o boot do resto do framework
             # raise
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without executor, thread pool and detector handles so work can run in worker processes"""
+        state = self.__dict__.copy()
+        state["executor"] = None
+        state["face_detector"] = None
+        state["_tile_pool"] = None
+        del state["_local"]
+        del state["_tile_pool_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled module; detectors are reloaded on first use"""
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._tile_pool_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Stop the tile detection threads"""
+        with self._tile_pool_lock:
+            pool, self._tile_pool = self._tile_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+    
+    def _load_face_detector(self):
+        """Load the Haar cascade face detector"""
+        return cv2.CascadeClassifier(
+            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        )
+    
+    def _get_face_detector(self):
+        """Get the face detector owned by the calling thread"""
+        detector = getattr(self._local, "face_detector", None)
+        if detector is not None:
+            return detector
+        
+        if self.executor is None and self.face_detector is not None:
+            # Inline execution keeps all other detection on the event loop thread
+            return self.face_detector
+        
+        detector = self._load_face_detector()
+        self._local.face_detector = detector
+        return detector
+    
+    def _start_tile_thread(self) -> None:
+        """Give a tile detection thread its own face detector"""
+        self._local.face_detector = self._load_face_detector()
+    
+    def _get_tile_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool tiles are detected on, starting it on first use"""
+        with self._tile_pool_lock:
+            if self._tile_pool is None:
+                self._tile_pool = ThreadPoolExecutor(
+                    max_workers=self.config.tile_workers,
+                    thread_name_prefix="seve-vision-tile",
+                    initializer=self._start_tile_thread
+                )
+            return self._tile_pool
+    
+    def register_plane(self, name: str, builder: PlaneBuilder) -> None:
+        """
+        Register a derived plane detectors can read from FramePlanes
+        
+        The builder receives the frame's FramePlanes and runs at most
+        once per frame, the first time a detector asks for the plane.
+        Use module-level functions when vision runs in a process pool.
+        
+        Args:
+            name: Plane name, e.g. "hsv"
+            builder: Callable taking FramePlanes and returning the plane
+        """
+        self.plane_builders[name] = builder
+    
+    def _frame_planes(self, image: Union[np.ndarray, FrameHandle, FramePlanes]) -> FramePlanes:
+        """Wrap a frame in FramePlanes with this module's builders"""
+        if isinstance(image, FramePlanes):
+            return image
+        return FramePlanes(image, self.plane_builders)
+    
+    async def _offload(self, func, *args):
+        """Run CPU-bound vision work on the configured stage executor"""
+        if self.executor is None:
+            return func(*args)
+        return await self.executor.run("vision", func, *args)
+    
+    async def _offload_stateful(self, func, *args):
+        """
+        Run CPU-bound vision work that updates objects of this process
+        
+        Like _offload(), except that a process pool would update a copy
+        of the object in the worker, so under one the work runs inline.
+        """
+        if self.executor is not None and self.executor.kind_for("vision") == ExecutorKind.PROCESS:
+            return func(*args)
+        return await self._offload(func, *args)
+    
     async def _load_detection_models(self) -> None:
         """Load detection models (placeholder implementation)"""
         # In a real implementation, this would load actual ML models
@@ -127,15 +251,31 @@ class SEVEVisionModule:
     
     async def process_visual_input(
         self,
-        visual_data: Union[str, np.ndarray, Image.Image, Dict[str, Any]],
-        context: Optional[Dict[str, Any]] = None
+        visual_data: Union[str, bytes, np.ndarray, Image.Image, FrameHandle, Dict[str, Any]],
+        context: Optional[Dict[str, Any]] = None,
+        tracker: Optional[DetectionTracker] = None,
+        motion_gate: Optional[MotionGate] = None
     ) -> VisionResult:
         """
         Process visual input with privacy protection
         
+        A FrameHandle is passed to the stage executor as it is, so
+        worker processes map the shared frame instead of receiving a
+        pickled copy; the frame is anonymized in place and its handle
+        returned as the anonymized image.
+        
+        With a tracker, the detectors only run when the tracker asks
+        for a keyframe; other frames reuse its tracked boxes. With a
+        motion gate, face and text detection only run where the frame
+        changed, and static areas keep the previous detections.
+        Anonymization runs on every frame either way.
+        
         Args:
-            visual_data: Image data (path, array, PIL Image, or dict)
+            visual_data: Image data (path, encoded bytes, array, PIL Image,
+                shared-memory FrameHandle, or dict)
             context: Additional context information
+            tracker: Tracker following the stream this frame belongs to
+            motion_gate: Motion gate following the stream this frame belongs to
             
         Returns:
             VisionResult with detections and anonymized data
@@ -146,11 +286,33 @@ class SEVEVisionModule:
             await self.initialize()
         
         try:
-            # Convert input to numpy array
-            image = await self._prepare_image(visual_data)
+            # Convert input to numpy array; shared frames stay handles
+            if isinstance(visual_data, FrameHandle):
+                image = visual_data
+            else:
+                image = await self._offload(self._prepare_image, visual_data)
             
-            # Detect objects
-            detections = await self._detect_objects(image, context)
+            planes = self._frame_planes(image)
+            if tracker is not None and not await self._offload_stateful(tracker.needs_detection, planes):
+                # Between keyframes the tracked boxes stand in for the detectors
+                detections = await self._offload_stateful(tracker.propagate, planes)
+            else:
+                regions = None
+                if motion_gate is not None:
+                    regions = await self._offload_stateful(motion_gate.regions, planes)
+                
+                # Detect objects; text detection is optional work under a deadline
+                deadline = Deadline.from_context(context)
+                detections, escalations = await self._offload(
+                    self._detect_counted, self._detect_objects, planes, context, deadline is None, regions
+                )
+                self.resolution_escalations += escalations
+                if deadline is not None:
+                    detections.extend(await self._detect_text_within(planes, deadline, regions))
+                if motion_gate is not None:
+                    detections = motion_gate.merge(regions, detections)
+                if tracker is not None:
+                    await self._offload_stateful(tracker.update, planes, detections)
             
             # Apply privacy protection
             anonymized_image = None
@@ -177,9 +339,261 @@ class SEVEVisionModule:
             logger.error(f"Error processing visual input: {e}")
             raise
     
-    async def _prepare_image(self, visual_data: Union[str, np.ndarray, Image.Image, Dict[str, Any]]) -> np.ndarray:
+    async def process_video(
+        self,
+        source: Union[str, int, VideoReader],
+        context: Optional[Dict[str, Any]] = None,
+        stride: Optional[int] = None,
+        sample_interval_s: Optional[float] = None,
+        dedup_threshold: Optional[float] = None,
+        tracking: Optional[bool] = None,
+        motion_gating: Optional[bool] = None
+    ) -> AsyncIterator[VisionResult]:
+        """
+        Process a video file or capture device frame by frame
+        
+        Frames are decoded on a background thread while earlier frames
+        are being detected. Only every stride-th frame, at most one per
+        sample_interval_s, is processed, and frames nearly identical to
+        the last processed one are skipped before any detector runs.
+        In tracking mode the detectors only run on keyframes and
+        detections carry a stable metadata["track_id"]; with motion
+        gating, face and text detection only run on changed regions.
+        Unset options fall back to the video_*, tracking_* and motion_*
+        configuration.
+        
+        Args:
+            source: File path, capture device index, or a VideoReader
+            context: Context applied to every frame
+            stride: Process every Nth frame
+            sample_interval_s: Minimum seconds of video between processed frames
+            dedup_threshold: Mean gray-level difference below which a frame
+                counts as a duplicate (0 disables the check)
+            tracking: Track detections between keyframes
+            motion_gating: Restrict detection to regions that changed
+        
+        Yields:
+            VisionResult per processed frame, with its frame_index and
+            timestamp_s in the metadata
+        """
+        if isinstance(source, VideoReader):
+            reader = source
+        else:
+            reader = VideoReader(
+                source,
+                stride=stride if stride is not None else self.config.video_frame_stride,
+                sample_interval_s=(
+                    sample_interval_s if sample_interval_s is not None
+                    else self.config.video_sample_interval_s
+                ),
+                dedup_threshold=(
+                    dedup_threshold if dedup_threshold is not None
+                    else self.config.video_dedup_threshold
+                ),
+                queue_size=self.config.video_queue_size
+            )
+        
+        tracker = None
+        if tracking if tracking is not None else self.config.tracking_enabled:
+            tracker = DetectionTracker(
+                detection_interval=self.config.tracking_detection_interval,
+                scene_change_threshold=self.config.tracking_scene_change_threshold,
+                iou_threshold=self.config.tracking_iou_threshold,
+                flow_height=self.config.vision_probe_height
+            )
+        
+        motion_gate = None
+        if motion_gating if motion_gating is not None else self.config.motion_gating_enabled:
+            motion_gate = MotionGate(
+                (DetectionType.FACE, DetectionType.TEXT),
+                threshold=self.config.motion_threshold,
+                padding=self.config.motion_roi_padding,
+                max_area_fraction=self.config.motion_max_area_fraction,
+                analysis_height=self.config.vision_probe_height
+            )
+        
+        frames = reader.frames()
+        try:
+            async for frame_index, timestamp, frame in frames:
+                result = await self.process_visual_input(frame, context, tracker, motion_gate)
+                result.metadata["frame_index"] = frame_index
+                result.metadata["timestamp_s"] = timestamp
+                yield result
+        finally:
+            # Stops the decoder even when the caller stops iterating early
+            await frames.aclose()
+            logger.info(f"Video source processed: {reader.get_stats()}")
+            if tracker is not None:
+                logger.info(f"Video tracking: {tracker.get_stats()}")
+            if motion_gate is not None:
+                logger.info(f"Video motion gating: {motion_gate.get_stats()}")
+    
+    async def process_visual_batch(
+        self,
+        frames: Union[np.ndarray, List[Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[VisionResult, Exception]]:
+        """
+        Process several frames with shared per-batch work
+        
+        Frames are split into one chunk per stage executor worker, and
+        each chunk is prepared, detected and anonymized in a single
+        executor call; a stacked array is converted to grayscale in one
+        pass per chunk and shared by the detectors. A batch of camera
+        feeds therefore costs a few dispatches instead of several per
+        frame.
+        
+        Args:
+            frames: Stacked (N, H, W, 3) array, or a list of anything
+                process_visual_input accepts
+            contexts: Optional per-frame contexts, aligned with frames
+            return_exceptions: Return a frame's exception in its place
+                instead of raising it
+        
+        Returns:
+            VisionResult (or exception) for each frame, in input order
+        """
+        start_time = time.time()
+        
+        if contexts is not None and len(contexts) != len(frames):
+            raise ValueError("contexts must have the same length as frames")
+        if len(frames) == 0:
+            return []
+        
+        if not self.is_initialized:
+            await self.initialize()
+        
+        contexts = list(contexts) if contexts is not None else [None] * len(frames)
+        deadlines = [Deadline.from_context(context) for context in contexts]
+        include_text = [deadline is None for deadline in deadlines]
+        
+        # Contiguous chunks; slices of a stacked array stay views
+        chunk_count = self._batch_chunk_count(len(frames))
+        bounds = [
+            (len(frames) * n // chunk_count, len(frames) * (n + 1) // chunk_count)
+            for n in range(chunk_count)
+        ]
+        chunk_outputs = await asyncio.gather(*(
+            self._offload(
+                self._process_frame_chunk,
+                frames[start:end] if isinstance(frames, np.ndarray) else list(frames[start:end]),
+                contexts[start:end],
+                include_text[start:end]
+            )
+            for start, end in bounds
+        ))
+        outputs = [output for chunk in chunk_outputs for output in chunk]
+        
+        results: List[Union[VisionResult, Exception]] = []
+        for output, context, deadline in zip(outputs, contexts, deadlines):
+            if isinstance(output, Exception):
+                if not return_exceptions:
+                    raise output
+                results.append(output)
+                continue
+            
+            detections, image, anonymized_image, original_size, escalations = output
+            self.resolution_escalations += escalations
+            if deadline is not None:
+                text_detections = await self._detect_text_within(image, deadline)
+                if text_detections and self.anonymization_enabled:
+                    anonymized_image = await self._offload(
+                        self._anonymize_image, anonymized_image, text_detections, context
+                    )
+                detections.extend(text_detections)
+            if self.anonymization_enabled:
+                self._mark_anonymized(detections)
+            
+            results.append(VisionResult(
+                detections=detections,
+                anonymized_image=anonymized_image,
+                processing_time_ms=(time.time() - start_time) * 1000,
+                privacy_applied=self.anonymization_enabled,
+                metadata={
+                    "original_size": original_size,
+                    "detection_count": len(detections),
+                    "privacy_level": self.privacy_level.value,
+                    "batch_size": len(frames)
+                }
+            ))
+        
+        return results
+    
+    def _batch_chunk_count(self, frame_count: int) -> int:
+        """Number of executor calls a batch is split into"""
+        if self.executor is None or self.executor.kind_for("vision") == ExecutorKind.INLINE:
+            return 1
+        return max(1, min(frame_count, self.executor.max_workers))
+    
+    def _process_frame_chunk(
+        self,
+        frames: Union[np.ndarray, List[Any]],
+        contexts: List[Optional[Dict[str, Any]]],
+        include_text: List[bool]
+    ) -> List[Union[Tuple[List[Detection], Any, Any, Tuple[int, int], int], Exception]]:
+        """
+        Prepare, detect and anonymize a run of frames in one call
+        
+        Returns:
+            Per frame, the exception raised or a tuple of (detections,
+            image, anonymized image, original size, resolution
+            escalations); the image is only returned for frames whose
+            text detection runs under a deadline afterwards, and is the
+            input handle for shared frames
+        """
+        outputs: List[Any] = [None] * len(frames)
+        images: List[Any] = [None] * len(frames)
+        for i, frame in enumerate(frames):
+            try:
+                images[i] = self._prepare_image(frame)
+            except Exception as e:
+                outputs[i] = e
+        
+        grays = self._grayscale_batch(frames)
+        
+        for i, image in enumerate(images):
+            if outputs[i] is not None:
+                continue
+            try:
+                # Shared frames are returned and anonymized as handles
+                source = frames[i] if isinstance(frames[i], FrameHandle) else image
+                planes = self._frame_planes(image)
+                if grays is not None:
+                    planes.set("gray", grays[i])
+                detections = self._detect_objects(planes, contexts[i], include_text[i])
+                anonymized_image = None
+                if self.anonymization_enabled:
+                    anonymized_image = self._anonymize_image(source, detections, contexts[i])
+                outputs[i] = (
+                    detections,
+                    None if include_text[i] else source,
+                    anonymized_image,
+                    tuple(image.shape[:2]),
+                    len(planes.escalations)
+                )
+            except Exception as e:
+                outputs[i] = e
+        
+        return outputs
+    
+    def _grayscale_batch(self, frames: Union[np.ndarray, List[Any]]) -> Optional[List[np.ndarray]]:
+        """Grayscale planes of a stacked array in a single conversion (None for lists)"""
+        if not (isinstance(frames, np.ndarray) and frames.ndim == 4 and frames.shape[-1] == 3):
+            # Frames of a list are converted by their own FramePlanes
+            return None
+        
+        # cvtColor works per pixel, so N frames of H rows convert as one N*H-row image
+        count, height, width = frames.shape[:3]
+        stacked = np.ascontiguousarray(frames).reshape(count * height, width, 3)
+        return list(cv2.cvtColor(stacked, cv2.COLOR_BGR2GRAY).reshape(count, height, width))
+    
+    def _prepare_image(self, visual_data: Union[str, bytes, np.ndarray, Image.Image, FrameHandle, Dict[str, Any]]) -> np.ndarray:
         """Prepare image data for processing"""
-        if isinstance(visual_data, str):
+        if isinstance(visual_data, FrameHandle):
+            # Shared-memory frame, mapped without copying
+            image = resolve_frame(visual_data)
+        elif isinstance(visual_data, str):
             # File path
             image = cv2.imread(visual_data)
             if image is None:
@@ -187,7 +601,12 @@ class SEVEVisionModule:
         elif isinstance(visual_data, np.ndarray):
             # Numpy array
             image = visual_data
-        elif isinstance(visual_data, Image.Image):
+        elif isinstance(visual_data, (bytes, bytearray)):
+            # Encoded image (JPEG, PNG, ...)
+            image = cv2.imdecode(np.frombuffer(visual_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("Could not decode image bytes")
+        elif Image is not None and isinstance(visual_data, Image.Image):
             # PIL Image
             image = np.array(visual_data)
             if len(image.shape) == 3:
@@ -205,16 +624,70 @@ class SEVEVisionModule:
         
         return image
     
-    async def _detect_objects(
+    async def _detect_text_within(
         self,
-        image: np.ndarray,
-        context: Optional[Dict[str, Any]] = None
+        image: Union[np.ndarray, FrameHandle, FramePlanes],
+        deadline: Deadline,
+        regions: Optional[List[Tuple[int, int, int, int]]] = None
     ) -> List[Detection]:
-        """Detect objects in the image"""
+        """
+        Run text detection only while the deadline allows
+        
+        The detection work itself checks the deadline before each area
+        it searches (the frame, a motion region or a tile) and stops
+        once it has passed, keeping what it found so far, so work stops
+        on any executor and is not left running after the deadline.
+        The overrun is bounded by one area; tiling makes areas smaller.
+        """
+        if deadline.expired():
+            deadline.skip("text_detection")
+            return []
+        
+        detections, escalations = await self._offload(
+            self._detect_counted, self._detect_text_objects, image, regions, deadline
+        )
+        self.resolution_escalations += escalations
+        if deadline.expired():
+            deadline.skip("text_detection")
+        return detections
+    
+    def _detect_counted(
+        self,
+        detect: Callable[..., Any],
+        image: Union[np.ndarray, FrameHandle, FramePlanes],
+        *args: Any
+    ) -> Tuple[Any, int]:
+        """
+        Run a detection function on a frame's planes, with the number of resolution escalations it made
+        
+        The count travels back with the result, so the caller adds it to
+        resolution_escalations in this process even when the detection
+        ran in a worker process.
+        """
+        planes = self._frame_planes(image)
+        before = len(planes.escalations)
+        result = detect(planes, *args)
+        return result, len(planes.escalations) - before
+    
+    def _detect_objects(
+        self,
+        image: Union[np.ndarray, FrameHandle, FramePlanes],
+        context: Optional[Dict[str, Any]] = None,
+        include_text: bool = True,
+        regions: Optional[List[Tuple[int, int, int, int]]] = None
+    ) -> List[Detection]:
+        """
+        Detect objects in the image; every detector reads the same FramePlanes
+        
+        With regions (full-frame boxes from a MotionGate), face and text
+        detection only look inside them; in tiling mode they run on
+        overlapping tiles of large frames in parallel.
+        """
+        planes = self._frame_planes(image)
         detections = []
+        faces, texts = self._detect_in_areas(planes, regions, include_text)
         
         # Detect faces
-        faces = await self._detect_faces(image)
         for face in faces:
             detections.append(Detection(
                 type=DetectionType.FACE,
@@ -224,7 +697,7 @@ class SEVEVisionModule:
             ))
         
         # Detect objects (simplified implementation)
-        objects = await self._detect_general_objects(image)
+        objects = self._detect_general_objects(planes)
         for obj in objects:
             detections.append(Detection(
                 type=DetectionType.OBJECT,
@@ -234,21 +707,157 @@ class SEVEVisionModule:
             ))
         
         # Detect text
-        text_regions = await self._detect_text(image)
-        for text in text_regions:
-            detections.append(Detection(
+        detections.extend(self._text_detections(texts))
+        
+        return detections
+    
+    def _detection_areas(
+        self,
+        planes: FramePlanes,
+        regions: Optional[List[Tuple[int, int, int, int]]]
+    ) -> List[FramePlanes]:
+        """
+        Planes the region-gated detectors run on
+        
+        That is the whole frame or one crop per region, and in tiling
+        mode one crop per tile of every area larger than a tile.
+        """
+        tiling = self.config.tiling_enabled
+        tile_size = self.config.tile_size
+        height, width = planes.shape[:2]
+        if regions is None:
+            if not tiling or max(height, width) <= tile_size:
+                return [planes]
+            regions = [(0, 0, width, height)]
+        
+        areas = []
+        for x, y, w, h in regions:
+            if tiling and max(w, h) > tile_size:
+                tiles = tile_boxes(w, h, tile_size, self.config.tile_overlap)
+            else:
+                tiles = [(0, 0, w, h)]
+            areas.extend(planes.crop((x + tx, y + ty, tw, th)) for tx, ty, tw, th in tiles)
+        return areas
+    
+    def _detect_in_areas(
+        self,
+        planes: FramePlanes,
+        regions: Optional[List[Tuple[int, int, int, int]]],
+        include_text: bool = True,
+        include_faces: bool = True,
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run face and text detection over the detection areas of a frame
+        
+        In tiling mode the areas are detected concurrently on the tile
+        thread pool (OpenCV releases the GIL), and detections repeated
+        where tiles overlap are merged by non-maximum suppression.
+        Areas not started before the deadline are left out.
+        
+        Returns:
+            Tuple of (faces, text regions) in full-frame coordinates
+        """
+        areas = self._detection_areas(planes, regions)
+        
+        def detect(area: FramePlanes) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            if deadline is not None and deadline.expired():
+                return [], []
+            return (
+                self._detect_faces(area) if include_faces else [],
+                self._detect_text(area) if include_text else []
+            )
+        
+        tiled = self.config.tiling_enabled and len(areas) > 1
+        if tiled:
+            results = list(self._get_tile_pool().map(detect, areas))
+        else:
+            results = [detect(area) for area in areas]
+        
+        faces = [face for faces, _ in results for face in faces]
+        texts = [text for _, texts in results for text in texts]
+        if tiled:
+            faces, texts = self._suppress_duplicates(faces), self._suppress_duplicates(texts)
+        return faces, texts
+    
+    def _suppress_duplicates(self, found: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep one of each group of detections overlapping by more than config.tile_nms_threshold
+        
+        The kept box grows to enclose its group: an object larger than
+        the tile overlap is only seen in parts, and anonymization must
+        cover every part.
+        """
+        groups = non_max_suppression(
+            [item["bbox"] for item in found],
+            [item["confidence"] for item in found],
+            self.config.tile_nms_threshold
+        )
+        return [
+            dict(found[kept], bbox=enclosing_box(found[index]["bbox"] for index in [kept, *suppressed]))
+            for kept, suppressed in sorted(groups.items())
+        ]
+    
+    def _detect_text_objects(
+        self,
+        image: Union[np.ndarray, FrameHandle, FramePlanes],
+        regions: Optional[List[Tuple[int, int, int, int]]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> List[Detection]:
+        """Detect text regions as Detection objects, stopping at the deadline"""
+        planes = self._frame_planes(image)
+        _, texts = self._detect_in_areas(planes, regions, include_faces=False, deadline=deadline)
+        return self._text_detections(texts)
+    
+    def _text_detections(self, texts: List[Dict[str, Any]]) -> List[Detection]:
+        """Wrap text detector output in Detection objects"""
+        return [
+            Detection(
                 type=DetectionType.TEXT,
                 confidence=text["confidence"],
                 bbox=text["bbox"],
                 metadata={"text_content": text.get("content", "")}
-            ))
+            )
+            for text in texts
+        ]
+    
+    def _detect_at_resolution(
+        self,
+        planes: FramePlanes,
+        detector: str,
+        find: Callable[[FramePlanes], List[Tuple[int, int, int, int]]]
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        Run a detector at its configured resolution
         
-        return detections
+        The detector runs on planes scaled to
+        config.vision_detection_heights[detector]. In adaptive mode it
+        first runs at config.vision_probe_height and only repeats at the
+        configured resolution when the probe finds candidates, which
+        is recorded in planes.escalations.
+        
+        Args:
+            planes: Full-frame planes
+            detector: Detector name ("face", "text", ...)
+            find: Function returning boxes in the coordinates of the planes it gets
+        
+        Returns:
+            Boxes in full-frame coordinates
+        """
+        target = planes.scaled(self.config.vision_detection_heights.get(detector))
+        
+        if self.config.vision_adaptive_resolution:
+            probe = planes.scaled(self.config.vision_probe_height)
+            if probe.shape[0] < target.shape[0]:
+                if not find(probe):
+                    return []
+                planes.escalations.append(detector)
+        
+        return [target.to_original(bbox) for bbox in find(target)]
     
-    async def _detect_faces(self, image: np.ndarray) -> List[Dict[str, Any]]:
-        """Detect faces in the image"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        faces = self.face_detector.detectMultiScale(gray, 1.1, 4)
+    def _detect_faces(self, planes: FramePlanes) -> List[Dict[str, Any]]:
+        """Detect faces in the frame's grayscale plane"""
+        faces = self._detect_at_resolution(planes, "face", self._find_faces)
         
         face_detections = []
         for (x, y, w, h) in faces:
@@ -263,12 +872,16 @@ class SEVEVisionModule:
         
         return face_detections
     
-    async def _detect_general_objects(self, image: np.ndarray) -> List[Dict[str, Any]]:
+    def _find_faces(self, planes: FramePlanes) -> List[Tuple[int, int, int, int]]:
+        """Face boxes in the coordinates of the given planes"""
+        return [tuple(face) for face in self._get_face_detector().detectMultiScale(planes["gray"], 1.1, 4)]
+    
+    def _detect_general_objects(self, planes: FramePlanes) -> List[Dict[str, Any]]:
         """Detect general objects in the image (simplified)"""
         # This is a placeholder implementation
         # In a real system, this would use YOLO or similar models
         
-        height, width = image.shape[:2]
+        height, width = planes.shape[:2]
         
         # Simulate some object detections
         objects = []
@@ -291,23 +904,18 @@ class SEVEVisionModule:
         
         return objects
     
-    async def _detect_text(self, image: np.ndarray) -> List[Dict[str, Any]]:
-        """Detect text regions in the image"""
+    def _detect_text(self, planes: FramePlanes) -> List[Dict[str, Any]]:
+        """Detect text regions in the frame's edge map"""
         # This is a placeholder implementation
         # In a real system, this would use OCR models like EasyOCR
         
-        height, width = image.shape[:2]
+        height, width = planes.shape[:2]
         
         # Simulate text detection
         text_regions = []
         
-        # Look for rectangular regions that might contain text
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
+        # Look for rectangular regions that might contain text (sizes in full-frame pixels)
+        for (x, y, w, h) in self._detect_at_resolution(planes, "text", self._find_edge_regions):
             if w > 50 and h > 20 and w/h > 2:  # Text-like aspect ratio
                 text_regions.append({
                     "bbox": (x, y, w, h),
@@ -317,32 +925,59 @@ class SEVEVisionModule:
         
         return text_regions
     
+    def _find_edge_regions(self, planes: FramePlanes) -> List[Tuple[int, int, int, int]]:
+        """Bounding boxes of the outer contours of the edge map, in the coordinates of the given planes"""
+        contours, _ = cv2.findContours(planes["edges"], cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        return [cv2.boundingRect(contour) for contour in contours]
+    
     async def _apply_privacy_protection(
         self,
-        image: np.ndarray,
+        image: Union[np.ndarray, FrameHandle],
         detections: List[Detection],
         context: Optional[Dict[str, Any]] = None
-    ) -> np.ndarray:
+    ) -> Union[np.ndarray, FrameHandle]:
         """Apply privacy protection to the image"""
+        anonymized_image = await self._offload(self._anonymize_image, image, detections, context)
+        self._mark_anonymized(detections)
+        return anonymized_image
+    
+    def _mark_anonymized(self, detections: List[Detection]) -> None:
+        """Flag sensitive detections as anonymized and pseudonymize them"""
+        for detection in detections:
+            if detection.type in self.SENSITIVE_TYPES:
+                # Mark detection as anonymized
+                detection.anonymized = True
+                
+                # Generate pseudonym if enabled (tracked detections keep theirs)
+                if self.pseudonymization_enabled and detection.pseudonym is None:
+                    detection.pseudonym = self._generate_pseudonym(detection.type)
+    
+    def _anonymize_image(
+        self,
+        image: Union[np.ndarray, FrameHandle],
+        detections: List[Detection],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Union[np.ndarray, FrameHandle]:
+        """Anonymize every sensitive region on a copy of the image (in place for shared frames)"""
+        if isinstance(image, FrameHandle):
+            frame = resolve_frame(image)
+            for detection in detections:
+                if detection.type in self.SENSITIVE_TYPES:
+                    self._anonymize_region(frame, detection, context)
+            return image
+        
         anonymized_image = image.copy()
         
         for detection in detections:
-            if detection.type in [DetectionType.FACE, DetectionType.TEXT, DetectionType.LICENSE_PLATE]:
+            if detection.type in self.SENSITIVE_TYPES:
                 # Apply anonymization based on privacy level
-                anonymized_image = await self._anonymize_region(
+                anonymized_image = self._anonymize_region(
                     anonymized_image, detection, context
                 )
-                
-                # Mark detection as anonymized
-                detection.anonymized = True
-                
-                # Generate pseudonym if enabled
-                if self.pseudonymization_enabled:
-                    detection.pseudonym = self._generate_pseudonym(detection.type)
         
         return anonymized_image
     
-    async def _anonymize_region(
+    def _anonymize_region(
         self,
         image: np.ndarray,
         detection: Detection,
@@ -403,7 +1038,11 @@ class SEVEVisionModule:
             "anonymization_enabled": self.anonymization_enabled,
             "pseudonymization_enabled": self.pseudonymization_enabled,
             "models_loaded": len(self.detection_models),
-            "pseudonym_counter": self.pseudonym_counter
+            "pseudonym_counter": self.pseudonym_counter,
+            "detection_heights": dict(self.config.vision_detection_heights),
+            "adaptive_resolution": self.config.vision_adaptive_resolution,
+            "resolution_escalations": self.resolution_escalations,
+            "tiling_enabled": self.config.tiling_enabled
         }
 
 # Demo function
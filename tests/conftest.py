@@ -1,5 +1,6 @@
 """Pytest configuration and fixtures."""
 
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, Mock
@@ -31,5 +32,19 @@ if str(src_path) not in sys.path:
 # Pytest markers
 import pytest
 
+# Tests needing the real libraries run in a fresh interpreter, where the mocks above don't apply
+requires_opencv = pytest.mark.skipif(
+    subprocess.run([sys.executable, "-c", "import numpy, cv2"], capture_output=True).returncode != 0,
+    reason="requires numpy and OpenCV"
+)
+
+
+def run_fresh(code: str, *args) -> str:
+    """Run code in a fresh interpreter with the package on the path, passing args as sys.argv[1:]"""
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path.insert(0, {str(src_path)!r})\n{code}", *map(str, args)],
+        capture_output=True, text=True, check=True, timeout=120
+    ).stdout.strip()
+
 pytest_plugins = []
 
@@ -0,0 +1,161 @@
+"""
+SEVE Framework - Admission Control Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the adaptive admission controller in front of
+SEVEHybridFramework.process_context.
+"""
+
+import asyncio
+
+import pytest
+
+from seve_framework.admission import AdmissionController, AdmissionRejected, RequestPriority
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import SEVEHybridFramework, ProcessingResult, ProcessingStatus
+
+
+class _Metrics:
+    """Minimal stand-in for monitoring.MetricsCollector"""
+
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+
+    def increment_counter(self, name, value=1, tags=None):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name, value, tags=None):
+        self.gauges[name] = value
+
+
+class TestAdmissionController:
+    """Concurrency and queue limits, priorities and adaptation"""
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejects_fast(self):
+        """Requests beyond the concurrency and queue limits are rejected at once"""
+        metrics = _Metrics()
+        controller = AdmissionController(max_concurrency=1, max_queue_depth=2, metrics=metrics)
+
+        await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await controller.acquire()
+        assert excinfo.value.reason == "queue_full"
+
+        controller.release(10.0)
+        await waiter
+        assert controller.in_flight == 1
+        assert metrics.counters["admission_rejected"] == 1
+        assert metrics.gauges["admission_queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_low_priority_shed_before_critical(self):
+        """A critical arrival displaces a waiting low-priority request"""
+        controller = AdmissionController(max_concurrency=1, max_queue_depth=2)
+
+        await controller.acquire()
+        low = asyncio.ensure_future(controller.acquire(RequestPriority.LOW))
+        high = asyncio.ensure_future(controller.acquire(RequestPriority.HIGH))
+        await asyncio.sleep(0)
+        critical = asyncio.ensure_future(controller.acquire(RequestPriority.CRITICAL))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await low
+        assert excinfo.value.reason == "shed"
+
+        controller.release(10.0)
+        await critical
+        controller.release(10.0)
+        await high
+        assert controller.get_stats()["rejected"]["low"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_granted_in_priority_order(self):
+        """Freed slots go to the highest-priority waiter first"""
+        controller = AdmissionController(max_concurrency=1, max_queue_depth=8)
+        order = []
+
+        async def request(priority):
+            await controller.acquire(priority)
+            order.append(priority)
+
+        await controller.acquire()
+        tasks = [
+            asyncio.ensure_future(request(priority))
+            for priority in (RequestPriority.LOW, RequestPriority.NORMAL, RequestPriority.CRITICAL)
+        ]
+        await asyncio.sleep(0)
+
+        for _ in tasks:
+            controller.release(10.0)
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == [RequestPriority.CRITICAL, RequestPriority.NORMAL, RequestPriority.LOW]
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejects(self):
+        """A request that cannot get a slot before its timeout is rejected"""
+        controller = AdmissionController(max_concurrency=1)
+
+        await controller.acquire()
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await controller.acquire(timeout=0.01)
+
+        assert excinfo.value.reason == "queue_timeout"
+        assert controller.queue_depth == 0
+
+    def test_limit_adapts_to_latency(self):
+        """Slow requests shrink the limit multiplicatively, fast ones grow it additively"""
+        controller = AdmissionController(max_concurrency=10, target_latency_ms=100.0)
+        controller.in_flight = 2
+
+        controller.release(400.0)
+        assert controller.limit == 9.0
+        assert controller.queue_limit == 0
+
+        controller.release(50.0)
+        assert 9.0 < controller.limit < 10.0
+
+    def test_priority_from_context(self):
+        """Priorities come from the context, safety-critical requests are CRITICAL"""
+        assert RequestPriority.from_context(None) == RequestPriority.NORMAL
+        assert RequestPriority.from_context({"priority": "low"}) == RequestPriority.LOW
+        assert RequestPriority.from_context({"priority": "bogus"}) == RequestPriority.NORMAL
+        assert RequestPriority.from_context({"safety_critical": True}) == RequestPriority.CRITICAL
+
+
+class TestHybridAdmission:
+    """SEVEHybridFramework answers shed requests with REJECTED"""
+
+    @pytest.mark.asyncio
+    async def test_overload_returns_rejected_status(self):
+        """Requests beyond capacity fail fast instead of queueing"""
+        framework = SEVEHybridFramework(SEVEConfig(
+            mode=SEVEMode.VISION_SPECIFIC,
+            admission_control_enabled=True,
+            admission_max_concurrency=1,
+            admission_max_queue_depth=0
+        ), metrics_collector=_Metrics())
+
+        async def process_context(input_data, context=None):
+            await asyncio.sleep(0.02)
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data)
+
+        framework.v3_core.process_context = process_context
+
+        results = await asyncio.gather(*(
+            framework.process_context({"sensor": {"value": i}}, {"priority": "low"})
+            for i in range(3)
+        ))
+
+        statuses = [result.status for result in results]
+        assert statuses.count(ProcessingStatus.COMPLETED) == 1
+        assert statuses.count(ProcessingStatus.REJECTED) == 2
+        assert results[1].metadata["admission"] == {"priority": "low", "reason": "queue_full"}
+        assert framework.get_status()["admission"]["in_flight"] == 0
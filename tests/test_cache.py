@@ -0,0 +1,186 @@
+"""
+SEVE Framework - Result Cache Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the content-addressed result cache and its use in front of
+SEVECoreV3.process_context.
+"""
+
+import time
+
+import pytest
+
+from seve_framework.cache import ResultCache
+from seve_framework.core import ProcessingStatus
+from seve_framework.ethics import EthicalRule, EthicalPrinciple, ComplianceLevel
+
+from test_core_pipeline import _make_core
+
+
+class _RecordingMetrics:
+    """Minimal stand-in for monitoring.MetricsCollector"""
+
+    def __init__(self):
+        self.counters = {}
+        self.gauges = {}
+
+    def increment_counter(self, name, value=1, tags=None):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name, value, tags=None):
+        self.gauges[name] = value
+
+
+class TestResultCache:
+    """LRU/TTL behaviour and fingerprinting"""
+
+    def test_fingerprint_ignores_volatile_context(self):
+        """Request ids and timestamps don't change the key"""
+        cache = ResultCache()
+
+        first = cache.fingerprint({"sensor": {"temperature": 21.0}}, {"request_id": "a", "zone": 1})
+        second = cache.fingerprint({"sensor": {"temperature": 21.0}}, {"request_id": "b", "zone": 1})
+        other = cache.fingerprint({"sensor": {"temperature": 21.0}}, {"zone": 2})
+
+        assert first == second
+        assert first != other
+
+    def test_fingerprint_hashes_raw_bytes(self):
+        """Byte-identical frames share a key, different frames don't"""
+        cache = ResultCache()
+
+        assert cache.fingerprint({"visual": b"\x00" * 16}) == cache.fingerprint({"visual": b"\x00" * 16})
+        assert cache.fingerprint({"visual": b"\x00" * 16}) != cache.fingerprint({"visual": b"\x01" * 16})
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are treated as misses"""
+        cache = ResultCache(ttl_seconds=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_generation_change_clears_entries(self):
+        """A new generation token invalidates every entry"""
+        cache = ResultCache()
+        cache.set_generation("g1")
+        cache.put("a", 1)
+        cache.set_generation("g2")
+
+        assert cache.get("a") is None
+        assert cache.invalidations == 1
+
+    def test_metrics_exported(self):
+        """Hits and misses reach the metrics collector"""
+        metrics = _RecordingMetrics()
+        cache = ResultCache(metrics=metrics)
+        cache.get("a")
+        cache.put("a", 1)
+        cache.get("a")
+
+        assert metrics.counters == {"cache_misses": 1, "cache_hits": 1}
+        assert metrics.gauges["cache_size"] == 1
+
+
+class TestCoreResultCache:
+    """process_context reuses results for identical inputs"""
+
+    @pytest.mark.asyncio
+    async def test_identical_input_hits_cache(self):
+        """The second identical request skips the pipeline"""
+        core = _make_core(result_cache_enabled=True)
+        payload = {"sensor": {"temperature": 21.0}}
+
+        first = await core.process_context(payload, {"request_id": "1"})
+        second = await core.process_context(payload, {"request_id": "2"})
+
+        assert first.status == ProcessingStatus.COMPLETED
+        assert second.metadata["cache_hit"] is True
+        assert core.processing_count == 1
+        assert core.result_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_hits_do_not_share_mutable_data(self):
+        """Changing a returned result leaves the cached entry and other hits untouched"""
+        core = _make_core(result_cache_enabled=True)
+        payload = {"sensor": {"temperature": 21.0}}
+
+        first = await core.process_context(payload)
+        first.data["sensor"]["extra"] = "first"
+        second = await core.process_context(payload)
+        second.data["sensor"]["extra"] = "second"
+        second.metadata["stage_timings_ms"]["extra"] = 1.0
+        third = await core.process_context(payload)
+
+        assert "extra" not in third.data["sensor"]
+        assert "extra" not in third.metadata["stage_timings_ms"]
+        assert core.result_cache.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_shares_cache(self):
+        """process_batch serves cached inputs and only processes the misses"""
+        core = _make_core(result_cache_enabled=True)
+        payload = {"sensor": {"temperature": 21.0}}
+
+        await core.process_context(payload)
+        results = await core.process_batch([payload, {"sensor": {"temperature": 22.0}}])
+        again = await core.process_context({"sensor": {"temperature": 22.0}})
+
+        assert results[0].metadata["cache_hit"] is True
+        assert "cache_hit" not in results[1].metadata
+        assert again.metadata["cache_hit"] is True
+        assert ("sense", 1) in core.stage_calls
+
+    @pytest.mark.asyncio
+    async def test_ethics_rule_change_invalidates(self):
+        """Changing the ethical rules forces recomputation"""
+        core = _make_core(result_cache_enabled=True)
+        payload = {"sensor": {"temperature": 21.0}}
+
+        await core.process_context(payload)
+        core.ethics_module.ethical_rules.append(EthicalRule(
+            name="Test_Rule",
+            principle=EthicalPrinciple.SAFETY,
+            description="Added at runtime",
+            compliance_level=ComplianceLevel.HIGH
+        ))
+        result = await core.process_context(payload)
+
+        assert "cache_hit" not in result.metadata
+        assert core.processing_count == 2
+        assert core.result_cache.invalidations == 1
+
+    def test_generation_recomputed_only_on_change(self):
+        """The settings digest is reused until the config changes"""
+        core = _make_core(result_cache_enabled=True)
+
+        first = core._cache_generation()
+        assert core._cache_generation() is first
+
+        core.config.stage_budgets_ms["vision"] = 20
+        assert core._cache_generation() != first
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self):
+        """Without result_cache_enabled every request runs the pipeline"""
+        core = _make_core()
+        payload = {"sensor": {"temperature": 21.0}}
+
+        await core.process_context(payload)
+        await core.process_context(payload)
+
+        assert core.result_cache is None
+        assert core.processing_count == 2
@@ -0,0 +1,164 @@
+"""
+SEVE Framework - Request Coalescing Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the single-flight layer in front of
+SEVEHybridFramework.process_context.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from seve_framework.coalesce import SingleFlight
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import SEVEHybridFramework, ProcessingResult, ProcessingStatus
+from seve_framework.deadline import Deadline
+
+
+class TestSingleFlight:
+    """Concurrent calls with the same key share one computation"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Only the first call runs the work"""
+        group = SingleFlight()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await asyncio.sleep(0.02)
+            return object()
+
+        results = await asyncio.gather(*(group.do("k", work) for _ in range(5)))
+
+        assert len(runs) == 1
+        assert all(result is results[0] for result in results)
+        assert group.coalesced == 4
+        assert group.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_independently(self):
+        """Distinct keys never share work"""
+        group = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(group.do("a", lambda: work(1)), group.do("b", lambda: work(2)))
+
+        assert results == [1, 2]
+        assert group.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_caller(self):
+        """A failing computation fails all of its callers"""
+        group = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(*(group.do("k", work) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """The shared computation outlives a caller that gives up"""
+        group = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        first = asyncio.ensure_future(group.do("k", work))
+        second = asyncio.ensure_future(group.do("k", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+
+
+class TestHybridCoalescing:
+    """SEVEHybridFramework coalesces identical concurrent requests"""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_coalesced(self):
+        """One pipeline run serves every concurrent identical request"""
+        framework = SEVEHybridFramework(SEVEConfig(
+            mode=SEVEMode.VISION_SPECIFIC,
+            request_coalescing_enabled=True
+        ))
+        runs = []
+
+        async def process_context(input_data, context=None):
+            runs.append(input_data)
+            await asyncio.sleep(0.02)
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data)
+
+        framework.v3_core.process_context = process_context
+        payload = {"sensor": {"temperature": 21.0}}
+
+        results = await asyncio.gather(*(
+            framework.process_context(payload, {"request_id": str(i)})
+            for i in range(4)
+        ))
+        await framework.process_context({"sensor": {"temperature": 22.0}}, {})
+
+        assert len(runs) == 2
+        assert all(result.status == ProcessingStatus.COMPLETED for result in results)
+        assert framework.get_status()["request_coalescing"]["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_get_own_copy(self):
+        """Changing one caller's result leaves the other callers' results untouched"""
+        framework = SEVEHybridFramework(SEVEConfig(
+            mode=SEVEMode.VISION_SPECIFIC,
+            request_coalescing_enabled=True
+        ))
+
+        async def process_context(input_data, context=None):
+            await asyncio.sleep(0.02)
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data={"sensor": dict(input_data["sensor"])})
+
+        framework.v3_core.process_context = process_context
+        payload = {"sensor": {"temperature": 21.0}}
+
+        first, second = await asyncio.gather(
+            framework.process_context(payload, {}),
+            framework.process_context(payload, {})
+        )
+        first.data["sensor"]["temperature"] = 99.0
+        first.metadata["note"] = "first"
+
+        assert framework.single_flight.coalesced == 1
+        assert second.data["sensor"]["temperature"] == 21.0
+        assert "note" not in second.metadata
+
+    @pytest.mark.asyncio
+    async def test_requests_with_deadline_not_coalesced(self):
+        """A request with a deadline never waits on a computation it does not bound"""
+        framework = SEVEHybridFramework(SEVEConfig(
+            mode=SEVEMode.VISION_SPECIFIC,
+            request_coalescing_enabled=True
+        ))
+        runs = []
+
+        async def process_context(input_data, context=None):
+            runs.append(context)
+            await asyncio.sleep(0.02)
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data)
+
+        framework.v3_core.process_context = process_context
+        payload = {"sensor": {"temperature": 21.0}}
+
+        await asyncio.gather(
+            framework.process_context(payload, {}),
+            framework.process_context(payload, {"deadline": Deadline(time.time() + 0.5)})
+        )
+
+        assert len(runs) == 2
+        assert framework.single_flight.coalesced == 0
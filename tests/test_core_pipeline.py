@@ -0,0 +1,338 @@
+"""
+SEVE Framework - Core Pipeline Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the scheduling behaviour of the SEVE Core v3.0 pipeline.
+Stage modules are replaced with lightweight async stubs so that the
+tests exercise orchestration only.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode, BackpressurePolicy
+from seve_framework.core import SEVECoreV3, ProcessingStatus
+from seve_framework.streaming import StreamingPipeline
+
+
+def _make_core(stage_delay: float = 0.0, **config_overrides) -> SEVECoreV3:
+    """Create a core whose stage modules are replaced by async stubs"""
+    config = SEVEConfig(mode=SEVEMode.VISION_SPECIFIC, **config_overrides)
+    core = SEVECoreV3(config)
+
+    async def process_visual_input(visual_data, context=None):
+        await asyncio.sleep(stage_delay)
+        return {"frame": visual_data}
+
+    async def process_sensor_input(sensor_data, context=None):
+        await asyncio.sleep(stage_delay)
+        return {"readings": sensor_data}
+
+    async def validate_decision(decision_data, context=None, use_universal=None):
+        return [{"is_compliant": True}]
+
+    async def transmit_output(data, context=None, connection_name=None):
+        return True
+
+    async def process_visual_batch(frames, contexts=None, return_exceptions=False):
+        core.stage_calls.append(("vision", len(frames)))
+        return [
+            ValueError("unreadable frame") if frame is None else {"frame": frame}
+            for frame in frames
+        ]
+
+    async def process_sensor_batch(sensor_batch, contexts=None, return_exceptions=False):
+        core.stage_calls.append(("sense", len(sensor_batch)))
+        return [{"readings": sensor_data} for sensor_data in sensor_batch]
+
+    async def validate_decisions(decisions, contexts=None, use_universal=None):
+        core.stage_calls.append(("ethics", len(decisions)))
+        return [
+            [{"is_compliant": not decision["context"].get("blocked", False)}]
+            for decision in decisions
+        ]
+
+    async def transmit_batch(data_items, contexts=None, connection_name=None):
+        core.stage_calls.append(("link", len(data_items)))
+        return True
+
+    core.stage_calls = []
+    core.vision_module.process_visual_input = process_visual_input
+    core.vision_module.process_visual_batch = process_visual_batch
+    core.sense_module.process_sensor_input = process_sensor_input
+    core.sense_module.process_sensor_batch = process_sensor_batch
+    core.ethics_module.validate_decision = validate_decision
+    core.ethics_module.validate_decisions = validate_decisions
+    core.link_module.transmit_output = transmit_output
+    core.link_module.transmit_batch = transmit_batch
+    core.is_initialized = True
+    return core
+
+
+class TestConcurrentStages:
+    """Vision and sense stages are scheduled concurrently"""
+
+    @pytest.mark.asyncio
+    async def test_vision_and_sense_overlap(self):
+        """Wall-clock time is close to one stage, not the sum of both"""
+        core = _make_core(stage_delay=0.1)
+
+        start = time.time()
+        result = await core.process_context(
+            {"visual": "frame_0", "sensor": {"temperature": 21.0}}
+        )
+        elapsed = time.time() - start
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert elapsed < 0.18
+
+    @pytest.mark.asyncio
+    async def test_stage_timings_reported(self):
+        """Per-stage timings are exposed in the result metadata"""
+        core = _make_core()
+
+        result = await core.process_context(
+            {"visual": "frame_0", "sensor": {"temperature": 21.0}}
+        )
+
+        timings = result.metadata["stage_timings_ms"]
+        assert set(timings) == {"vision", "sense", "ethics", "link"}
+        assert all(value >= 0 for value in timings.values())
+
+    @pytest.mark.asyncio
+    async def test_missing_input_skips_stage(self):
+        """A stage without input is not run and not timed"""
+        core = _make_core()
+
+        result = await core.process_context({"sensor": {"temperature": 21.0}})
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.data["visual"] == {}
+        assert "vision" not in result.metadata["stage_timings_ms"]
+
+
+class TestBatchProcessing:
+    """process_batch groups inputs into config.batch_size chunks"""
+
+    @pytest.mark.asyncio
+    async def test_batch_chunks_follow_batch_size(self):
+        """Each stage is called once per chunk with the whole chunk"""
+        core = _make_core(batch_size=4)
+        inputs = [{"sensor": {"temperature": 20.0 + i}} for i in range(10)]
+
+        results = await core.process_batch(inputs)
+
+        assert len(results) == 10
+        assert all(result.status == ProcessingStatus.COMPLETED for result in results)
+        assert [size for stage, size in core.stage_calls if stage == "sense"] == [4, 4, 2]
+        assert [size for stage, size in core.stage_calls if stage == "link"] == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_order_and_blocking(self):
+        """Blocked items keep their position and are not transmitted"""
+        core = _make_core(batch_size=8)
+        inputs = [{"sensor": {"temperature": float(i)}} for i in range(3)]
+        contexts = [{}, {"blocked": True}, {}]
+
+        results = await core.process_batch(inputs, contexts)
+
+        assert [result.status for result in results] == [
+            ProcessingStatus.COMPLETED,
+            ProcessingStatus.ETHICS_BLOCKED,
+            ProcessingStatus.COMPLETED,
+        ]
+        assert results[2].data["sensor"] == {"readings": {"temperature": 2.0}}
+        assert ("link", 2) in core.stage_calls
+
+    @pytest.mark.asyncio
+    async def test_batch_vision_called_once_per_chunk(self):
+        """Frames of a chunk go to the vision module in one call, failing individually"""
+        core = _make_core(batch_size=4)
+        inputs = [{"visual": None if i == 1 else f"frame_{i}"} for i in range(6)]
+
+        results = await core.process_batch(inputs)
+
+        assert [size for stage, size in core.stage_calls if stage == "vision"] == [4, 2]
+        assert results[1].status == ProcessingStatus.FAILED
+        assert results[0].data["visual"] == {"frame": "frame_0"}
+        assert all(result.status == ProcessingStatus.COMPLETED for i, result in enumerate(results) if i != 1)
+
+    @pytest.mark.asyncio
+    async def test_batch_malformed_sensor_fails_alone(self):
+        """A malformed sensor payload fails its own item, not the rest of the chunk"""
+        core = _make_core(batch_size=4)
+        del core.sense_module.process_sensor_batch
+        inputs = [{"sensor": {"temperature": 21.0}}, {"sensor": ["not", "a", "dict"]}, {"sensor": {"humidity": 40.0}}]
+
+        results = await core.process_batch(inputs)
+
+        assert [result.status for result in results] == [
+            ProcessingStatus.COMPLETED,
+            ProcessingStatus.FAILED,
+            ProcessingStatus.COMPLETED,
+        ]
+        assert results[2].metadata["sensor_processed"] is True
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_misaligned_contexts(self):
+        """contexts must line up with inputs"""
+        core = _make_core()
+
+        with pytest.raises(ValueError):
+            await core.process_batch([{"sensor": {}}], [{}, {}])
+
+
+async def _frames(count: int, interval: float = 0.0):
+    """Async source of sensor-only frames"""
+    for i in range(count):
+        if interval:
+            await asyncio.sleep(interval)
+        yield {"sensor": {"temperature": float(i)}}
+
+
+class TestStreamingPipeline:
+    """process_stream pipelines the stages with bounded queues"""
+
+    @pytest.mark.asyncio
+    async def test_stream_preserves_input_order(self):
+        """Results are yielded in input order"""
+        core = _make_core()
+
+        results = [result async for result in core.process_stream(_frames(10))]
+
+        assert [result.metadata["sequence"] for result in results] == list(range(10))
+        assert all(result.status == ProcessingStatus.COMPLETED for result in results)
+
+    @pytest.mark.asyncio
+    async def test_stream_overlaps_stages(self):
+        """Throughput follows the slowest stage, not the sum of stages"""
+        core = _make_core(stage_delay=0.02)
+        frames = [{"visual": f"frame_{i}", "sensor": {"temperature": 1.0}} for i in range(8)]
+
+        async def source():
+            for frame in frames:
+                yield frame
+
+        start = time.time()
+        results = [result async for result in core.process_stream(source())]
+        elapsed = time.time() - start
+
+        assert len(results) == 8
+        # Sequential processing would take 8 * (0.02 + 0.02) = 0.32s
+        assert elapsed < 0.28
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_policy_discards_frames(self):
+        """A full queue drops incoming frames under DROP_NEWEST"""
+        core = _make_core(stage_delay=0.02)
+        pipeline = StreamingPipeline(core, queue_size=1, policy=BackpressurePolicy.DROP_NEWEST)
+
+        async def source():
+            for i in range(20):
+                yield {"sensor": {"temperature": float(i)}}
+
+        results = [result async for result in pipeline.run(source())]
+        sequences = [result.metadata["sequence"] for result in results]
+
+        assert pipeline.frames_dropped > 0
+        assert len(results) + pipeline.frames_dropped == 20
+        assert sequences == sorted(sequences)
+
+    @pytest.mark.asyncio
+    async def test_stream_stats_reported_in_status(self):
+        """Frames dropped by process_stream are visible through get_status"""
+        core = _make_core(stage_delay=0.02, stream_queue_size=1, stream_backpressure=BackpressurePolicy.DROP_NEWEST)
+
+        async def source():
+            for i in range(20):
+                yield {"sensor": {"temperature": float(i)}}
+
+        results = [result async for result in core.process_stream(source())]
+        stats = core.get_status()["streaming"]
+
+        assert stats["streams"] == 1
+        assert stats["active_streams"] == 0
+        assert stats["frames_received"] == 20
+        assert stats["frames_emitted"] == len(results)
+        assert stats["frames_dropped"] == 20 - len(results) > 0
+
+
+def _stub_initializers(core: SEVECoreV3, delay: float = 0.0) -> None:
+    """Replace module initializers with stubs that record each call"""
+    core.init_calls = []
+    for name in SEVECoreV3.MODULE_NAMES:
+        module = getattr(core, f"{name}_module")
+        module.is_initialized = False
+
+        async def initialize(module=module, name=name):
+            core.init_calls.append(name)
+            await asyncio.sleep(delay)
+            module.is_initialized = True
+
+        module.initialize = initialize
+
+
+class TestModuleInitialization:
+    """Module initializers run concurrently, or lazily on first use"""
+
+    @pytest.mark.asyncio
+    async def test_modules_initialize_concurrently(self):
+        """Startup takes about one initializer, not the sum of all four"""
+        core = _make_core()
+        core.is_initialized = False
+        _stub_initializers(core, delay=0.1)
+
+        start = time.time()
+        await core.initialize()
+        elapsed = time.time() - start
+
+        assert sorted(core.init_calls) == sorted(SEVECoreV3.MODULE_NAMES)
+        assert elapsed < 0.3
+
+    @pytest.mark.asyncio
+    async def test_lazy_mode_skips_unused_modules(self):
+        """A sensor-only request never initializes the vision module"""
+        core = _make_core(lazy_initialization=True)
+        core.is_initialized = False
+        _stub_initializers(core)
+
+        await core.initialize()
+        assert core.init_calls == []
+
+        result = await core.process_context({"sensor": {"temperature": 21.0}})
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert "vision" not in core.init_calls
+        assert sorted(core.init_calls) == ["ethics", "link", "sense"]
+
+    @pytest.mark.asyncio
+    async def test_lazy_mode_initializes_once_under_concurrency(self):
+        """Concurrent first requests share a single module initialization"""
+        core = _make_core(lazy_initialization=True)
+        _stub_initializers(core, delay=0.05)
+
+        await asyncio.gather(*(
+            core.process_context({"sensor": {"temperature": float(i)}})
+            for i in range(5)
+        ))
+
+        assert core.init_calls.count("sense") == 1
+
+    def test_core_built_outside_event_loop(self):
+        """Module locks are created inside the loop that uses them, not when the core is built"""
+        core = _make_core(lazy_initialization=True)
+        _stub_initializers(core, delay=0.05)
+        assert core._module_locks == {}
+
+        async def first_requests():
+            return await asyncio.gather(*(
+                core.process_context({"sensor": {"temperature": float(i)}})
+                for i in range(3)
+            ))
+
+        results = asyncio.run(first_requests())
+
+        assert all(result.status == ProcessingStatus.COMPLETED for result in results)
+        assert core.init_calls.count("sense") == 1
@@ -0,0 +1,189 @@
+"""
+SEVE Framework - Deadline Tests
+Symbiotic Ethical Vision Engine
+
+Tests for deadline propagation and per-stage latency budgets.
+"""
+
+import asyncio
+import time
+import types
+
+import pytest
+
+from seve_framework.config import SEVEConfig
+from seve_framework.core import ProcessingStatus
+from seve_framework.deadline import Deadline
+from seve_framework.ethics import SEVEEthicsModule
+from seve_framework.planes import FramePlanes
+from seve_framework.vision import SEVEVisionModule
+
+from test_core_pipeline import _make_core
+
+
+class _SlowUniversalEngine:
+    """Universal engine stand-in that takes longer than any test budget"""
+
+    async def assess_universal_compliance(self, decision_data, context, domain=None):
+        await asyncio.sleep(1.0)
+        return {"assessments": []}
+
+
+class TestDeadline:
+    """Deadline arithmetic and context parsing"""
+
+    def test_from_context_accepts_epoch_seconds(self):
+        """A float deadline in the context becomes a Deadline"""
+        expires_at = time.time() + 5
+
+        deadline = Deadline.from_context({"deadline": expires_at})
+
+        assert deadline.expires_at == expires_at
+        assert Deadline.from_context({}) is None
+
+    def test_stage_budget_narrows_deadline(self):
+        """A stage never gets more time than its budget"""
+        deadline = Deadline(time.time() + 10)
+
+        stage_deadline = deadline.for_stage(20)
+
+        assert stage_deadline.remaining_ms() <= 20
+        assert stage_deadline.skipped is deadline.skipped
+
+    def test_unbounded_deadline_has_no_timeout(self):
+        """Budgets without a request deadline start from infinity"""
+        assert Deadline(float("inf")).timeout() is None
+
+
+class TestOptionalWorkSkipping:
+    """Expensive optional work is dropped once the budget is gone"""
+
+    @pytest.mark.asyncio
+    async def test_text_detection_skipped_after_deadline(self):
+        """Vision skips text detection when its deadline has passed"""
+        vision = SEVEVisionModule(SEVEConfig())
+        deadline = Deadline(time.time() - 1)
+
+        detections = await vision._detect_text_within(None, deadline)
+
+        assert detections == []
+        assert deadline.skipped == ["text_detection"]
+
+    @pytest.mark.asyncio
+    async def test_text_detection_stops_at_deadline_inline(self):
+        """Text detection running inline stops between areas and keeps what it found"""
+        vision = SEVEVisionModule(SEVEConfig())
+        calls = []
+
+        def detect_text(area):
+            calls.append(area)
+            time.sleep(0.02)
+            return [{"bbox": (0, 0, 60, 20), "confidence": 0.7}]
+
+        vision._frame_planes = lambda image: FramePlanes(types.SimpleNamespace(shape=(100, 100, 3)))
+        vision._detection_areas = lambda planes, regions: ["area"] * 10
+        vision._detect_text = detect_text
+        deadline = Deadline(time.time() + 0.05)
+
+        start = time.time()
+        detections = await vision._detect_text_within(None, deadline)
+
+        assert time.time() - start < 0.15
+        assert 0 < len(calls) < 10
+        assert len(detections) == len(calls)
+        assert deadline.skipped == ["text_detection"]
+
+    @pytest.mark.asyncio
+    async def test_universal_ethics_cancelled_at_deadline(self):
+        """GuardFlow rules still run when the Universal engine is cancelled"""
+        ethics = SEVEEthicsModule(SEVEConfig())
+        await ethics.initialize()
+        ethics.universal_ethics_engine = _SlowUniversalEngine()
+        deadline = Deadline(time.time() + 0.05)
+
+        start = time.time()
+        assessments = await ethics.validate_decision({}, {"deadline": deadline}, use_universal=True)
+
+        assert time.time() - start < 0.5
+        assert deadline.skipped == ["universal_ethics"]
+        assert len(assessments) == len(ethics.ethical_rules)
+
+    @pytest.mark.asyncio
+    async def test_batch_universal_ethics_cancelled_at_deadline(self):
+        """Batched validation cancels the Universal engine at each decision's deadline"""
+        ethics = SEVEEthicsModule(SEVEConfig())
+        await ethics.initialize()
+        ethics.universal_ethics_engine = _SlowUniversalEngine()
+        deadline = Deadline(time.time() + 0.05)
+
+        start = time.time()
+        assessments = await ethics.validate_decisions([{}], [{"deadline": deadline}], use_universal=True)
+
+        assert time.time() - start < 0.5
+        assert deadline.skipped == ["universal_ethics"]
+        assert len(assessments[0]) == len(ethics.ethical_rules)
+
+
+class TestCoreDeadlines:
+    """The core hands each stage its deadline and reports partial results"""
+
+    @pytest.mark.asyncio
+    async def test_stage_budget_reaches_stage_and_reports_partial(self):
+        """Work skipped by a stage turns the result into PARTIAL"""
+        core = _make_core(stage_budgets_ms={"vision": 10})
+
+        async def process_visual_input(visual_data, context=None):
+            deadline = Deadline.from_context(context)
+            await asyncio.sleep(0.02)
+            if deadline.expired():
+                deadline.skip("text_detection")
+            return {"frame": visual_data}
+
+        core.vision_module.process_visual_input = process_visual_input
+
+        result = await core.process_context({"visual": "frame_0"})
+
+        assert result.status == ProcessingStatus.PARTIAL
+        assert result.metadata["skipped"] == ["text_detection"]
+        assert result.metadata["deadline_exceeded"] is False
+
+    @pytest.mark.asyncio
+    async def test_batch_items_report_partial(self):
+        """Batched items get their own deadline and report skipped work like single requests"""
+        core = _make_core(stage_budgets_ms={"vision": 10})
+
+        async def process_visual_batch(frames, contexts=None, return_exceptions=False):
+            await asyncio.sleep(0.02)
+            for context in contexts:
+                deadline = Deadline.from_context(context)
+                if deadline.expired():
+                    deadline.skip("text_detection")
+            return [{"frame": frame} for frame in frames]
+
+        core.vision_module.process_visual_batch = process_visual_batch
+
+        results = await core.process_batch([{"visual": "frame_0"}, {"sensor": {"temperature": 1.0}}])
+
+        assert results[0].status == ProcessingStatus.PARTIAL
+        assert results[0].metadata["skipped"] == ["text_detection"]
+        assert results[0].metadata["deadline_exceeded"] is False
+        assert results[1].status == ProcessingStatus.COMPLETED
+        assert results[1].metadata["skipped"] == []
+
+    @pytest.mark.asyncio
+    async def test_no_deadline_keeps_context_untouched(self):
+        """Without deadlines or budgets stages get the caller's context"""
+        core = _make_core()
+        seen = []
+
+        async def process_sensor_input(sensor_data, context=None):
+            seen.append(context)
+            return {"readings": sensor_data}
+
+        core.sense_module.process_sensor_input = process_sensor_input
+
+        result = await core.process_context({"sensor": {"temperature": 1.0}}, {"zone": "a"})
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert "skipped" not in result.metadata
+        assert seen == [{"zone": "a"}]
@@ -0,0 +1,90 @@
+"""
+SEVE Framework - Stage Executor Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the thread/process execution layer used by the vision and
+sense stages.
+"""
+
+import pickle
+import threading
+
+import pytest
+
+from seve_framework.config import SEVEConfig
+from seve_framework.core import SEVECoreV3
+from seve_framework.executors import StageExecutor, ExecutorKind
+from seve_framework.sense import SEVESenseModule
+
+
+class TestStageExecutor:
+    """StageExecutor dispatches work according to config.stage_executors"""
+
+    @pytest.mark.asyncio
+    async def test_inline_runs_on_calling_thread(self):
+        """Inline stages never leave the event loop thread"""
+        executor = StageExecutor(SEVEConfig(stage_executors={"vision": "inline"}))
+
+        thread_name = await executor.run("vision", lambda: threading.current_thread().name)
+
+        assert thread_name == threading.current_thread().name
+        assert not executor.get_status()["thread_pool_active"]
+
+    @pytest.mark.asyncio
+    async def test_thread_stage_runs_off_loop(self):
+        """Thread stages run on the pool sized by max_workers"""
+        executor = StageExecutor(SEVEConfig(max_workers=2, stage_executors={"vision": "thread"}))
+
+        try:
+            thread_name = await executor.run("vision", lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+
+        assert thread_name.startswith("seve-stage")
+        assert executor.dispatch_counts["thread"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_stage_runs_in_worker(self):
+        """Process stages return results from the process pool"""
+        executor = StageExecutor(SEVEConfig(max_workers=1, stage_executors={"sense": "process"}))
+
+        try:
+            total = await executor.run("sense", sum, [1, 2, 3])
+        finally:
+            executor.shutdown()
+
+        assert total == 6
+
+    def test_unknown_stage_defaults_to_inline(self):
+        """Stages without configuration run inline, which is every stage by default"""
+        executor = StageExecutor(SEVEConfig())
+
+        assert executor.kind_for("ethics") == ExecutorKind.INLINE
+        assert executor.kind_for("vision") == ExecutorKind.INLINE
+        assert executor.kind_for("sense") == ExecutorKind.INLINE
+
+    def test_invalid_executor_kind_rejected(self):
+        """Config validation rejects unknown executor kinds"""
+        with pytest.raises(ValueError):
+            SEVEConfig(stage_executors={"vision": "gpu"})
+
+
+class TestExecutorWiring:
+    """SEVECoreV3 hands its executor to the CPU-bound modules"""
+
+    def test_core_shares_executor_with_modules(self):
+        """Vision and sense dispatch through the core's executor"""
+        core = SEVECoreV3(SEVEConfig())
+
+        assert core.vision_module.executor is core.executor
+        assert core.sense_module.executor is core.executor
+
+    def test_sense_module_pickles_without_executor(self):
+        """Fusion work can be shipped to worker processes"""
+        sense = SEVESenseModule(SEVEConfig())
+        sense.executor = StageExecutor(sense.config)
+
+        restored = pickle.loads(pickle.dumps(sense))
+
+        assert restored.executor is None
+        assert restored.quality_thresholds == sense.quality_thresholds
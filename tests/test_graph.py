@@ -0,0 +1,147 @@
+"""
+SEVE Framework - Stage Graph Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the declarative stage graph and the v3.0 pipeline built on
+it.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import SEVECoreV3, ProcessingStatus
+from seve_framework.graph import StageGraph
+
+
+def _delayed(output, delay=0.0, calls=None):
+    """Stage function returning output after a delay, recording its inputs"""
+    async def run(values):
+        if calls is not None:
+            calls.append(dict(values))
+        await asyncio.sleep(delay)
+        return output
+    return run
+
+
+class TestStageGraph:
+    """Stages run as soon as their inputs exist"""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self):
+        """Stages without dependencies between them run concurrently"""
+        graph = StageGraph()
+        graph.add_stage("a", _delayed(1, 0.1), inputs=("x",))
+        graph.add_stage("b", _delayed(2, 0.1), inputs=("x",))
+        graph.add_stage("total", lambda values: values["a"] + values["b"], inputs=("a", "b"))
+        timings = {}
+
+        start = time.time()
+        values = await graph.run({"x": 0}, timings)
+
+        assert values["total"] == 3
+        assert time.time() - start < 0.18
+        assert set(timings) == {"a", "b", "total"}
+
+    @pytest.mark.asyncio
+    async def test_missing_inputs_skip_dependents(self):
+        """A stage without its inputs is skipped along with everything needing its output"""
+        graph = StageGraph()
+        calls = []
+        graph.add_stage("vision", _delayed("v", calls=calls), inputs=("visual",))
+        graph.add_stage("report", _delayed("r", calls=calls), inputs=("vision",))
+        graph.add_stage("summary", _delayed("s", calls=calls), optional_inputs=("vision",))
+
+        values = await graph.run({})
+
+        assert "vision" not in values and "report" not in values
+        assert values["summary"] == "s"
+        assert calls == [{}]
+
+    @pytest.mark.asyncio
+    async def test_condition_and_failure(self):
+        """Conditions gate stages, and a failing stage fails the run"""
+        graph = StageGraph()
+        graph.add_stage("gate", _delayed("sent"), inputs=("ok",), condition=lambda values: values["ok"])
+
+        assert "gate" not in await graph.run({"ok": False})
+        assert (await graph.run({"ok": True}))["gate"] == "sent"
+
+        def fail(values):
+            raise RuntimeError("stage failed")
+
+        graph.add_stage("broken", fail, inputs=("ok",))
+        with pytest.raises(RuntimeError):
+            await graph.run({"ok": True})
+
+    def test_invalid_graphs_rejected(self):
+        """Duplicate outputs and cycles are rejected when stages are added"""
+        graph = StageGraph()
+        graph.add_stage("a", _delayed(1), inputs=("b",))
+
+        with pytest.raises(ValueError):
+            graph.add_stage("other", _delayed(1), output="a")
+        with pytest.raises(ValueError):
+            graph.add_stage("b", _delayed(1), inputs=("a",))
+        assert graph.order() == ["a"]
+
+
+class TestCoreStageGraph:
+    """The v3.0 pipeline runs on a stage graph users can extend"""
+
+    @pytest.mark.asyncio
+    async def test_custom_stage_plugs_in(self):
+        """A custom stage consumes built-in outputs and reports its own"""
+        core = SEVECoreV3(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC))
+        core.is_initialized = True
+
+        async def transmit_output(data, context=None, connection_name=None):
+            return True
+
+        core.link_module.transmit_output = transmit_output
+        core.stage_graph.add_stage(
+            "risk",
+            lambda values: {"readings": len(values["sense_results"].individual_readings)},
+            inputs=("sense_results",),
+            output="risk_score"
+        )
+
+        result = await core.process_context({"sensor": {"temperature": {"value": 21.0}}}, {})
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.metadata["stage_outputs"] == {"risk_score": {"readings": 1}}
+        assert "risk" in result.metadata["stage_timings_ms"]
+        assert "vision" not in result.metadata["stage_timings_ms"]
+        assert "risk" in [node["name"] for node in core.get_status()["stage_graph"]]
+
+    @pytest.mark.asyncio
+    async def test_custom_stage_runs_in_batch_and_stream(self):
+        """Batches and streams run custom stages as process_context does"""
+        core = SEVECoreV3(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC, batch_size=2))
+        core.is_initialized = True
+
+        async def transmit_output(data, context=None, connection_name=None):
+            return True
+
+        core.link_module.transmit_output = transmit_output
+        core.stage_graph.add_stage(
+            "risk",
+            lambda values: {"readings": len(values["sense_results"].individual_readings)},
+            inputs=("sense_results",),
+            output="risk_score"
+        )
+        inputs = [{"sensor": {"temperature": {"value": 21.0 + i}}} for i in range(3)]
+
+        async def source():
+            for input_data in inputs:
+                yield input_data
+
+        batch = await core.process_batch(inputs)
+        stream = [result async for result in core.process_stream(source())]
+
+        for result in batch + stream:
+            assert result.status == ProcessingStatus.COMPLETED
+            assert result.metadata["stage_outputs"] == {"risk_score": {"readings": 1}}
+        assert [result.metadata["sequence"] for result in stream] == [0, 1, 2]
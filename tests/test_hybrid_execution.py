@@ -0,0 +1,167 @@
+"""
+SEVE Framework - Hybrid Execution Tests
+Symbiotic Ethical Vision Engine
+
+Tests for running the Universal and v3.0 cores concurrently under the
+hybrid execution policies of SEVEHybridFramework.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode, HybridExecutionPolicy
+from seve_framework.core import SEVEHybridFramework, ProcessingResult, ProcessingStatus
+
+
+class _UniversalStub:
+    """Universal core that answers (or fails) after a fixed delay"""
+
+    def __init__(self, delay: float, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+
+    async def process_universal_context(self, universal_context, input_data):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("universal unavailable")
+        return {"core": "universal"}
+
+
+def _framework(policy, universal_delay, v3_delay, universal_fails=False, v3_status=ProcessingStatus.COMPLETED):
+    """Hybrid framework with both cores replaced by timed stubs"""
+    framework = SEVEHybridFramework(SEVEConfig(mode=SEVEMode.HYBRID, hybrid_execution_policy=policy))
+    framework.universal_core = _UniversalStub(universal_delay, universal_fails)
+
+    async def process_context(input_data, context=None):
+        await asyncio.sleep(v3_delay)
+        return ProcessingResult(status=v3_status, data={"core": "v3"}, metadata={"mode": "v3"})
+
+    framework.v3_core.process_context = process_context
+    framework.v3_core.evaluate = process_context
+    return framework
+
+
+async def _timed(framework):
+    """Process one request and return the result with its latency in seconds"""
+    start = time.perf_counter()
+    result = await framework.process_context({"sensor": {"temperature": 21.0}}, {})
+    return result, time.perf_counter() - start
+
+
+class TestHybridExecutionPolicies:
+    """Both cores run concurrently instead of one after the other"""
+
+    @pytest.mark.asyncio
+    async def test_fallback_runs_cores_sequentially(self):
+        """The default policy only starts v3.0 after Universal has failed"""
+        framework = _framework(HybridExecutionPolicy.FALLBACK, 0.05, 0.05, universal_fails=True)
+
+        result, elapsed = await _timed(framework)
+
+        assert result.data == {"core": "v3"}
+        assert elapsed >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_first_success_failure_costs_max_latency(self):
+        """When Universal fails the v3.0 result is already on its way"""
+        framework = _framework(HybridExecutionPolicy.FIRST_SUCCESS, 0.05, 0.06, universal_fails=True)
+
+        result, elapsed = await _timed(framework)
+
+        assert result.data == {"core": "v3"}
+        assert result.metadata["winner"] == "v3"
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_first_success_returns_fastest_core(self):
+        """The faster successful core answers and the slower one is cancelled"""
+        framework = _framework(HybridExecutionPolicy.FIRST_SUCCESS, 0.01, 0.2)
+
+        result, elapsed = await _timed(framework)
+
+        assert result.metadata["winner"] == "universal"
+        assert result.metadata["mode"] == "universal"
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_first_success_both_failed(self):
+        """A FAILED result carries the errors of both cores"""
+        framework = _framework(
+            HybridExecutionPolicy.FIRST_SUCCESS, 0.01, 0.01,
+            universal_fails=True, v3_status=ProcessingStatus.FAILED
+        )
+
+        result, _ = await _timed(framework)
+
+        assert result.status == ProcessingStatus.FAILED
+        assert any(error.startswith("universal:") for error in result.errors)
+
+    @pytest.mark.asyncio
+    async def test_merged_combines_both_cores(self):
+        """Merged results hold each core's data and keep the v3.0 status"""
+        framework = _framework(
+            HybridExecutionPolicy.MERGED, 0.05, 0.05, v3_status=ProcessingStatus.ETHICS_BLOCKED
+        )
+
+        result, elapsed = await _timed(framework)
+
+        assert result.status == ProcessingStatus.ETHICS_BLOCKED
+        assert result.data == {"universal": {"core": "universal"}, "v3": {"core": "v3"}}
+        assert result.metadata["merged_cores"] == ["universal", "v3"]
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_shadow_records_v3_run(self):
+        """Universal answers while the v3.0 shadow run only feeds metrics"""
+        framework = _framework(HybridExecutionPolicy.SHADOW, 0.01, 0.05)
+
+        result, elapsed = await _timed(framework)
+        assert result.metadata["mode"] == "universal"
+        assert elapsed < 0.05
+        assert framework.get_status()["hybrid_execution"]["shadow"]["in_flight"] == 1
+
+        await framework.shutdown()
+
+        shadow = framework.get_status()["hybrid_execution"]["shadow"]
+        assert shadow["runs"] == 1
+        assert shadow["failures"] == 0
+        assert shadow["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shadow_result_used_on_failure(self):
+        """A failing Universal core falls back to the running shadow"""
+        framework = _framework(HybridExecutionPolicy.SHADOW, 0.05, 0.06, universal_fails=True)
+
+        result, elapsed = await _timed(framework)
+
+        assert result.data == {"core": "v3"}
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_shadow_run_has_no_side_effects(self):
+        """The shadow v3.0 run transmits nothing and leaves no audit trail entry or count"""
+        framework = SEVEHybridFramework(SEVEConfig(
+            mode=SEVEMode.HYBRID, hybrid_execution_policy=HybridExecutionPolicy.SHADOW,
+            audit_logging_enabled=True
+        ))
+        framework.universal_core = _UniversalStub(0.0)
+        core = framework.v3_core
+        transmitted = []
+
+        async def transmit_output(data, context=None):
+            transmitted.append(data)
+            return True
+
+        core.link_module.transmit_output = transmit_output
+
+        result, _ = await _timed(framework)
+        await framework.shutdown()
+
+        assert result.metadata["mode"] == "universal"
+        assert framework.shadow_stats["runs"] == 1
+        assert framework.shadow_stats["failures"] == 0
+        assert transmitted == []
+        assert core.ethics_module.audit_trail == []
+        assert core.processing_count == 0
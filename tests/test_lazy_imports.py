@@ -0,0 +1,68 @@
+"""
+SEVE Framework - Lazy Import Tests
+Symbiotic Ethical Vision Engine
+
+Tests that importing the package stays cheap: public names resolve on
+first access and heavy dependencies load only when used.
+"""
+
+import sys
+
+import seve_framework
+from seve_framework.lazy import LazyModule, lazy_import
+
+from conftest import requires_opencv, run_fresh
+
+
+class TestLazyImport:
+    """lazy_import defers loading until an attribute is read"""
+
+    def test_missing_module_is_none(self):
+        """Modules that are not installed behave like a failed optional import"""
+        assert lazy_import("seve_no_such_module") is None
+
+    def test_imported_module_returned_directly(self):
+        """Modules already imported are returned as they are"""
+        assert lazy_import("json") is sys.modules["json"]
+
+    def test_module_loaded_on_first_attribute(self):
+        """The real module is imported when an attribute is first read"""
+        output = run_fresh(
+            "from seve_framework.lazy import lazy_import\n"
+            "mod = lazy_import('colorsys')\n"
+            "print('colorsys' in sys.modules, mod.rgb_to_hsv(1, 0, 0)[2], 'colorsys' in sys.modules)"
+        )
+        assert output == "False 1 True"
+        assert isinstance(LazyModule("colorsys").hls_to_rgb(0, 0, 0), tuple)
+
+
+class TestPackageImport:
+    """The package exposes its public API without eager imports"""
+
+    def test_import_does_not_load_pipeline(self):
+        """`import seve_framework` loads neither the pipeline modules nor their dependencies"""
+        output = run_fresh(
+            "import seve_framework\n"
+            "print(sorted(m for m in ('seve_framework.core', 'seve_framework.vision', 'numpy', 'cv2', 'httpx', 'yaml') if m in sys.modules))"
+        )
+        assert output == "[]"
+
+    def test_public_names_resolve(self):
+        """Every name in __all__ is available on first access"""
+        for name in seve_framework.__all__:
+            getattr(seve_framework, name)
+        assert seve_framework.SEVEHybridFramework.__name__ == "SEVEHybridFramework"
+        assert "SEVECoreV3" in dir(seve_framework)
+
+    @requires_opencv
+    def test_vision_without_pillow(self):
+        """Without Pillow installed, the vision module still accepts its other input types"""
+        output = run_fresh(
+            "sys.modules['PIL'] = None\n"
+            "import numpy as np\n"
+            "from seve_framework.config import SEVEConfig\n"
+            "from seve_framework import vision\n"
+            "image = vision.SEVEVisionModule(SEVEConfig())._prepare_image({'image_array': np.zeros((4, 6, 3), np.uint8)})\n"
+            "print(vision.Image, image.shape)"
+        )
+        assert output == "None (4, 6, 3)"
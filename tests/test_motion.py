@@ -0,0 +1,94 @@
+"""
+SEVE Framework - Motion Gating Tests
+Symbiotic Ethical Vision Engine
+
+Tests for restricting face and text detection to the regions of a
+frame that changed. NumPy and OpenCV are mocked for the rest of the
+suite, so the video test runs in a fresh interpreter with the real
+libraries.
+"""
+
+from seve_framework.motion import merge_boxes
+
+from conftest import requires_opencv, run_fresh
+
+
+class TestMergeBoxes:
+    """Changed regions are merged until none overlap"""
+
+    def test_overlapping_boxes_merge_transitively(self):
+        """A chain of overlapping boxes becomes one box; separate boxes stay apart"""
+        boxes = [(0, 0, 10, 10), (8, 8, 10, 10), (16, 16, 10, 10), (100, 100, 5, 5)]
+
+        assert sorted(merge_boxes(boxes)) == [(0, 0, 26, 26), (100, 100, 5, 5)]
+
+
+@requires_opencv
+class TestMotionGatedVideo:
+    """Detectors follow scene activity"""
+
+    def test_static_detections_reused(self, tmp_path):
+        """A static plate is detected once, and only the moving plate's region is searched again"""
+        output = run_fresh(
+            "import asyncio, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig, PrivacyLevel\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "path = sys.argv[1]\n"
+            "writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (640, 360))\n"
+            "background = np.random.default_rng(1).integers(60, 100, (360, 640, 3), dtype=np.uint8)\n"
+            "cv2.rectangle(background, (40, 260), (200, 300), (255, 255, 255), -1)\n"
+            "for n in range(10):\n"
+            "    frame = background.copy()\n"
+            "    cv2.rectangle(frame, (300 + n * 8, 60), (420 + n * 8, 100), (255, 255, 255), -1)\n"
+            "    writer.write(frame)\n"
+            "writer.release()\n"
+            "vision = SEVEVisionModule(SEVEConfig(privacy_level=PrivacyLevel.HIGH, video_dedup_threshold=0))\n"
+            "searched = []\n"
+            "detect = vision._detect_text\n"
+            "vision._detect_text = lambda planes: searched.append(planes.shape[0] * planes.shape[1]) or detect(planes)\n"
+            "async def run():\n"
+            "    return [r async for r in vision.process_video(path, motion_gating=True)]\n"
+            "results = asyncio.run(run())\n"
+            "texts = [sorted((d.bbox[0] < 250, d.metadata.get('reused', False), d.pseudonym)\n"
+            "          for d in r.detections if d.type.value == 'text') for r in results]\n"
+            "print(texts[0])\n"
+            "print(texts[9])\n"
+            "print(searched[0] == 640 * 360, max(searched[1:]) < 640 * 360 // 4)\n"
+            "print(all((r.anonymized_image[265:295, 45:195] == 0).all() for r in results))\n",
+            str(tmp_path / "street.avi")
+        )
+        lines = output.splitlines()
+        assert lines[0] == "[(False, False, 'TEXT_0002'), (True, False, 'TEXT_0001')]"
+        assert lines[1].startswith("[(False, False, 'TEXT_")
+        assert lines[1].endswith("(True, True, 'TEXT_0001')]")
+        assert lines[2:] == ["True True", "True"]
+
+    def test_gate_runs_on_vision_executor(self, tmp_path):
+        """Frame differencing runs on the configured vision executor's threads"""
+        output = run_fresh(
+            "import asyncio, threading, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig\n"
+            "from seve_framework.executors import StageExecutor\n"
+            "from seve_framework.motion import MotionGate\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "path = sys.argv[1]\n"
+            "writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (320, 240))\n"
+            "for n in range(4):\n"
+            "    writer.write(np.full((240, 320, 3), 40 * n, dtype=np.uint8))\n"
+            "writer.release()\n"
+            "vision = SEVEVisionModule(SEVEConfig(video_dedup_threshold=0))\n"
+            "vision.executor = StageExecutor(SEVEConfig(stage_executors={'vision': 'thread'}))\n"
+            "threads = set()\n"
+            "regions = MotionGate.regions\n"
+            "def recorded(self, planes):\n"
+            "    threads.add(threading.current_thread().name.split('_')[0])\n"
+            "    return regions(self, planes)\n"
+            "MotionGate.regions = recorded\n"
+            "async def run():\n"
+            "    return [r async for r in vision.process_video(path, motion_gating=True)]\n"
+            "results = asyncio.run(run())\n"
+            "vision.executor.shutdown()\n"
+            "print(len(results), threads)\n",
+            str(tmp_path / "fade.avi")
+        )
+        assert output == "4 {'seve-stage'}"
@@ -0,0 +1,129 @@
+"""
+SEVE Framework - Frame Planes Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the per-frame preprocessing cache shared by the vision
+detectors and for detection below full resolution. NumPy and OpenCV are mocked for the rest of the suite, so
+these run in fresh interpreters with the real libraries.
+"""
+
+from conftest import requires_opencv, run_fresh
+
+pytestmark = requires_opencv
+
+
+class TestFramePlanes:
+    """Derived planes are computed once per frame and shared"""
+
+    def test_planes_built_once_and_derived_from_gray(self):
+        """Every default plane reuses the single grayscale conversion"""
+        output = run_fresh(
+            "import numpy as np, cv2\n"
+            "from seve_framework.planes import FramePlanes, DEFAULT_PLANE_BUILDERS\n"
+            "conversions = []\n"
+            "def gray(planes):\n"
+            "    conversions.append(1)\n"
+            "    return DEFAULT_PLANE_BUILDERS['gray'](planes)\n"
+            "planes = FramePlanes(np.zeros((256, 320, 3), dtype=np.uint8), dict(DEFAULT_PLANE_BUILDERS, gray=gray))\n"
+            "print([level.shape for level in planes['pyramid']])\n"
+            "print(planes['edges'].shape, planes['integral'].shape, planes['edges'] is planes['edges'])\n"
+            "print(len(conversions), sorted(planes.computed()))\n"
+        )
+        assert output.splitlines() == [
+            "[(256, 320), (128, 160), (64, 80), (32, 40)]",
+            "(256, 320) (257, 321) True",
+            "1 ['edges', 'gray', 'integral', 'pyramid']",
+        ]
+
+    def test_detectors_share_planes_and_custom_planes(self):
+        """Face and text detection convert a frame once, and registered planes are available"""
+        output = run_fresh(
+            "import asyncio, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "from seve_framework.planes import DEFAULT_PLANE_BUILDERS\n"
+            "vision = SEVEVisionModule(SEVEConfig())\n"
+            "built = []\n"
+            "def gray(planes):\n"
+            "    built.append('gray')\n"
+            "    return DEFAULT_PLANE_BUILDERS['gray'](planes)\n"
+            "vision.register_plane('gray', gray)\n"
+            "vision.register_plane('bright', lambda planes: int((planes['gray'] > 200).sum()))\n"
+            "original = vision._detect_general_objects\n"
+            "def detect_general_objects(planes):\n"
+            "    built.append(planes['bright'] > 0)\n"
+            "    return original(planes)\n"
+            "vision._detect_general_objects = detect_general_objects\n"
+            "frame = np.zeros((120, 240, 3), dtype=np.uint8)\n"
+            "cv2.putText(frame, 'SEVE 42', (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)\n"
+            "result = asyncio.run(vision.process_visual_input(frame))\n"
+            "print(built, len(result.detections))\n"
+        )
+        assert output == "['gray', True] 2"
+
+
+class TestDetectionResolution:
+    """Detectors run on downscaled planes and report full-frame boxes"""
+
+    def test_low_resolution_boxes_match_full_resolution(self):
+        """Text found at 360 rows maps back onto the box found at full resolution"""
+        output = run_fresh(
+            "import asyncio, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig, PrivacyLevel\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "frame = np.full((1440, 2560, 3), 90, dtype=np.uint8)\n"
+            "cv2.rectangle(frame, (400, 400), (1400, 600), (255, 255, 255), -1)\n"
+            "def text_boxes(heights):\n"
+            "    vision = SEVEVisionModule(SEVEConfig(\n"
+            "        privacy_level=PrivacyLevel.HIGH, vision_detection_heights=heights\n"
+            "    ))\n"
+            "    result = asyncio.run(vision.process_visual_input(frame))\n"
+            "    return [d.bbox for d in result.detections if d.type.value == 'text'], result.anonymized_image\n"
+            "(full,), _ = text_boxes({'face': 0, 'text': 0})\n"
+            "(low,), anonymized = text_boxes({'face': 360, 'text': 360})\n"
+            "covers = low[0] <= full[0] and low[0] + low[2] >= full[0] + full[2]\n"
+            "print(all(abs(a - b) <= 8 for a, b in zip(full, low)), covers)\n"
+            "print(anonymized.shape, bool((anonymized[400:600, 400:1400] == 0).all()))\n"
+        )
+        assert output.splitlines() == ["True True", "(1440, 2560, 3) True"]
+
+    def test_adaptive_mode_escalates_only_on_candidates(self):
+        """An empty probe skips the higher-resolution pass"""
+        output = run_fresh(
+            "import asyncio, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "vision = SEVEVisionModule(SEVEConfig(vision_adaptive_resolution=True, vision_probe_height=180))\n"
+            "heights = []\n"
+            "find = vision._find_edge_regions\n"
+            "vision._find_edge_regions = lambda planes: heights.append(planes.shape[0]) or find(planes)\n"
+            "frame = np.full((1440, 2560, 3), 90, dtype=np.uint8)\n"
+            "asyncio.run(vision.process_visual_input(frame))\n"
+            "print(heights, vision.resolution_escalations)\n"
+            "cv2.rectangle(frame, (400, 400), (1400, 600), (255, 255, 255), -1)\n"
+            "heights.clear()\n"
+            "asyncio.run(vision.process_visual_input(frame))\n"
+            "print(heights, vision.resolution_escalations)\n"
+        )
+        assert output.splitlines() == ["[180] 0", "[180, 720] 1"]
+
+    def test_escalations_counted_across_process_executor(self):
+        """Escalations made in a worker process are counted by the module that offloaded them"""
+        output = run_fresh(
+            "import asyncio, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig\n"
+            "from seve_framework.executors import StageExecutor\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "config = SEVEConfig(\n"
+            "    vision_adaptive_resolution=True, vision_probe_height=180, stage_executors={'vision': 'process'}\n"
+            ")\n"
+            "vision = SEVEVisionModule(config)\n"
+            "vision.executor = StageExecutor(config)\n"
+            "frame = np.full((1440, 2560, 3), 90, dtype=np.uint8)\n"
+            "cv2.rectangle(frame, (400, 400), (1400, 600), (255, 255, 255), -1)\n"
+            "asyncio.run(vision.process_visual_input(frame))\n"
+            "asyncio.run(vision.process_visual_batch([frame, frame]))\n"
+            "vision.executor.shutdown()\n"
+            "print(vision.resolution_escalations)\n"
+        )
+        assert output == "3"
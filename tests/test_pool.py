@@ -0,0 +1,116 @@
+"""
+SEVE Framework - Framework Pool Tests
+Symbiotic Ethical Vision Engine
+
+Tests for reusing initialized framework instances across tenants with
+different configurations.
+"""
+
+import asyncio
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode, EthicsLevel, PrivacyLevel
+from seve_framework.link import SEVELinkModule
+from seve_framework.pool import FrameworkPool, config_key
+
+
+class _FakeFramework:
+    """Framework stand-in recording its lifecycle"""
+
+    built = 0
+
+    def __init__(self, config):
+        type(self).built += 1
+        self.config = config
+        self.initialized = False
+        self.shut_down = False
+
+    async def initialize(self):
+        await asyncio.sleep(0.01)
+        self.initialized = True
+
+    async def shutdown(self):
+        self.shut_down = True
+
+
+def _pool(**kwargs):
+    _FakeFramework.built = 0
+    return FrameworkPool(factory=_FakeFramework, **kwargs)
+
+
+class TestConfigKey:
+    """Equal configurations share a key"""
+
+    def test_equal_configs_share_key(self):
+        """Separately built configs with the same settings map to one key"""
+        assert config_key(SEVEConfig(ethics_level=EthicsLevel.STRICT)) == config_key(SEVEConfig(ethics_level=EthicsLevel.STRICT))
+        assert config_key(SEVEConfig(privacy_level=PrivacyLevel.MAXIMUM)) != config_key(SEVEConfig())
+
+
+class TestFrameworkPool:
+    """Instances are reused, bounded and closed on eviction"""
+
+    @pytest.mark.asyncio
+    async def test_instances_reused_per_config(self):
+        """Concurrent requests for a configuration build one initialized instance"""
+        pool = _pool()
+
+        frameworks = await asyncio.gather(*(pool.get(SEVEConfig()) for _ in range(3)))
+        again = await pool.get(SEVEConfig())
+        other = await pool.get(SEVEConfig(privacy_level=PrivacyLevel.MAXIMUM))
+
+        assert _FakeFramework.built == 2
+        assert all(framework is frameworks[0] for framework in frameworks + [again])
+        assert frameworks[0].initialized
+        assert other is not frameworks[0]
+        assert pool.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """The least recently used instance is shut down beyond max_size"""
+        pool = _pool(max_size=2)
+        a = await pool.get(SEVEConfig(privacy_level=PrivacyLevel.MINIMAL))
+        b = await pool.get(SEVEConfig(privacy_level=PrivacyLevel.STANDARD))
+        await pool.get(SEVEConfig(privacy_level=PrivacyLevel.MINIMAL))
+        await pool.get(SEVEConfig(privacy_level=PrivacyLevel.HIGH))
+
+        assert len(pool) == 2
+        assert b.shut_down and not a.shut_down
+        assert pool.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_timeout(self):
+        """Instances unused for longer than the idle timeout are evicted"""
+        pool = _pool(idle_timeout_seconds=0.02)
+        framework = await pool.get(SEVEConfig())
+        await asyncio.sleep(0.05)
+
+        assert await pool.evict_idle() == 1
+        assert framework.shut_down
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_leased_instance_closed_after_release(self):
+        """Evicting a leased instance defers its shutdown until the lease ends"""
+        pool = _pool()
+
+        async with pool.lease(SEVEConfig()) as framework:
+            assert await pool.evict(SEVEConfig())
+            assert not framework.shut_down
+
+        assert framework.shut_down
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_link_client(self):
+        """Closing the pool closes the link module HTTP client of real frameworks"""
+        pool = FrameworkPool()
+        framework = await pool.get(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC))
+        link = framework.v3_core.link_module
+        assert isinstance(link, SEVELinkModule)
+
+        await pool.close()
+
+        assert link.http_client is None
+        assert not link.is_initialized
+        assert len(pool) == 0
@@ -0,0 +1,156 @@
+"""
+SEVE Framework - Scheduler Tests
+Symbiotic Ethical Vision Engine
+
+Tests for priority classes, weighted fair queuing across tenants and
+priority propagation through the v3.0 pipeline.
+"""
+
+import asyncio
+
+import pytest
+
+from seve_framework.admission import RequestPriority
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import SEVECoreV3, ProcessingResult, ProcessingStatus
+from seve_framework.scheduler import PriorityScheduler, current_priority, infer_priority
+from seve_framework.sense import SEVESenseModule
+
+
+async def _grant_order(scheduler, requests):
+    """Queue requests behind an occupied scheduler and record the order they are granted"""
+    order = []
+
+    async def request(label, priority, tenant):
+        await scheduler.acquire(priority, tenant)
+        order.append(label)
+
+    await scheduler.acquire()
+    tasks = [asyncio.ensure_future(request(*item)) for item in requests]
+    await asyncio.sleep(0)
+
+    for _ in tasks:
+        scheduler.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestPriorityScheduler:
+    """Ordering by priority class, tenant weight and waiting time"""
+
+    @pytest.mark.asyncio
+    async def test_critical_overtakes_queued_work(self):
+        """Higher classes are served first, FIFO within a class"""
+        scheduler = PriorityScheduler(capacity=1)
+
+        order = await _grant_order(scheduler, [
+            ("bulk-1", RequestPriority.LOW, "analytics"),
+            ("frame", RequestPriority.NORMAL, "camera"),
+            ("bulk-2", RequestPriority.LOW, "analytics"),
+            ("hazard", RequestPriority.CRITICAL, "camera"),
+        ])
+
+        assert order == ["hazard", "frame", "bulk-1", "bulk-2"]
+
+    @pytest.mark.asyncio
+    async def test_tenants_share_fairly(self):
+        """A busy tenant cannot starve another tenant of the same class"""
+        scheduler = PriorityScheduler(capacity=1)
+
+        order = await _grant_order(
+            scheduler,
+            [(f"a{i}", RequestPriority.NORMAL, "a") for i in range(4)] +
+            [(f"b{i}", RequestPriority.NORMAL, "b") for i in range(2)]
+        )
+
+        assert order == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_tenant_weights(self):
+        """Tenants receive slots in proportion to their weight"""
+        scheduler = PriorityScheduler(capacity=1, tenant_weights={"a": 2.0})
+
+        order = await _grant_order(
+            scheduler,
+            [(f"a{i}", RequestPriority.NORMAL, "a") for i in range(4)] +
+            [(f"b{i}", RequestPriority.NORMAL, "b") for i in range(2)]
+        )
+
+        assert order[:3] == ["a0", "a1", "b0"]
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self):
+        """Long-waiting low-priority work is promoted ahead of fresh normal work"""
+        scheduler = PriorityScheduler(capacity=1, aging_ms=10.0)
+        await scheduler.acquire()
+
+        low = asyncio.ensure_future(scheduler.acquire(RequestPriority.LOW, "analytics"))
+        await asyncio.sleep(0.05)
+        normal = asyncio.ensure_future(scheduler.acquire(RequestPriority.NORMAL, "camera"))
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        await asyncio.sleep(0)
+
+        assert low.done() and not normal.done()
+        assert scheduler.promoted == 1
+        scheduler.release()
+        await normal
+
+
+class TestPriorityInference:
+    """Priorities come from the context, hazard flags and sensor anomalies"""
+
+    def test_explicit_priority_wins(self):
+        """An explicit priority is used as given"""
+        context = {"priority": "low", "hazard_detected": True, "severity": "critical"}
+        assert infer_priority({}, context) == RequestPriority.LOW
+
+    def test_hazard_flags(self):
+        """Critical hazards are CRITICAL, other hazards HIGH"""
+        assert infer_priority({}, {"hazard_detected": True, "severity": "critical"}) == RequestPriority.CRITICAL
+        assert infer_priority({"hazard_detected": True}, {}) == RequestPriority.HIGH
+        assert infer_priority({}, {}) == RequestPriority.NORMAL
+
+    def test_sensor_anomalies(self):
+        """Out-of-range sensor readings raise the priority"""
+        sense = SEVESenseModule(SEVEConfig())
+
+        assert infer_priority({"sensor": {"temperature": 150.0}}, {}, sense) == RequestPriority.HIGH
+        assert infer_priority({"sensor": {"temperature": 21.0}}, {}, sense) == RequestPriority.NORMAL
+
+
+class TestCoreScheduling:
+    """SEVECoreV3 schedules requests and publishes their priority"""
+
+    @pytest.mark.asyncio
+    async def test_priority_reaches_pipeline(self):
+        """Queued requests run in priority order with their priority visible to stages"""
+        core = SEVECoreV3(SEVEConfig(
+            mode=SEVEMode.VISION_SPECIFIC,
+            scheduling_enabled=True,
+            scheduler_max_concurrency=1
+        ))
+        core.is_initialized = True
+        seen = []
+
+        async def run_pipeline(input_data, context=None, record=True):
+            seen.append((input_data["name"], current_priority.get()))
+            await asyncio.sleep(0.01)
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data)
+
+        core._run_pipeline = run_pipeline
+
+        await asyncio.gather(
+            core.process_context({"name": "first"}, {}),
+            core.process_context({"name": "bulk"}, {"priority": "low"}),
+            core.process_context({"name": "hazard"}, {"hazard_detected": True, "severity": "critical"})
+        )
+
+        assert seen == [
+            ("first", RequestPriority.NORMAL),
+            ("hazard", RequestPriority.CRITICAL),
+            ("bulk", RequestPriority.LOW)
+        ]
+        assert core.get_status()["scheduler"]["granted"]["critical"] == 1
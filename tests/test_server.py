@@ -0,0 +1,233 @@
+"""
+SEVE Framework - Server Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the built-in HTTP serving mode and its micro-batching.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import SEVEHybridFramework, ProcessingResult, ProcessingStatus
+from seve_framework.server import SEVEServer, MicroBatcher
+
+
+def _make_framework(**config_overrides) -> SEVEHybridFramework:
+    """Hybrid framework whose batch processing is replaced by a recording stub"""
+    framework = SEVEHybridFramework(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC, **config_overrides))
+    framework.batch_sizes = []
+
+    async def initialize():
+        pass
+
+    async def warmup():
+        return None
+
+    async def process_batch(inputs, contexts=None, use_universal=None):
+        framework.batch_sizes.append(len(inputs))
+        await asyncio.sleep(0.01)
+        return [
+            ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data, metadata={"context": context})
+            for input_data, context in zip(inputs, contexts)
+        ]
+
+    framework.initialize = initialize
+    framework.warmup = warmup
+    framework.process_batch = process_batch
+    return framework
+
+
+async def _request(port: int, method: str, path: str, payload=None):
+    """Send one HTTP request and return (status, decoded JSON body)"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, content = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, json.loads(content) if content else None
+
+
+class TestMicroBatcher:
+    """Concurrent submissions are grouped into batches"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_batch(self):
+        """Requests arriving inside the window are processed together"""
+        framework = _make_framework()
+        batcher = MicroBatcher(framework, max_batch_size=8, max_wait_ms=20)
+        batcher.start()
+
+        results = await asyncio.gather(*(
+            batcher.submit({"sensor": {"temperature": float(i)}}) for i in range(5)
+        ))
+        await batcher.stop()
+
+        assert framework.batch_sizes == [5]
+        assert [result.data["sensor"]["temperature"] for result in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_caps_batches(self):
+        """A full batch is dispatched without waiting for the window"""
+        framework = _make_framework()
+        batcher = MicroBatcher(framework, max_batch_size=2, max_wait_ms=1000, max_concurrent_batches=4)
+        batcher.start()
+
+        await asyncio.wait_for(asyncio.gather(*(
+            batcher.submit({"sensor": {"temperature": float(i)}}) for i in range(4)
+        )), timeout=0.5)
+        await batcher.stop()
+
+        assert framework.batch_sizes == [2, 2]
+
+
+class TestUniversalBatch:
+    """Universal-mode batches from the micro-batcher"""
+
+    @pytest.mark.asyncio
+    async def test_items_processed_concurrently(self):
+        """A batch takes about as long as its slowest item, not the sum"""
+        framework = SEVEHybridFramework(SEVEConfig(mode=SEVEMode.UNIVERSAL))
+        framework.universal_core = framework.universal_core or object()
+
+        async def process_universal(input_data, context=None):
+            await asyncio.sleep(0.05)
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data, metadata={})
+
+        framework._process_universal = process_universal
+
+        start = asyncio.get_running_loop().time()
+        results = await framework.process_batch([{"n": n} for n in range(5)])
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [result.data["n"] for result in results] == [0, 1, 2, 3, 4]
+        assert elapsed < 0.15
+
+
+class TestSEVEServer:
+    """HTTP endpoints"""
+
+    @pytest.mark.asyncio
+    async def test_endpoints(self):
+        """/process, /health and /metrics respond with JSON"""
+        server = SEVEServer(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC), _make_framework())
+        await server.start(host="127.0.0.1", port=0)
+        port = server.address[1]
+
+        try:
+            status, health = await _request(port, "GET", "/health")
+            assert status == 200
+            assert health["status"] == "ok"
+
+            status, result = await _request(
+                port, "POST", "/process",
+                {"input": {"sensor": {"temperature": 21.0}}, "context": {"zone": "a"}}
+            )
+            assert status == 200
+            assert result["status"] == "completed"
+            assert result["metadata"]["context"] == {"zone": "a"}
+
+            status, metrics = await _request(port, "GET", "/metrics")
+            assert status == 200
+            assert metrics["batching"]["items_dispatched"] == 1
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_bad_requests(self):
+        """Unknown paths, wrong methods and invalid bodies are rejected"""
+        server = SEVEServer(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC), _make_framework())
+        await server.start(host="127.0.0.1", port=0)
+        port = server.address[1]
+
+        try:
+            assert (await _request(port, "GET", "/unknown"))[0] == 404
+            assert (await _request(port, "GET", "/process"))[0] == 405
+            assert (await _request(port, "POST", "/process", {"context": {}}))[0] == 400
+            assert (await _request(port, "POST", "/process", {"input": {}, "context": [1]}))[0] == 400
+            assert (await _request(port, "POST", "/process", {"input": {}, "context": {"deadline": "soon"}}))[0] == 400
+            assert (await _request(port, "POST", "/process", {"input": {"sensor": [21.0]}}))[0] == 400
+            assert (await _request(port, "POST", "/process", {"input": {"visual": [[0, 0, 0]]}}))[0] == 400
+            assert (await _request(port, "POST", "/process", {"input": {"visual": {"image_base64": "%%"}}}))[0] == 400
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"POST /process HTTP/1.1\r\nContent-Length: ten\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            assert response.split()[1] == b"400"
+        finally:
+            await server.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_use_cache_and_isolate_failures(self):
+        """Server requests hit the result cache, and a failing request leaves its batch neighbours intact"""
+        config = SEVEConfig(mode=SEVEMode.VISION_SPECIFIC, result_cache_enabled=True, api_batch_wait_ms=50, warmup_on_start=False)
+        framework = SEVEHybridFramework(config)
+
+        async def transmit_batch(data_items, contexts=None, connection_name=None):
+            return True
+
+        async def process_visual_batch(frames, contexts=None, return_exceptions=False):
+            return [ValueError(f"Could not load image from path: {frame}") for frame in frames]
+
+        framework.v3_core.link_module.transmit_batch = transmit_batch
+        framework.v3_core.vision_module.process_visual_batch = process_visual_batch
+        server = SEVEServer(config, framework)
+        await server.start(host="127.0.0.1", port=0)
+        port = server.address[1]
+
+        try:
+            first = await _request(port, "POST", "/process", {"input": {"sensor": {"temperature": 21.0}}})
+            responses = await asyncio.gather(
+                _request(port, "POST", "/process", {"input": {"sensor": {"temperature": 21.0}}}),
+                _request(port, "POST", "/process", {"input": {"visual": "/missing/frame.png"}}),
+                _request(port, "POST", "/process", {"input": {"sensor": {"humidity": 40.0}}})
+            )
+        finally:
+            await server.close()
+
+        assert first[1]["status"] == "completed"
+        assert [result["status"] for _, result in responses] == ["completed", "failed", "completed"]
+        assert responses[0][1]["metadata"]["cache_hit"] is True
+        assert framework.v3_core.result_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_universal_request_admitted_once(self):
+        """A Universal-mode request holds one admission slot, so a limit of one does not deadlock"""
+        config = SEVEConfig(mode=SEVEMode.UNIVERSAL, admission_control_enabled=True, admission_max_concurrency=1)
+        framework = SEVEHybridFramework(config)
+        framework.universal_core = framework.universal_core or object()
+
+        async def noop():
+            return None
+
+        async def process_universal(input_data, context=None):
+            return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data, metadata={})
+
+        framework.initialize = noop
+        framework.warmup = noop
+        framework._process_universal = process_universal
+
+        server = SEVEServer(config, framework)
+        await server.start(host="127.0.0.1", port=0)
+        port = server.address[1]
+
+        try:
+            status, result = await asyncio.wait_for(
+                _request(port, "POST", "/process", {"input": {"sensor": {"temperature": 21.0}}}), timeout=5
+            )
+            assert status == 200
+            assert result["status"] == "completed"
+            assert framework.admission.admitted == 1
+        finally:
+            await server.close()
@@ -0,0 +1,54 @@
+"""
+SEVE Framework - Shared Frame Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the shared-memory frame ring. NumPy is mocked for the rest
+of the suite, so these run in fresh interpreters with the real
+libraries.
+"""
+
+from conftest import requires_opencv, run_fresh
+
+pytestmark = requires_opencv
+
+
+class TestSharedFrameRing:
+    """Frames are written once and referenced by small handles"""
+
+    def test_handles_map_frames_without_copying(self):
+        """get() returns a view of the slot, and reused slots are detected"""
+        output = run_fresh(
+            "import numpy as np, pickle\n"
+            "from seve_framework.shared_frames import SharedFrameRing, StaleFrameError\n"
+            "with SharedFrameRing(slots=2, max_frame_bytes=1080 * 1920 * 3) as ring:\n"
+            "    handle = ring.put(np.full((1080, 1920, 3), 5, dtype=np.uint8))\n"
+            "    frame = ring.get(handle)\n"
+            "    ring.get(handle)[0, 0] = 9\n"
+            "    print(frame[0, 0, 0], frame.flags.owndata, len(pickle.dumps(handle)) < 256)\n"
+            "    ring.put(frame); ring.put(frame)\n"
+            "    try:\n"
+            "        ring.get(handle)\n"
+            "    except StaleFrameError:\n"
+            "        print('stale')\n"
+            "    del frame\n"
+        )
+        assert output.splitlines() == ["9 False True", "stale"]
+
+    def test_worker_process_maps_frame(self):
+        """A spawned worker resolves the handle and writes into the same memory"""
+        output = run_fresh(
+            "import multiprocessing, numpy as np\n"
+            "from concurrent.futures import ProcessPoolExecutor\n"
+            "from seve_framework.shared_frames import SharedFrameRing\n"
+            "from seve_framework.vision import SEVEVisionModule, Detection, DetectionType\n"
+            "from seve_framework.config import SEVEConfig, PrivacyLevel\n"
+            "if __name__ == '__main__':\n"
+            "    vision = SEVEVisionModule(SEVEConfig(privacy_level=PrivacyLevel.HIGH))\n"
+            "    face = Detection(DetectionType.FACE, 0.9, (0, 0, 4, 4))\n"
+            "    with SharedFrameRing(slots=1, max_frame_bytes=64 * 64 * 3) as ring:\n"
+            "        handle = ring.put(np.full((64, 64, 3), 200, dtype=np.uint8))\n"
+            "        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as pool:\n"
+            "            result = pool.submit(vision._anonymize_image, handle, [face]).result()\n"
+            "        print(result == handle, int(ring.get(handle)[:4, :4].sum()), int(ring.get(handle)[4, 4, 0]))\n"
+        )
+        assert output == "True 0 200"
@@ -0,0 +1,96 @@
+"""
+SEVE Framework - Sync Facade Tests
+Symbiotic Ethical Vision Engine
+
+Tests for the blocking SyncSEVEFramework wrapper and its background
+event loop.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import ProcessingResult, ProcessingStatus
+from seve_framework.sync import SyncSEVEFramework
+
+
+class _LoopRecordingFramework:
+    """Framework stand-in recording the loop and thread each call runs on"""
+
+    def __init__(self):
+        self.loops = set()
+        self.threads = set()
+        self.shut_down = False
+
+    def _record(self):
+        self.loops.add(asyncio.get_running_loop())
+        self.threads.add(threading.current_thread().name)
+
+    async def initialize(self):
+        self._record()
+
+    async def process_context(self, input_data, context=None, use_universal=None):
+        self._record()
+        await asyncio.sleep(0.01)
+        return ProcessingResult(status=ProcessingStatus.COMPLETED, data=input_data)
+
+    async def process_batch(self, inputs, contexts=None, use_universal=None):
+        return [await self.process_context(item) for item in inputs]
+
+    async def shutdown(self):
+        self.shut_down = True
+
+    def get_status(self):
+        return {"initialized": True}
+
+
+class TestSyncFacade:
+    """Blocking calls reuse one background loop"""
+
+    def test_calls_share_one_loop(self):
+        """Every call runs on the same long-lived loop thread"""
+        framework = _LoopRecordingFramework()
+
+        with SyncSEVEFramework(SEVEConfig(), framework=framework) as sync:
+            first = sync.process({"n": 1})
+            batch = sync.process_batch([{"n": 2}, {"n": 3}])
+            assert sync.get_status()["sync_loop_running"]
+
+        assert first.data == {"n": 1}
+        assert [result.data for result in batch] == [{"n": 2}, {"n": 3}]
+        assert len(framework.loops) == 1
+        assert framework.threads == {"seve-sync-loop"}
+        assert framework.shut_down
+
+    def test_concurrent_caller_threads(self):
+        """Several threads can submit work at the same time"""
+        framework = _LoopRecordingFramework()
+
+        with SyncSEVEFramework(SEVEConfig(), framework=framework) as sync:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda n: sync.process({"n": n}), range(32)))
+
+        assert [result.data["n"] for result in results] == list(range(32))
+        assert len(framework.loops) == 1
+
+    def test_timeout_and_closed(self):
+        """Slow calls time out, and a closed facade rejects new work"""
+        framework = _LoopRecordingFramework()
+        sync = SyncSEVEFramework(SEVEConfig(), framework=framework)
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            sync.call(asyncio.sleep, 1.0, timeout=0.01)
+        sync.close()
+
+        with pytest.raises(RuntimeError):
+            sync.process({"n": 1})
+
+    def test_real_framework(self):
+        """The facade builds and drives a real framework"""
+        with SyncSEVEFramework(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC)) as sync:
+            result = sync.process({"sensor": {"temperature": 21.0}}, {})
+
+        assert result.status in (ProcessingStatus.COMPLETED, ProcessingStatus.ETHICS_BLOCKED)
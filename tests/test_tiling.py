@@ -0,0 +1,89 @@
+"""
+SEVE Framework - Tiled Detection Tests
+Symbiotic Ethical Vision Engine
+
+Tests for splitting very large frames into overlapping tiles that are
+detected in parallel and merged across seams. NumPy and OpenCV are
+mocked for the rest of the suite, so the detection test runs in a
+fresh interpreter with the real libraries.
+"""
+
+import pytest
+
+from seve_framework.config import SEVEConfig
+from seve_framework.tiling import enclosing_box, non_max_suppression, tile_boxes
+
+from conftest import requires_opencv, run_fresh
+
+
+class TestTileBoxes:
+    """Tiles cover the frame and overlap by at least the configured amount"""
+
+    def test_tiles_cover_frame_with_overlap(self):
+        """Border tiles move inwards instead of shrinking"""
+        tiles = tile_boxes(2500, 900, 1024, 128)
+
+        assert tiles == [(0, 0, 1024, 900), (896, 0, 1024, 900), (1476, 0, 1024, 900)]
+
+    def test_small_area_is_one_tile(self):
+        """An area no larger than a tile is not split"""
+        assert tile_boxes(640, 480, 1024, 128) == [(0, 0, 640, 480)]
+
+    def test_overlap_must_be_smaller_than_tile(self):
+        """Tiles that would not advance are rejected, in the config as well"""
+        with pytest.raises(ValueError):
+            tile_boxes(4000, 4000, 256, 256)
+        with pytest.raises(ValueError):
+            SEVEConfig(tile_size=256, tile_overlap=256)
+
+
+class TestNonMaxSuppression:
+    """Duplicates from neighbouring tiles collapse into one detection"""
+
+    def test_fragment_inside_whole_object_is_suppressed(self):
+        """A box cut at a tile border is suppressed by the whole box; separate boxes are kept"""
+        boxes = [(100, 100, 40, 60), (100, 100, 200, 60), (500, 500, 50, 50)]
+        scores = [0.7, 0.7, 0.7]
+
+        assert non_max_suppression(boxes, scores, 0.5) == {1: [0], 2: []}
+
+    def test_higher_score_wins(self):
+        """Among overlapping boxes the most confident one is kept"""
+        boxes = [(0, 0, 100, 100), (10, 10, 100, 100)]
+
+        assert list(non_max_suppression(boxes, [0.6, 0.9], 0.5)) == [1]
+        assert enclosing_box(boxes) == (0, 0, 110, 110)
+
+
+@requires_opencv
+class TestTiledDetection:
+    """Tiled detection finds what whole-frame detection finds"""
+
+    def test_labels_across_seams_detected_once(self):
+        """Labels cut by tile borders are detected once, with their whole box, on the tile threads"""
+        output = run_fresh(
+            "import threading, numpy as np, cv2\n"
+            "from seve_framework.config import SEVEConfig, PrivacyLevel\n"
+            "from seve_framework.vision import SEVEVisionModule\n"
+            "image = np.full((1200, 1600, 3), 90, np.uint8)\n"
+            "for x, y in [(100, 100), (400, 700), (900, 300), (1300, 900), (1000, 1000)]:\n"
+            "    cv2.rectangle(image, (x, y), (x + 220, y + 50), (255, 255, 255), -1)\n"
+            "def texts(tiling):\n"
+            "    vision = SEVEVisionModule(SEVEConfig(\n"
+            "        privacy_level=PrivacyLevel.HIGH, vision_detection_heights={'face': 0, 'text': 0},\n"
+            "        tiling_enabled=tiling, tile_size=512, tile_overlap=64, tile_workers=3\n"
+            "    ))\n"
+            "    threads = set()\n"
+            "    detect = vision._detect_text\n"
+            "    vision._detect_text = lambda planes: threads.add(threading.current_thread().name) or detect(planes)\n"
+            "    boxes = sorted(d.bbox for d in vision._detect_objects(image) if d.type.value == 'text')\n"
+            "    vision.close()\n"
+            "    return boxes, threads\n"
+            "whole, whole_threads = texts(False)\n"
+            "tiled, tile_threads = texts(True)\n"
+            "print(len(whole), tiled == whole)\n"
+            "print(whole_threads == {'MainThread'}, all(n.startswith('seve-vision-tile') for n in tile_threads))\n"
+        )
+        lines = output.splitlines()
+        assert lines[0] == "5 True"
+        assert lines[1] == "True True"
@@ -0,0 +1,82 @@
+"""
+SEVE Framework - Video Ingestion Tests
+Symbiotic Ethical Vision Engine
+
+Tests for decoding, sampling and deduplicating video frames in
+SEVEVisionModule.process_video. NumPy and OpenCV are mocked for the
+rest of the suite, so these run in fresh interpreters with the real
+libraries against a small generated video file.
+"""
+
+from conftest import requires_opencv, run_fresh
+
+pytestmark = requires_opencv
+
+# 30 frames at 10 fps: ten identical frames, then a moving rectangle
+_SETUP = (
+    "import asyncio, numpy as np, cv2\n"
+    "from seve_framework.config import SEVEConfig\n"
+    "from seve_framework.vision import SEVEVisionModule\n"
+    "from seve_framework.video import VideoReader\n"
+    "path = sys.argv[1]\n"
+    "writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (320, 240))\n"
+    "for n in range(30):\n"
+    "    frame = np.full((240, 320, 3), 80, dtype=np.uint8)\n"
+    "    if n >= 10:\n"
+    "        cv2.rectangle(frame, (n * 8, 40), (n * 8 + 40, 120), (255, 255, 255), -1)\n"
+    "    writer.write(frame)\n"
+    "writer.release()\n"
+    "vision = SEVEVisionModule(SEVEConfig())\n"
+    "async def indices(source, **options):\n"
+    "    return [result.metadata['frame_index'] async for result in vision.process_video(source, **options)]\n"
+)
+
+
+class TestProcessVideo:
+    """Frames are sampled and deduplicated before detection"""
+
+    def test_stride_and_time_sampling(self, tmp_path):
+        """Stride keeps every Nth frame, and the interval spaces frames in video time"""
+        output = run_fresh(
+            _SETUP +
+            "print(asyncio.run(indices(path, stride=3, dedup_threshold=0)))\n"
+            "print(asyncio.run(indices(path, sample_interval_s=0.5, dedup_threshold=0)))\n",
+            tmp_path / "clip.avi"
+        )
+        assert output.splitlines() == [
+            "[0, 3, 6, 9, 12, 15, 18, 21, 24, 27]",
+            "[0, 5, 10, 15, 20, 25]",
+        ]
+
+    def test_duplicates_skipped_before_detection(self, tmp_path):
+        """Static frames never reach the detectors"""
+        output = run_fresh(
+            _SETUP +
+            "calls = []\n"
+            "detect = vision._detect_objects\n"
+            "vision._detect_objects = lambda *args: calls.append(1) or detect(*args)\n"
+            "reader = VideoReader(path, dedup_threshold=2.0)\n"
+            "processed = asyncio.run(indices(reader))\n"
+            "print(processed[:3], len(processed), len(calls), reader.get_stats()['duplicates_skipped'])\n",
+            tmp_path / "clip.avi"
+        )
+        assert output == "[0, 10, 11] 21 21 9"
+
+    def test_early_stop_and_missing_source(self, tmp_path):
+        """Closing the results stops the decoder, and unreadable sources raise"""
+        output = run_fresh(
+            _SETUP +
+            "async def main():\n"
+            "    reader = VideoReader(path, queue_size=1)\n"
+            "    results = vision.process_video(reader)\n"
+            "    await results.__anext__()\n"
+            "    await results.aclose()\n"
+            "    print(reader._thread.is_alive(), reader.get_stats()['frames_read'] < 30)\n"
+            "    try:\n"
+            "        await indices(path + '.missing')\n"
+            "    except ValueError:\n"
+            "        print('raised')\n"
+            "asyncio.run(main())\n",
+            tmp_path / "clip.avi"
+        )
+        assert output.splitlines() == ["False True", "raised"]
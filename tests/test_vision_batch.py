@@ -0,0 +1,67 @@
+"""
+SEVE Framework - Batched Vision Tests
+Symbiotic Ethical Vision Engine
+
+Tests for processing several frames in one process_visual_batch call.
+NumPy and OpenCV are mocked for the rest of the suite, so these run in
+fresh interpreters with the real libraries.
+"""
+
+from conftest import requires_opencv, run_fresh
+
+pytestmark = requires_opencv
+
+_SETUP = (
+    "import asyncio, numpy as np, cv2\n"
+    "from seve_framework.config import SEVEConfig\n"
+    "from seve_framework.executors import StageExecutor\n"
+    "from seve_framework.vision import SEVEVisionModule\n"
+    "config = SEVEConfig(stage_executors={'vision': 'thread'}, max_workers=3)\n"
+    "vision = SEVEVisionModule(config)\n"
+    "vision.executor = StageExecutor(config)\n"
+    "frames = np.zeros((8, 120, 200, 3), dtype=np.uint8)\n"
+    "for n, frame in enumerate(frames):\n"
+    "    cv2.putText(frame, 'PLATE %d' % n, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)\n"
+)
+
+
+class TestVisualBatch:
+    """A batch matches per-frame processing at a fraction of the dispatches"""
+
+    def test_batch_matches_single_frames(self):
+        """Stacked frames give the same detections and anonymized images"""
+        output = run_fresh(
+            _SETUP +
+            "async def main():\n"
+            "    batch = await vision.process_visual_batch(frames)\n"
+            "    dispatches = vision.executor.dispatch_counts['thread']\n"
+            "    single = [await vision.process_visual_input(frame) for frame in frames]\n"
+            "    same = all(\n"
+            "        [d.bbox for d in b.detections] == [d.bbox for d in s.detections]\n"
+            "        and np.array_equal(b.anonymized_image, s.anonymized_image)\n"
+            "        for b, s in zip(batch, single)\n"
+            "    )\n"
+            "    print(len(batch), same, dispatches)\n"
+            "    print(all(d.anonymized for r in batch for d in r.detections if d.type.value == 'text'))\n"
+            "asyncio.run(main())\n"
+            "vision.executor.shutdown()\n"
+        )
+        assert output.splitlines() == ["8 True 3", "True"]
+
+    def test_failing_frame_reported_in_place(self):
+        """One unreadable frame fails alone with return_exceptions, and raises otherwise"""
+        output = run_fresh(
+            _SETUP +
+            "async def main():\n"
+            "    results = await vision.process_visual_batch(\n"
+            "        [frames[0], '/nonexistent/frame.png', frames[1]], return_exceptions=True\n"
+            "    )\n"
+            "    print([type(result).__name__ for result in results])\n"
+            "    try:\n"
+            "        await vision.process_visual_batch(['/nonexistent/frame.png'])\n"
+            "    except ValueError:\n"
+            "        print('raised')\n"
+            "asyncio.run(main())\n"
+            "vision.executor.shutdown()\n"
+        )
+        assert output.splitlines() == ["['VisionResult', 'ValueError', 'VisionResult']", "raised"]
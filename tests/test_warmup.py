@@ -0,0 +1,85 @@
+"""
+SEVE Framework - Warm-up Tests
+Symbiotic Ethical Vision Engine
+
+Tests for warming up the v3.0 stages before traffic and the readiness
+flag reported once warmed.
+"""
+
+import asyncio
+
+import pytest
+
+from seve_framework.config import SEVEConfig, SEVEMode
+from seve_framework.core import SEVECoreV3, SEVEHybridFramework
+
+
+def _core(stage_delays, **config_overrides):
+    """Core whose vision and sense stages take the given delays per round"""
+    core = SEVECoreV3(SEVEConfig(
+        mode=SEVEMode.VISION_SPECIFIC,
+        stage_executors={},
+        **config_overrides
+    ))
+    core.rounds = 0
+    delays = iter(stage_delays)
+
+    async def process_visual_input(visual_data, context=None):
+        core.rounds += 1
+        await asyncio.sleep(next(delays))
+        return {"detections": []}
+
+    core.vision_module.process_visual_input = process_visual_input
+    core._warmup_input = lambda: {"visual": object(), "sensor": {"temperature": {"value": 21.0}}}
+    return core
+
+
+class TestWarmup:
+    """Warm-up runs every stage until latency settles"""
+
+    @pytest.mark.asyncio
+    async def test_repeats_until_settled(self):
+        """Rounds stop once the stage latency stops changing"""
+        core = _core([0.06, 0.02, 0.02, 0.02, 0.02], warmup_settle_tolerance=0.5)
+        assert not core.is_ready
+
+        report = await core.warmup()
+
+        assert report["settled"]
+        assert report["rounds"] == 3
+        assert set(report["stage_timings_ms"][0]) == {"vision", "sense", "ethics"}
+        assert core.is_ready
+        assert core.get_status()["ready"]
+
+    @pytest.mark.asyncio
+    async def test_max_rounds(self):
+        """Warm-up gives up after max_rounds even when latency keeps moving"""
+        core = _core([0.01, 0.05, 0.01, 0.05])
+
+        report = await core.warmup(max_rounds=2)
+
+        assert report["rounds"] == 2
+        assert not report["settled"]
+        assert core.is_ready
+
+    @pytest.mark.asyncio
+    async def test_initializes_modules_without_side_effects(self):
+        """Lazily initialized modules are set up, and nothing reaches the audit trail"""
+        core = _core([0.0] * 5, lazy_initialization=True)
+
+        await core.warmup()
+
+        assert all(getattr(core, f"{name}_module").is_initialized for name in core.MODULE_NAMES)
+        assert core.ethics_module.audit_trail == []
+        assert core.processing_count == 0
+
+    @pytest.mark.asyncio
+    async def test_hybrid_ready(self):
+        """The hybrid framework reports ready once its v3.0 core is warmed"""
+        framework = SEVEHybridFramework(SEVEConfig(mode=SEVEMode.VISION_SPECIFIC))
+        framework.v3_core = _core([0.0] * 5)
+
+        assert not framework.ready
+        await framework.warmup()
+        assert framework.ready
+        assert framework.get_status()["framework"]["ready"]